@@ -0,0 +1,710 @@
+"""
+Simulaciones por lotes en varios núcleos
+
+Una simulación (`SimulationJob`) juega muchas partidas sin interfaz entre la
+estrategia de un usuario simulado y la de la computadora. Las partidas se
+dividen en bloques de `chunk_size`; cada bloque tiene su propio generador
+aleatorio, derivado de la semilla y del índice del bloque, y sus propias
+estrategias, así que los bloques no comparten estado mutable y el resultado
+no depende de cuántos hilos o procesos los jueguen ni en qué orden.
+
+`SimulationExecutor` reparte los bloques:
+
+- ``threads``: un `ThreadPoolExecutor` en este proceso. En CPython sin GIL
+  (3.13+ con free-threading) escala con los núcleos sin serializar nada y con
+  una sola copia de las tablas de sólo lectura (reglas, tablas de
+  probabilidades).
+- ``processes``: un `ProcessPoolExecutor`, para los intérpretes con GIL. Los
+  trabajadores no devuelven objetos serializados: escriben los agregados de
+  cada bloque en una ranura de un bloque de `multiprocessing.shared_memory`
+  (una ranura por tarea en vuelo) y el proceso principal los lee de ahí.
+- ``auto`` (por defecto): hilos si el GIL está desactivado, procesos si no.
+
+`SimulationExecutor.run` sólo reúne los agregados de cada bloque y puede
+guardar puntos de control (`SimulationCheckpoint`) para reanudar una
+simulación interrumpida.
+`SimulationExecutor.run_shared` guarda además el resultado de cada partida en
+un bloque de memoria compartida (`shared_results`, requiere numpy) en el que
+escriben directamente los trabajadores. Ambos reparten los bloques con una
+ventana acotada de tareas en vuelo.
+"""
+
+import base64
+import itertools
+import json
+import os
+import random
+import sys
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple,
+)
+
+from .game import GameEngine, MatchResult
+from .simulation import DEFAULT_MAX_ROUNDS, play_match
+from .strategies import CHOICES, DEFAULT_STRATEGY, ComputerStrategy, create_strategy
+
+if TYPE_CHECKING:
+    from .shared_results import SharedResults
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_CHECKPOINT_EVERY = 100
+BACKENDS = ("auto", "threads", "processes")
+
+# Bloques en vuelo por trabajador
+_WINDOW_PER_WORKER = 4
+
+PAIRS = len(CHOICES) * len(CHOICES)
+
+# Enteros de 64 bits por ranura de agregados: partidas, victorias de cada
+# jugador, rondas y rondas por pareja
+_SLOT_FIELDS = 4 + PAIRS
+
+
+class SimulationJob(NamedTuple):
+    """Descripción de una simulación por lotes."""
+
+    matches: int
+    """Partidas a jugar"""
+
+    user_strategy: str = DEFAULT_STRATEGY
+    """Estrategia del usuario simulado"""
+
+    computer_strategy: str = DEFAULT_STRATEGY
+    """Estrategia de la computadora"""
+
+    max_score: int = 3
+    """Puntuación para ganar cada partida"""
+
+    seed: int = 0
+    """Semilla de la simulación"""
+
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    """Partidas por bloque"""
+
+    profiles: Optional[Mapping[str, Sequence[float]]] = None
+    """Perfiles de estrategia adicionales (ver `strategies.load_profiles`)"""
+
+    max_rounds: int = DEFAULT_MAX_ROUNDS
+    """Rondas tras las que una partida se corta sin ganador"""
+
+    @property
+    def chunk_count(self) -> int:
+        """Número de bloques de la simulación."""
+        return -(-self.matches // self.chunk_size)
+
+    def chunk_bounds(self, index: int) -> Tuple[int, int]:
+        """
+        Partidas de un bloque.
+
+        Args:
+            index: Índice del bloque
+
+        Returns:
+            Tuple[int, int]: Primera partida y partida siguiente a la última
+        """
+        start = index * self.chunk_size
+        return start, min(start + self.chunk_size, self.matches)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Campos de la simulación como objeto JSON.
+
+        Returns:
+            Dict[str, Any]: Campos, con los perfiles como listas
+        """
+        data = self._asdict()
+        if self.profiles is not None:
+            data["profiles"] = {name: list(weights) for name, weights in self.profiles.items()}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "SimulationJob":
+        """
+        Reconstruye una simulación a partir de `to_dict`.
+
+        Args:
+            data: Campos de la simulación
+
+        Returns:
+            SimulationJob: Simulación
+        """
+        return cls(**data)
+
+    def validate(self) -> None:
+        """
+        Comprueba que la simulación se puede jugar.
+
+        Raises:
+            ValueError: Si algún parámetro o estrategia no es válido
+        """
+        if self.matches < 1 or self.chunk_size < 1 or self.max_score < 1 or self.max_rounds < 1:
+            raise ValueError("Partidas, tamaño de bloque, puntuación y tope de rondas deben ser positivos.")
+        rng = random.Random(0)
+        for name in (self.user_strategy, self.computer_strategy):
+            create_strategy(name, rng, self.profiles).close()
+
+
+class SimulationSummary(NamedTuple):
+    """Agregados de una simulación o de uno de sus bloques."""
+
+    matches: int
+    """Partidas jugadas"""
+
+    user_wins: int
+    """Partidas que ganó el usuario simulado"""
+
+    computer_wins: int
+    """Partidas que ganó la computadora"""
+
+    rounds: int
+    """Rondas jugadas en total"""
+
+    pair_counts: Tuple[int, ...]
+    """Rondas por pareja de elecciones, en `índice_usuario * 5 + índice_computadora`"""
+
+    @classmethod
+    def empty(cls) -> "SimulationSummary":
+        """Agregado neutro para `merge`."""
+        return cls(0, 0, 0, 0, (0,) * PAIRS)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "SimulationSummary":
+        """
+        Reconstruye un agregado a partir de `_asdict`.
+
+        Args:
+            data: Campos del agregado
+
+        Returns:
+            SimulationSummary: Agregado
+        """
+        return cls(data["matches"], data["user_wins"], data["computer_wins"], data["rounds"], tuple(data["pair_counts"]))
+
+    @property
+    def unfinished(self) -> int:
+        """Partidas cortadas por el tope de rondas sin ganador."""
+        return self.matches - self.user_wins - self.computer_wins
+
+    def merge(self, other: "SimulationSummary") -> "SimulationSummary":
+        """
+        Suma dos agregados.
+
+        Args:
+            other: Agregado de otros bloques
+
+        Returns:
+            SimulationSummary: Agregado conjunto
+        """
+        return SimulationSummary(
+            self.matches + other.matches,
+            self.user_wins + other.user_wins,
+            self.computer_wins + other.computer_wins,
+            self.rounds + other.rounds,
+            tuple(a + b for a, b in zip(self.pair_counts, other.pair_counts)),
+        )
+
+
+def merge_all(summaries: Iterable[SimulationSummary]) -> SimulationSummary:
+    """
+    Suma los agregados de varios bloques.
+
+    Args:
+        summaries: Agregados a sumar
+
+    Returns:
+        SimulationSummary: Agregado conjunto
+    """
+    total = SimulationSummary.empty()
+    for summary in summaries:
+        total = total.merge(summary)
+    return total
+
+
+def simulation_report(job: SimulationJob, summary: SimulationSummary, elapsed: float) -> Dict[str, Any]:
+    """
+    Estadísticas de una simulación como objeto JSON.
+
+    Args:
+        job: Simulación jugada
+        summary: Agregados de la simulación
+        elapsed: Segundos que tardó
+
+    Returns:
+        Dict[str, Any]: Parámetros, agregados, tasas y rondas por pareja
+        ("usuario/computadora")
+    """
+    matches = summary.matches or 1
+    report = job.to_dict()
+    report.pop("profiles")
+    report.update(
+        user_wins=summary.user_wins,
+        computer_wins=summary.computer_wins,
+        unfinished=summary.unfinished,
+        rounds=summary.rounds,
+        user_win_rate=summary.user_wins / matches,
+        computer_win_rate=summary.computer_wins / matches,
+        rounds_per_match=summary.rounds / matches,
+        pairs={
+            f"{user}/{computer}": summary.pair_counts[index]
+            for index, (user, computer) in enumerate(itertools.product(CHOICES, CHOICES))
+        },
+        elapsed=elapsed,
+        matches_per_second=summary.matches / elapsed if elapsed > 0 else 0.0,
+    )
+    return report
+
+
+def chunk_rng(seed: int, index: int) -> random.Random:
+    """
+    Generador aleatorio propio de un bloque.
+
+    Args:
+        seed: Semilla de la simulación
+        index: Índice del bloque
+
+    Returns:
+        random.Random: Generador que sólo usa ese bloque
+    """
+    return random.Random(f"rpsls:{seed}:{index}")
+
+
+def chunk_players(job: SimulationJob, index: int) -> Tuple[GameEngine, ComputerStrategy]:
+    """
+    Juego y usuario simulado de un bloque, con el generador del bloque.
+
+    Args:
+        job: Simulación
+        index: Índice del bloque
+
+    Returns:
+        Tuple[GameEngine, ComputerStrategy]: Juego (con la estrategia de la
+        computadora) y estrategia del usuario; al terminar hay que liberarlos
+        con `close_players`
+    """
+    rng = chunk_rng(job.seed, index)
+    game = GameEngine(job.max_score, create_strategy(job.computer_strategy, rng, job.profiles))
+    return game, create_strategy(job.user_strategy, rng, job.profiles)
+
+
+def close_players(game: GameEngine, user: ComputerStrategy) -> None:
+    """
+    Libera las estrategias creadas por `chunk_players`.
+
+    Args:
+        game: Juego del bloque
+        user: Estrategia del usuario del bloque
+    """
+    game.strategy.close()
+    user.close()
+
+
+def run_chunk(job: SimulationJob, index: int) -> SimulationSummary:
+    """
+    Juega las partidas de un bloque.
+
+    Args:
+        job: Simulación
+        index: Índice del bloque
+
+    Returns:
+        SimulationSummary: Agregados del bloque
+    """
+    start, stop = job.chunk_bounds(index)
+    game, user = chunk_players(job, index)
+    pair_counts = [0] * PAIRS
+    user_wins = computer_wins = rounds = 0
+    try:
+        for _ in range(start, stop):
+            result = play_match(game, user, job.max_rounds, pair_counts)
+            user_wins += result.user_won
+            computer_wins += result.computer_won
+            rounds += result.rounds
+    finally:
+        close_players(game, user)
+    return SimulationSummary(stop - start, user_wins, computer_wins, rounds, tuple(pair_counts))
+
+
+def _write_slot(slots: memoryview, slot: int, summary: SimulationSummary) -> None:
+    """Escribe los agregados de un bloque en su ranura."""
+    start = slot * _SLOT_FIELDS
+    fields = (summary.matches, summary.user_wins, summary.computer_wins, summary.rounds, *summary.pair_counts)
+    for offset, value in enumerate(fields):
+        slots[start + offset] = value
+
+
+def _read_slot(slots: memoryview, slot: int) -> SimulationSummary:
+    """Lee los agregados de un bloque de su ranura."""
+    row = slots[slot * _SLOT_FIELDS:(slot + 1) * _SLOT_FIELDS].tolist()
+    return SimulationSummary(row[0], row[1], row[2], row[3], tuple(row[4:]))
+
+
+def _slot_view(memory: shared_memory.SharedMemory) -> memoryview:
+    """Vista de enteros de 64 bits sobre un bloque compartido de ranuras."""
+    assert memory.buf is not None
+    return memory.buf.cast("q")
+
+
+# Simulación y ranuras del proceso trabajador, fijadas por _init_slot_worker
+_worker_job: Optional[SimulationJob] = None
+_worker_memory: Optional[shared_memory.SharedMemory] = None
+_worker_slots: Optional[memoryview] = None
+
+
+def _init_slot_worker(name: str, job: SimulationJob) -> None:
+    """Conecta el trabajador al bloque compartido de ranuras."""
+    global _worker_job, _worker_memory, _worker_slots
+    _worker_job = job
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    _worker_slots = _slot_view(_worker_memory)
+
+
+def _run_chunk_into_slot(index: int, slot: int) -> None:
+    """Juega un bloque en el trabajador y escribe sus agregados en la ranura indicada."""
+    assert _worker_job is not None and _worker_slots is not None
+    _write_slot(_worker_slots, slot, run_chunk(_worker_job, index))
+
+
+class SimulationCheckpoint:
+    """
+    Avance de una simulación: bloques terminados y agregado acumulado.
+
+    El generador aleatorio de cada bloque se deriva de la semilla y del índice
+    del bloque (`chunk_rng`), así que guardar la simulación, los bloques
+    terminados y el agregado basta para reanudar con el mismo resultado: los
+    bloques a medias se vuelven a jugar desde su estado inicial. También se
+    guardan los segundos de juego acumulados, para medir el rendimiento de una
+    simulación reanudada sobre todas sus partidas.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        job: SimulationJob,
+        done: Optional[bytearray] = None,
+        summary: Optional[SimulationSummary] = None,
+        elapsed: float = 0.0,
+    ):
+        """
+        Crea el avance de una simulación.
+
+        Args:
+            job: Simulación
+            done: Un byte por bloque, distinto de cero si está terminado
+            summary: Agregado de los bloques terminados
+            elapsed: Segundos de juego acumulados
+        """
+        self.job = job
+        self.done = done if done is not None else bytearray(job.chunk_count)
+        self.summary = summary if summary is not None else SimulationSummary.empty()
+        self.elapsed = elapsed
+
+    @property
+    def completed(self) -> int:
+        """Bloques terminados."""
+        return self.job.chunk_count - self.done.count(0)
+
+    def pending(self) -> Iterator[int]:
+        """Índices de los bloques que faltan, en orden."""
+        return (index for index, finished in enumerate(self.done) if not finished)
+
+    def record(self, index: int, summary: SimulationSummary) -> None:
+        """
+        Suma un bloque terminado.
+
+        Args:
+            index: Índice del bloque
+            summary: Agregados del bloque
+        """
+        if not self.done[index]:
+            self.done[index] = 1
+            self.summary = self.summary.merge(summary)
+
+    def save(self, path: str) -> None:
+        """
+        Guarda el avance de forma atómica.
+
+        Args:
+            path: Archivo JSON de destino
+        """
+        data = {
+            "version": self.VERSION,
+            "job": self.job.to_dict(),
+            "done": base64.b64encode(zlib.compress(bytes(self.done))).decode("ascii"),
+            "summary": self.summary._asdict(),
+            "elapsed": self.elapsed,
+        }
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, separators=(",", ":"))
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str, job: Optional[SimulationJob] = None) -> "SimulationCheckpoint":
+        """
+        Lee un avance guardado con `save`.
+
+        Args:
+            path: Archivo JSON del punto de control
+            job: Simulación que se quiere reanudar, para comprobar que coincide
+
+        Returns:
+            SimulationCheckpoint: Avance guardado
+
+        Raises:
+            ValueError: Si el archivo no es válido o es de otra simulación
+        """
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Versión de punto de control no soportada: {data.get('version')}")
+        saved = SimulationJob.from_dict(data["job"])
+        if job is not None and saved.to_dict() != job.to_dict():
+            raise ValueError(f"El punto de control {path} es de otra simulación.")
+        done = bytearray(zlib.decompress(base64.b64decode(data["done"])))
+        if len(done) != saved.chunk_count:
+            raise ValueError(f"El punto de control {path} está dañado.")
+        return cls(saved, done, SimulationSummary.from_dict(data["summary"]), float(data.get("elapsed", 0.0)))
+
+
+def iter_job_matches(job: SimulationJob) -> Iterator[MatchResult]:
+    """
+    Juega las partidas de una simulación en orden y las entrega una a una.
+
+    Recorre los bloques con sus propios generadores aleatorios, así que da las
+    mismas partidas que `run_chunk` y `SimulationExecutor`, pero en un solo hilo
+    y guardando sólo la partida en curso.
+
+    Args:
+        job: Simulación
+
+    Yields:
+        MatchResult: Marcador final y rondas de cada partida
+    """
+    job.validate()
+    for index in range(job.chunk_count):
+        start, stop = job.chunk_bounds(index)
+        game, user = chunk_players(job, index)
+        try:
+            yield from game.iter_matches(user, stop - start, job.max_rounds)
+        finally:
+            close_players(game, user)
+
+
+def free_threading_enabled() -> bool:
+    """
+    Indica si el intérprete ejecuta hilos de Python en paralelo (GIL desactivado).
+
+    Returns:
+        bool: True en CPython free-threaded con el GIL desactivado
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def resolve_backend(backend: str) -> str:
+    """
+    Traduce el backend pedido al que se usará.
+
+    Args:
+        backend: "auto", "threads" o "processes"
+
+    Returns:
+        str: "threads" o "processes"
+
+    Raises:
+        ValueError: Si el backend no existe
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend desconocido: {backend}. Opciones: {', '.join(BACKENDS)}")
+    if backend == "auto":
+        return "threads" if free_threading_enabled() else "processes"
+    return backend
+
+
+class SimulationExecutor:
+    """
+    Reparte los bloques de una simulación entre hilos o procesos.
+
+    Uso:
+        executor = SimulationExecutor(jobs=8)
+        summary = executor.run(SimulationJob(1_000_000, computer_strategy="clasica"))
+    """
+
+    def __init__(self, jobs: Optional[int] = None, backend: str = "auto"):
+        """
+        Configura el reparto.
+
+        Args:
+            jobs: Hilos o procesos (por defecto, uno por núcleo)
+            backend: "auto", "threads" o "processes"
+
+        Raises:
+            ValueError: Si el backend no existe o `jobs` no es positivo
+        """
+        self.jobs = jobs if jobs is not None else os.cpu_count() or 1
+        if self.jobs < 1:
+            raise ValueError("El número de trabajadores debe ser al menos 1.")
+        self.backend = resolve_backend(backend)
+
+    def _executor(
+        self, initializer: Optional[Callable[..., None]] = None, initargs: Tuple[Any, ...] = ()
+    ) -> Executor:
+        if self.backend == "threads":
+            return ThreadPoolExecutor(
+                max_workers=self.jobs, thread_name_prefix="simulacion", initializer=initializer, initargs=initargs
+            )
+        return ProcessPoolExecutor(max_workers=self.jobs, initializer=initializer, initargs=initargs)
+
+    def _bounded(
+        self, submit: Callable[[int], "Future[Any]"], chunks: Iterator[int]
+    ) -> Iterator[Tuple[int, "Future[Any]"]]:
+        """Envía los bloques con `submit` y los entrega a medida que terminan."""
+        running: Dict["Future[Any]", int] = {}
+        # Ventana acotada: una simulación enorme no encola millones de tareas
+        for index in itertools.islice(chunks, self.jobs * _WINDOW_PER_WORKER):
+            running[submit(index)] = index
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                yield index, future
+                for following in itertools.islice(chunks, 1):
+                    running[submit(following)] = following
+
+    def run(
+        self,
+        job: SimulationJob,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    ) -> SimulationSummary:
+        """
+        Juega la simulación completa.
+
+        Con `checkpoint_path`, el avance se guarda cada `checkpoint_every`
+        bloques terminados y al interrumpirse (también con Ctrl-C); si el
+        archivo ya existe, la simulación se reanuda desde él y el resultado es
+        idéntico al de una ejecución sin interrupciones. Al terminar, el punto
+        de control se borra.
+
+        Args:
+            job: Simulación
+            checkpoint_path: Archivo JSON del punto de control
+            checkpoint_every: Bloques terminados entre puntos de control
+
+        Returns:
+            SimulationSummary: Agregados de todas las partidas
+
+        Raises:
+            ValueError: Si la simulación no es válida o el punto de control es de otra
+        """
+        job.validate()
+        if checkpoint_every < 1:
+            raise ValueError("Debe haber al menos un bloque entre puntos de control.")
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            checkpoint = SimulationCheckpoint.load(checkpoint_path, job)
+        else:
+            checkpoint = SimulationCheckpoint(job)
+        start = time.perf_counter() - checkpoint.elapsed
+        unsaved = 0
+        try:
+            for index, summary in self._play(job, checkpoint.pending()):
+                checkpoint.record(index, summary)
+                unsaved += 1
+                if checkpoint_path and unsaved >= checkpoint_every:
+                    checkpoint.elapsed = time.perf_counter() - start
+                    checkpoint.save(checkpoint_path)
+                    unsaved = 0
+        except BaseException:
+            if checkpoint_path and unsaved:
+                checkpoint.elapsed = time.perf_counter() - start
+                checkpoint.save(checkpoint_path)
+            raise
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        return checkpoint.summary
+
+    def _play(self, job: SimulationJob, chunks: Iterator[int]) -> Iterator[Tuple[int, SimulationSummary]]:
+        """Juega los bloques indicados y los devuelve a medida que terminan."""
+        if self.jobs == 1 or job.chunk_count == 1:
+            for index in chunks:
+                yield index, run_chunk(job, index)
+            return
+        if self.backend == "threads":
+            executor = self._executor()
+            try:
+                for index, future in self._bounded(lambda index: executor.submit(run_chunk, job, index), chunks):
+                    yield index, future.result()
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+            return
+        # Procesos: una ranura de agregados por tarea en vuelo, sin devolver objetos serializados
+        window = self.jobs * _WINDOW_PER_WORKER
+        memory = shared_memory.SharedMemory(create=True, size=window * _SLOT_FIELDS * 8)
+        slots = _slot_view(memory)
+        free: List[int] = list(range(window))
+        taken: Dict[int, int] = {}
+
+        def submit(index: int) -> "Future[None]":
+            slot = taken[index] = free.pop()
+            return executor.submit(_run_chunk_into_slot, index, slot)
+
+        executor = self._executor(_init_slot_worker, (memory.name, job))
+        try:
+            for index, future in self._bounded(submit, chunks):
+                future.result()
+                slot = taken.pop(index)
+                summary = _read_slot(slots, slot)
+                free.append(slot)
+                yield index, summary
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            slots.release()
+            memory.close()
+            memory.unlink()
+
+    def run_shared(self, job: SimulationJob) -> "SharedResults":
+        """
+        Juega la simulación escribiendo cada partida en memoria compartida.
+
+        Los trabajadores escriben sus resultados en el bloque compartido y no
+        devuelven nada al proceso principal. Requiere numpy.
+
+        Args:
+            job: Simulación
+
+        Returns:
+            SharedResults: Resultados de cada partida; hay que cerrarlos con `close`
+
+        Raises:
+            ValueError: Si la simulación no es válida
+        """
+        from .shared_results import SharedResults, _fill_chunk, _init_worker
+
+        job.validate()
+        chunks = range(job.chunk_count)
+        results = SharedResults.create(job)
+        try:
+            if self.jobs == 1 or len(chunks) == 1:
+                for index in chunks:
+                    results.fill_chunk(index)
+            else:
+                if self.backend == "threads":
+                    executor = self._executor()
+                    fill: Callable[[int], None] = results.fill_chunk
+                else:
+                    executor = self._executor(_init_worker, (results.name, job))
+                    fill = _fill_chunk
+                try:
+                    for _, future in self._bounded(lambda index: executor.submit(fill, index), iter(chunks)):
+                        future.result()
+                finally:
+                    executor.shutdown(wait=True, cancel_futures=True)
+        except BaseException:
+            results.close()
+            raise
+        return results
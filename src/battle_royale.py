@@ -0,0 +1,297 @@
+"""
+Modo battle royale: eliminación masiva de jugadores simulados
+
+En cada ronda los jugadores vivos se emparejan al azar, cada pareja se resuelve
+con las reglas de `GameChoice` (los empates se vuelven a lanzar) y los
+perdedores quedan eliminados hasta que sólo queda un campeón.
+
+Los jugadores son índices en arreglos de NumPy y el emparejamiento, los
+lanzamientos y la resolución se hacen en bloque sobre esos arreglos, sin crear
+un objeto por jugador. Requiere numpy (dependencia opcional).
+
+Con `run(checkpoint_path=...)` el torneo guarda tras cada ronda los
+supervivientes, los contadores y el estado del generador aleatorio; si se
+interrumpe, la siguiente ejecución con el mismo archivo sigue desde la última
+ronda guardada y termina con el mismo campeón. El punto de control recuerda la
+semilla y la tabla de estrategias para no reanudar otro torneo, y se borra al
+decidirse el campeón.
+"""
+
+import json
+import os
+import time
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depende del entorno
+    raise ImportError(
+        "El modo battle royale requiere numpy. Instálalo con: pip install numpy"
+    ) from exc
+
+from .game_enums import GameChoice
+
+CHOICES = tuple(GameChoice)
+
+# BEATS_MATRIX[i, j] es True si la opción i vence a la opción j
+BEATS_MATRIX = np.array([[a.beats(b) for b in CHOICES] for a in CHOICES], dtype=bool)
+
+
+class BattleRoyaleResult(NamedTuple):
+    """Resumen de un torneo battle royale."""
+
+    champion: int
+    """Índice del jugador campeón"""
+
+    players: int
+    """Jugadores al inicio del torneo"""
+
+    rounds: int
+    """Rondas de eliminación hasta tener campeón"""
+
+    duels: int
+    """Duelos resueltos (uno por jugador eliminado)"""
+
+    throws: int
+    """Lanzamientos realizados, incluidos los repetidos por empate"""
+
+    elapsed: float
+    """Segundos de simulación"""
+
+    @property
+    def duels_per_second(self) -> float:
+        """Duelos resueltos por segundo."""
+        return self.duels / self.elapsed if self.elapsed else float("inf")
+
+    @property
+    def throws_per_second(self) -> float:
+        """Lanzamientos por segundo."""
+        return self.throws / self.elapsed if self.elapsed else float("inf")
+
+
+class BattleRoyale:
+    """
+    Torneo de eliminación vectorizado sobre arreglos de jugadores.
+
+    Cada jugador tiene asignada una estrategia mixta (probabilidad de lanzar cada
+    opción); por defecto todos juegan de forma uniforme.
+    """
+
+    def __init__(
+        self,
+        num_players: int,
+        seed: Optional[int] = None,
+        strategies: Optional[Sequence[Sequence[float]]] = None,
+        player_strategies: Optional[Sequence[int]] = None,
+        max_rethrows: int = 100,
+    ):
+        """
+        Prepara el torneo.
+
+        Args:
+            num_players: Número de jugadores (mínimo 2)
+            seed: Semilla del generador aleatorio
+            strategies: Estrategias mixtas, una fila de 5 probabilidades por estrategia
+            player_strategies: Índice de estrategia de cada jugador
+            max_rethrows: Lanzamientos por duelo antes de decidir un empate
+                persistente a cara o cruz (dos estrategias puras iguales
+                empatarían para siempre)
+
+        Raises:
+            ValueError: Si los parámetros no son coherentes
+        """
+        if num_players < 2:
+            raise ValueError(f"Número de jugadores inválido: {num_players}. Debe ser al menos 2.")
+        self.num_players = num_players
+        self.max_rethrows = max_rethrows
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self._cdf: Optional[np.ndarray] = None
+        self._player_strategy: Optional[np.ndarray] = None
+
+        if strategies is not None:
+            table = np.asarray(strategies, dtype=np.float64)
+            if table.ndim != 2 or table.shape[1] != len(CHOICES) or (table < 0).any():
+                raise ValueError("Cada estrategia debe tener 5 probabilidades no negativas.")
+            if not (table.sum(axis=1) > 0).all():
+                raise ValueError("Cada estrategia debe tener alguna probabilidad positiva.")
+            table = table / table.sum(axis=1, keepdims=True)
+            self._cdf = np.cumsum(table, axis=1)
+            if player_strategies is None:
+                assignment = self.rng.integers(0, len(table), size=num_players)
+            else:
+                assignment = np.asarray(player_strategies)
+            if assignment.shape != (num_players,) or assignment.min() < 0 or assignment.max() >= len(table):
+                raise ValueError("Debe haber un índice de estrategia válido por jugador.")
+            self._player_strategy = assignment.astype(np.min_scalar_type(len(table)))
+
+    def throw(self, players: np.ndarray) -> np.ndarray:
+        """
+        Genera en bloque el lanzamiento de varios jugadores.
+
+        Args:
+            players: Índices de los jugadores que lanzan
+
+        Returns:
+            np.ndarray: Índice de la opción (orden de GameChoice) de cada jugador
+        """
+        if self._cdf is None or self._player_strategy is None:
+            return self.rng.integers(0, len(CHOICES), size=len(players), dtype=np.int8)
+        cdf = self._cdf[self._player_strategy[players]]
+        draws = self.rng.random(len(players))[:, None]
+        choices: np.ndarray = np.minimum((draws >= cdf).sum(axis=1), len(CHOICES) - 1).astype(np.int8)
+        return choices
+
+    def play_round(self, alive: np.ndarray) -> Tuple[np.ndarray, int]:
+        """
+        Empareja a los vivos, resuelve todos los duelos y elimina a los perdedores.
+
+        Args:
+            alive: Índices de los jugadores vivos
+
+        Returns:
+            Tuple[np.ndarray, int]: Supervivientes y lanzamientos realizados
+        """
+        shuffled = self.rng.permutation(alive)
+        pairs = len(shuffled) // 2
+        first = shuffled[:pairs]
+        second = shuffled[pairs:2 * pairs]
+        bye = shuffled[2 * pairs:]
+
+        winners = np.empty(pairs, dtype=alive.dtype)
+        pending = np.arange(pairs)
+        throws = 0
+        attempts = 0
+        while len(pending) and attempts < self.max_rethrows:
+            attempts += 1
+            choice_a = self.throw(first[pending])
+            choice_b = self.throw(second[pending])
+            throws += 2 * len(pending)
+            a_wins = BEATS_MATRIX[choice_a, choice_b]
+            b_wins = BEATS_MATRIX[choice_b, choice_a]
+            winners[pending[a_wins]] = first[pending[a_wins]]
+            winners[pending[b_wins]] = second[pending[b_wins]]
+            # Los empates vuelven a lanzar dentro de la misma ronda
+            pending = pending[~(a_wins | b_wins)]
+
+        if len(pending):
+            coin = self.rng.random(len(pending)) < 0.5
+            winners[pending] = np.where(coin, first[pending], second[pending])
+
+        return np.concatenate((winners, bye)), throws
+
+    def run(self, checkpoint_path: Optional[str] = None) -> BattleRoyaleResult:
+        """
+        Ejecuta el torneo completo.
+
+        Args:
+            checkpoint_path: Archivo .npz donde guardar el avance tras cada
+                ronda; si existe, el torneo se reanuda desde él, y se borra
+                al decidirse el campeón
+
+        Returns:
+            BattleRoyaleResult: Campeón, rondas y rendimiento
+
+        Raises:
+            ValueError: Si el punto de control es de otro torneo
+        """
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            alive, rounds, throws, elapsed = self.load_checkpoint(checkpoint_path)
+        else:
+            alive = np.arange(self.num_players, dtype=np.min_scalar_type(self.num_players))
+            rounds = throws = 0
+            elapsed = 0.0
+        start = time.perf_counter() - elapsed
+        while len(alive) > 1:
+            alive, round_throws = self.play_round(alive)
+            throws += round_throws
+            rounds += 1
+            if checkpoint_path and len(alive) > 1:
+                self.save_checkpoint(checkpoint_path, alive, rounds, throws, time.perf_counter() - start)
+        elapsed = time.perf_counter() - start
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        return BattleRoyaleResult(
+            champion=int(alive[0]),
+            players=self.num_players,
+            rounds=rounds,
+            duels=self.num_players - 1,
+            throws=throws,
+            elapsed=elapsed,
+        )
+
+    def save_checkpoint(self, path: str, alive: np.ndarray, rounds: int, throws: int, elapsed: float) -> None:
+        """
+        Guarda el avance del torneo de forma atómica.
+
+        Args:
+            path: Archivo .npz de destino
+            alive: Jugadores vivos
+            rounds: Rondas jugadas
+            throws: Lanzamientos realizados
+            elapsed: Segundos de juego acumulados
+        """
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as handle:
+            np.savez(
+                handle,
+                num_players=np.int64(self.num_players),
+                seed=np.array(json.dumps(self.seed)),
+                cdf=self._cdf if self._cdf is not None else np.empty((0, len(CHOICES))),
+                alive=alive,
+                counters=np.array([rounds, throws], dtype=np.int64),
+                elapsed=np.float64(elapsed),
+                rng_state=np.array(json.dumps(self.rng.bit_generator.state)),
+                player_strategy=(
+                    self._player_strategy if self._player_strategy is not None else np.empty(0, dtype=np.int8)
+                ),
+            )
+        os.replace(temporary, path)
+
+    def load_checkpoint(self, path: str) -> Tuple[np.ndarray, int, int, float]:
+        """
+        Restaura el generador aleatorio y las estrategias desde un punto de control.
+
+        Args:
+            path: Archivo .npz generado con `save_checkpoint`
+
+        Returns:
+            Tuple[np.ndarray, int, int, float]: Vivos, rondas, lanzamientos y
+            segundos de juego acumulados
+
+        Raises:
+            ValueError: Si el punto de control es de un torneo de otro tamaño,
+                con otra semilla o con otras estrategias
+        """
+        with np.load(path) as data:
+            if int(data["num_players"]) != self.num_players:
+                raise ValueError(f"El punto de control {path} es de un torneo de {int(data['num_players'])} jugadores.")
+            # Sin semilla se acepta la del punto de control, como en las simulaciones por lotes
+            saved_seed = json.loads(str(data["seed"]))
+            if self.seed is not None and saved_seed != self.seed:
+                raise ValueError(f"El punto de control {path} es de un torneo con la semilla {saved_seed}.")
+            cdf = self._cdf if self._cdf is not None else np.empty((0, len(CHOICES)))
+            if not np.array_equal(data["cdf"], cdf):
+                raise ValueError(f"El punto de control {path} es de un torneo con otras estrategias.")
+            self.rng.bit_generator.state = json.loads(str(data["rng_state"]))
+            if self._player_strategy is not None:
+                self._player_strategy = data["player_strategy"].astype(self._player_strategy.dtype)
+            rounds, throws = (int(value) for value in data["counters"])
+            return data["alive"], rounds, throws, float(data["elapsed"])
+
+
+def run_battle_royale(
+    num_players: int, seed: Optional[int] = None, checkpoint_path: Optional[str] = None
+) -> BattleRoyaleResult:
+    """
+    Atajo para ejecutar un torneo con jugadores uniformes.
+
+    Args:
+        num_players: Número de jugadores
+        seed: Semilla del generador aleatorio
+        checkpoint_path: Archivo .npz para guardar y reanudar el avance
+
+    Returns:
+        BattleRoyaleResult: Resumen del torneo
+    """
+    return BattleRoyale(num_players, seed=seed).run(checkpoint_path)
@@ -0,0 +1,387 @@
+"""
+Simulaciones repartidas entre varias máquinas
+
+Un coordinador divide una simulación (`batch.SimulationJob`) en sus bloques de
+semillas y los reparte por TCP entre trabajadores, en esta u otras máquinas.
+Cada trabajador juega los bloques con el motor del proyecto
+(`batch.run_chunk`) y devuelve sólo sus agregados, así que el resultado es el
+mismo que el de `SimulationExecutor` con cualquier número de trabajadores.
+
+Protocolo: mensajes JSON, uno por línea.
+
+    trabajador -> {"type": "hello", "version": 1}
+    coordinador -> {"type": "job", "job": {...}}
+    coordinador -> {"type": "chunk", "index": 7}
+    trabajador -> {"type": "result", "index": 7, "summary": {...}}
+                  o {"type": "error", "index": 7, "message": "..."}
+    ...
+    coordinador -> {"type": "done"}
+
+- Los trabajadores piden bloques a medida que terminan: los rápidos juegan más.
+- Robo de trabajo: cuando no quedan bloques sin asignar, un trabajador libre
+  recibe una copia de un bloque que otro sigue jugando; vale el primer
+  resultado que llegue, así que un trabajador lento no retrasa el final.
+- Reintentos: un bloque que falla o cuya conexión se corta vuelve a la cola,
+  hasta `max_retries` veces.
+- Agregados parciales: `on_progress` recibe el agregado acumulado tras cada
+  bloque.
+
+Coordinador y trabajadores:
+    python -m src.distributed coordinator --matches 10000000000 --chunk-size 100000 --port 7464
+    python -m src.distributed worker coordinador.local:7464 --processes 16
+"""
+
+import json
+import os
+import socket
+import sys
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, NamedTuple, Optional, Protocol, Sequence, Set, Tuple
+
+from .batch import DEFAULT_CHUNK_SIZE, SimulationJob, SimulationSummary, run_chunk
+from .strategies import DEFAULT_STRATEGY, load_profiles
+
+PROTOCOL_VERSION = 1
+DEFAULT_PORT = 7464
+DEFAULT_MAX_RETRIES = 3
+
+Message = Dict[str, Any]
+
+
+class _LineStream(Protocol):
+    """Flujo binario por líneas, como el de `socket.makefile("rwb")`."""
+
+    def write(self, data: bytes, /) -> int: ...
+
+    def flush(self) -> None: ...
+
+    def readline(self, size: Optional[int] = -1, /) -> bytes: ...
+
+
+def _send(stream: _LineStream, message: Message) -> None:
+    """Envía un mensaje como una línea JSON."""
+    stream.write(json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def _receive(stream: _LineStream) -> Optional[Message]:
+    """Lee el siguiente mensaje, o None si la conexión se cerró."""
+    line = stream.readline()
+    if not line:
+        return None
+    message: Message = json.loads(line)
+    return message
+
+
+class Progress(NamedTuple):
+    """Avance de una simulación repartida."""
+
+    completed: int
+    """Bloques terminados"""
+
+    total: int
+    """Bloques de la simulación"""
+
+    summary: SimulationSummary
+    """Agregado de los bloques terminados"""
+
+
+class Coordinator:
+    """
+    Reparte los bloques de una simulación entre trabajadores conectados por TCP.
+
+    Uso:
+        coordinator = Coordinator(job, host="0.0.0.0", port=7464)
+        summary = coordinator.run()
+    """
+
+    def __init__(
+        self,
+        job: SimulationJob,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        on_progress: Optional[Callable[[Progress], None]] = None,
+    ):
+        """
+        Valida la simulación y empieza a escuchar.
+
+        Args:
+            job: Simulación a repartir
+            host: Dirección en la que escuchar
+            port: Puerto (0 elige uno libre; ver `address`)
+            max_retries: Reintentos de un bloque antes de abandonar la simulación
+            on_progress: Se llama con el agregado parcial tras cada bloque
+                terminado; debe ser rápida porque se ejecuta con el estado bloqueado
+
+        Raises:
+            ValueError: Si la simulación no es válida o max_retries es negativo
+        """
+        job.validate()
+        if max_retries < 0:
+            raise ValueError("El número de reintentos no puede ser negativo.")
+        self.job = job
+        self.max_retries = max_retries
+        self.on_progress = on_progress
+        self._condition = threading.Condition()
+        self._next_index = 0
+        self._retry: Deque[int] = deque()
+        self._running: Dict[int, int] = {}
+        self._done = bytearray(job.chunk_count)
+        self._completed = 0
+        self._failures: Dict[int, int] = {}
+        self._summary = SimulationSummary.empty()
+        self._error: Optional[RuntimeError] = None
+        self._connections: Set[socket.socket] = set()
+        self._server = socket.create_server((host, port))
+        self.address: Tuple[str, int] = self._server.getsockname()[:2]
+        threading.Thread(target=self._accept, name="coordinador", daemon=True).start()
+
+    @property
+    def finished(self) -> bool:
+        """True si todos los bloques terminaron."""
+        return self._completed == self.job.chunk_count
+
+    def partial(self) -> Progress:
+        """Agregado de los bloques terminados hasta ahora."""
+        with self._condition:
+            return Progress(self._completed, self.job.chunk_count, self._summary)
+
+    def run(self, timeout: Optional[float] = None) -> SimulationSummary:
+        """
+        Atiende trabajadores hasta terminar la simulación.
+
+        Args:
+            timeout: Segundos máximos de espera (por defecto, sin límite)
+
+        Returns:
+            SimulationSummary: Agregado de todas las partidas
+
+        Raises:
+            RuntimeError: Si un bloque falla más de `max_retries` veces
+            TimeoutError: Si la simulación no termina a tiempo
+        """
+        try:
+            with self._condition:
+                if not self._condition.wait_for(lambda: self.finished or self._error is not None, timeout):
+                    raise TimeoutError(f"La simulación no terminó en {timeout} segundos.")
+                if self._error is not None:
+                    raise self._error
+                return self._summary
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Deja de escuchar y corta las conexiones que sigan abiertas."""
+        with self._condition:
+            if self._error is None and not self.finished:
+                self._error = RuntimeError("El coordinador se cerró antes de terminar la simulación.")
+            self._condition.notify_all()
+            connections = list(self._connections)
+        for connection in [self._server, *connections]:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._server.close()
+
+    def _accept(self) -> None:
+        """Acepta trabajadores y atiende cada uno en su hilo."""
+        while True:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(connection,), name="coordinador-trabajador", daemon=True).start()
+
+    def _serve(self, connection: socket.socket) -> None:
+        """Conversación con un trabajador."""
+        with self._condition:
+            self._connections.add(connection)
+        index: Optional[int] = None
+        try:
+            with connection, connection.makefile("rwb") as stream:
+                hello = _receive(stream)
+                if hello is None or hello.get("type") != "hello" or hello.get("version") != PROTOCOL_VERSION:
+                    return
+                _send(stream, {"type": "job", "job": self.job.to_dict()})
+                while True:
+                    index = self._next_chunk()
+                    if index is None:
+                        _send(stream, {"type": "done"})
+                        return
+                    _send(stream, {"type": "chunk", "index": index})
+                    reply = _receive(stream)
+                    if reply is None:
+                        raise ConnectionError("conexión cerrada por el trabajador")
+                    if reply.get("type") == "result" and reply.get("index") == index:
+                        self._complete(index, SimulationSummary.from_dict(reply["summary"]))
+                    else:
+                        self._release(index, str(reply.get("message", "respuesta inesperada")))
+                    index = None
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            if index is not None:
+                self._release(index, f"{type(exc).__name__}: {exc}")
+        finally:
+            with self._condition:
+                self._connections.discard(connection)
+
+    def _next_chunk(self) -> Optional[int]:
+        """Bloque para un trabajador libre, o None si ya no queda trabajo."""
+        with self._condition:
+            while True:
+                if self._error is not None or self.finished:
+                    return None
+                if self._retry:
+                    index = self._retry.popleft()
+                elif self._next_index < self.job.chunk_count:
+                    index = self._next_index
+                    self._next_index += 1
+                else:
+                    # Robo de trabajo: copia del bloque más antiguo que sólo juega un trabajador
+                    stealable = [running for running, copies in self._running.items() if copies == 1]
+                    if not stealable:
+                        self._condition.wait()
+                        continue
+                    index = min(stealable)
+                self._running[index] = self._running.get(index, 0) + 1
+                return index
+
+    def _complete(self, index: int, summary: SimulationSummary) -> None:
+        """Registra el resultado de un bloque; las copias posteriores se ignoran."""
+        with self._condition:
+            self._drop_copy(index)
+            if self._done[index]:
+                return
+            self._done[index] = 1
+            self._completed += 1
+            self._summary = self._summary.merge(summary)
+            if self.on_progress is not None:
+                self.on_progress(Progress(self._completed, self.job.chunk_count, self._summary))
+            self._condition.notify_all()
+
+    def _release(self, index: int, reason: str) -> None:
+        """Devuelve a la cola un bloque que falló, o abandona si agotó los reintentos."""
+        with self._condition:
+            self._drop_copy(index)
+            if not self._done[index]:
+                failures = self._failures.get(index, 0) + 1
+                self._failures[index] = failures
+                if failures > self.max_retries:
+                    self._error = RuntimeError(f"El bloque {index} falló {failures} veces: {reason}")
+                elif index not in self._running and index not in self._retry:
+                    self._retry.append(index)
+            self._condition.notify_all()
+
+    def _drop_copy(self, index: int) -> None:
+        copies = self._running.get(index, 0) - 1
+        if copies > 0:
+            self._running[index] = copies
+        else:
+            self._running.pop(index, None)
+
+
+def run_worker(host: str, port: int = DEFAULT_PORT) -> int:
+    """
+    Juega bloques de un coordinador hasta que no quede trabajo.
+
+    Args:
+        host: Dirección del coordinador
+        port: Puerto del coordinador
+
+    Returns:
+        int: Bloques jugados por este trabajador
+    """
+    played = 0
+    with socket.create_connection((host, port)) as connection, connection.makefile("rwb") as stream:
+        _send(stream, {"type": "hello", "version": PROTOCOL_VERSION})
+        message = _receive(stream)
+        if message is None or message.get("type") != "job":
+            return played
+        job = SimulationJob.from_dict(message["job"])
+        while True:
+            message = _receive(stream)
+            if message is None or message.get("type") != "chunk":
+                return played
+            index = message["index"]
+            try:
+                summary = run_chunk(job, index)
+            except Exception as exc:
+                _send(stream, {"type": "error", "index": index, "message": f"{type(exc).__name__}: {exc}"})
+                continue
+            _send(stream, {"type": "result", "index": index, "summary": summary._asdict()})
+            played += 1
+
+
+def _parse_address(value: str) -> Tuple[str, int]:
+    """Separa "host:puerto" (el puerto es opcional)."""
+    host, _, port = value.rpartition(":")
+    if not host:
+        return value, DEFAULT_PORT
+    return host, int(port)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Ejecuta el coordinador o los trabajadores desde la línea de comandos.
+
+    Args:
+        argv: Argumentos (por defecto, sys.argv[1:])
+
+    Returns:
+        int: Código de salida
+    """
+    import argparse
+    from multiprocessing import Pool
+
+    parser = argparse.ArgumentParser(description="Simulaciones repartidas entre varias máquinas")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    coordinator = commands.add_parser("coordinator", help="Repartir una simulación")
+    coordinator.add_argument("--matches", type=int, required=True, help="Partidas a jugar")
+    coordinator.add_argument("--user-strategy", default=DEFAULT_STRATEGY, help="Estrategia del usuario simulado")
+    coordinator.add_argument("--computer-strategy", default=DEFAULT_STRATEGY, help="Estrategia de la computadora")
+    coordinator.add_argument("--score", type=int, default=3, help="Puntuación para ganar cada partida")
+    coordinator.add_argument("--seed", type=int, default=0, help="Semilla de la simulación")
+    coordinator.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Partidas por bloque")
+    coordinator.add_argument("--profiles", default=None, metavar="ARCHIVO", help="Perfiles de estrategia JSON")
+    coordinator.add_argument("--host", default="0.0.0.0", help="Dirección en la que escuchar")
+    coordinator.add_argument("--port", type=int, default=DEFAULT_PORT, help="Puerto en el que escuchar")
+    coordinator.add_argument("--retries", type=int, default=DEFAULT_MAX_RETRIES, help="Reintentos por bloque")
+
+    worker = commands.add_parser("worker", help="Jugar bloques de un coordinador")
+    worker.add_argument("address", metavar="HOST:PUERTO", help="Dirección del coordinador")
+    worker.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Trabajadores en esta máquina")
+
+    args = parser.parse_args(argv)
+    if args.command == "worker":
+        host, port = _parse_address(args.address)
+        with Pool(args.processes) as pool:
+            played = sum(pool.starmap(run_worker, [(host, port)] * args.processes))
+        print(f"Bloques jugados: {played}")
+        return 0
+
+    profiles = load_profiles(args.profiles) if args.profiles else None
+    job = SimulationJob(
+        args.matches, args.user_strategy, args.computer_strategy, args.score, args.seed, args.chunk_size, profiles
+    )
+
+    def report(progress: Progress) -> None:
+        summary = progress.summary
+        print(
+            f"{progress.completed}/{progress.total} bloques: "
+            f"usuario {summary.user_wins / summary.matches:.2%}, "
+            f"computadora {summary.computer_wins / summary.matches:.2%}",
+            file=sys.stderr,
+        )
+
+    server = Coordinator(job, args.host, args.port, args.retries, on_progress=report)
+    print(f"Coordinador escuchando en {server.address[0]}:{server.address[1]}", file=sys.stderr)
+    summary = server.run()
+    print(json.dumps(summary._asdict()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+"""
+Equilibrio de Nash (minimax) de variantes de reglas del juego
+
+Cualquier variante definida con una relación "vence a" entre opciones, como
+`GameChoice.beats`, es un juego de suma cero: cada ronda vale +1 para quien gana,
+-1 para quien pierde y 0 en empate. Este módulo construye la matriz de
+resultados de la variante y resuelve el juego matricial con programación lineal
+(método símplex), obteniendo la estrategia mixta de equilibrio de cada
+jugador y el valor del juego. Una variante equilibrada tiene valor 0.
+
+Los resultados se guardan en una caché LRU acotada por el hash de la matriz, de
+modo que volver a analizar la misma variante no repite el cálculo. Con `fractions.Fraction` en
+la matriz la solución es exacta; con números de punto flotante y numpy
+instalado, cada pivote se hace con operaciones vectorizadas sobre la tabla.
+"""
+
+import hashlib
+from fractions import Fraction
+from functools import lru_cache
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple, TypeVar, Union
+
+from .game_enums import GameChoice
+
+T = TypeVar("T")
+
+# Pago en coma flotante o exacto (los enteros valen como float)
+Payoff = Union[float, Fraction]
+
+Matrix = Sequence[Sequence[Payoff]]
+
+_EPSILON = 1e-12
+
+# Pivotes seguidos sin mejora antes de cambiar a la regla de Bland
+_MAX_DEGENERATE_PIVOTS = 50
+
+# Matrices distintas cuya solución se conserva en la caché
+_CACHE_SIZE = 256
+
+# Escala de la perturbación del término independiente en el símplex vectorizado
+_PERTURBATION = 1e-9
+
+
+class EquilibriumSolution(NamedTuple):
+    """Solución de un juego matricial de suma cero."""
+
+    row_strategy: Tuple[Payoff, ...]
+    """Estrategia de equilibrio del jugador de las filas"""
+
+    column_strategy: Tuple[Payoff, ...]
+    """Estrategia de equilibrio del jugador de las columnas"""
+
+    value: Payoff
+    """Ganancia esperada del jugador de las filas en el equilibrio"""
+
+
+def outcome_matrix(choices: Sequence[T], beats: Callable[[T, T], bool]) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Construye la matriz de resultados de una variante de reglas.
+
+    Args:
+        choices: Opciones de la variante
+        beats: Función que indica si la primera opción vence a la segunda
+
+    Returns:
+        Tuple[Tuple[int, ...], ...]: +1 si la fila vence a la columna, -1 si
+        pierde y 0 si ninguna vence a la otra
+    """
+    return tuple(
+        tuple(1 if beats(a, b) else -1 if beats(b, a) else 0 for b in choices) for a in choices
+    )
+
+
+def game_choice_matrix() -> Tuple[Tuple[int, ...], ...]:
+    """
+    Matriz de resultados de las reglas estándar de GameChoice.
+
+    Returns:
+        Tuple[Tuple[int, ...], ...]: Matriz 5x5 en el orden de GameChoice
+    """
+    return outcome_matrix(tuple(GameChoice), GameChoice.beats)
+
+
+def matrix_key(matrix: Matrix) -> str:
+    """
+    Hash estable de una matriz, usado como clave de la caché.
+
+    Args:
+        matrix: Matriz de pagos
+
+    Returns:
+        str: Resumen SHA-256 en hexadecimal
+    """
+    digest = hashlib.sha256()
+    for row in matrix:
+        digest.update(repr(tuple(row)).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _cached_solution(key: str, matrix: Tuple[Tuple[Payoff, ...], ...]) -> EquilibriumSolution:
+    """
+    Resuelve y guarda la solución de una matriz.
+
+    La clave distingue matrices que sólo difieren en el tipo de sus valores
+    (1 y Fraction(1) son iguales para la caché, pero no para `matrix_key`).
+    """
+    exact = any(isinstance(value, Fraction) for row in matrix for value in row)
+    solution = None if exact else _simplex_solve_numpy(matrix)
+    if solution is None:
+        solution = _simplex_solve(matrix)
+    return solution
+
+
+def clear_cache() -> None:
+    """Vacía la caché de soluciones."""
+    _cached_solution.cache_clear()
+
+
+def solve_zero_sum(matrix: Matrix) -> EquilibriumSolution:
+    """
+    Resuelve un juego matricial de suma cero.
+
+    El jugador de las filas maximiza y el de las columnas minimiza el pago de la
+    matriz. Tras desplazar los pagos para que sean positivos, la estrategia de
+    las columnas sale del programa lineal max Σy sujeto a B·y ≤ 1, y ≥ 0, y la de
+    las filas de las variables duales de ese mismo programa.
+
+    Args:
+        matrix: Pagos para el jugador de las filas
+
+    Returns:
+        EquilibriumSolution: Estrategias de equilibrio y valor del juego
+
+    Raises:
+        ValueError: Si la matriz está vacía o no es rectangular
+    """
+    if not matrix or not matrix[0]:
+        raise ValueError("La matriz de pagos no puede estar vacía.")
+    columns = len(matrix[0])
+    if any(len(row) != columns for row in matrix):
+        raise ValueError("La matriz de pagos debe ser rectangular.")
+
+    return _cached_solution(matrix_key(matrix), tuple(tuple(row) for row in matrix))
+
+
+def _choose_entering(objective: Sequence[Payoff], stalled: int) -> Optional[int]:
+    """
+    Elige la variable que entra a la base.
+
+    Usa la regla de Dantzig (coste reducido más negativo) y, tras muchos
+    pivotes degenerados seguidos, la regla de Bland para evitar ciclos.
+    """
+    candidates = range(len(objective) - 1)
+    if stalled < _MAX_DEGENERATE_PIVOTS:
+        entering = min(candidates, key=objective.__getitem__)
+        return entering if objective[entering] < -_EPSILON else None
+    return next((j for j in candidates if objective[j] < -_EPSILON), None)
+
+
+def _simplex_solve_numpy(matrix: Matrix) -> Optional[EquilibriumSolution]:
+    """Símplex de tabla vectorizado; devuelve None si numpy no está disponible."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    payoff = np.asarray(matrix, dtype=np.float64)
+    rows, columns = payoff.shape
+    shift = 1.0 - payoff.min()
+    tableau = np.zeros((rows + 1, columns + rows + 1))
+    tableau[:rows, :columns] = payoff + shift
+    tableau[:rows, columns:columns + rows] = np.eye(rows)
+    # Los juegos simétricos son muy degenerados: una perturbación mínima del
+    # término independiente rompe los empates del test de cociente
+    tableau[:rows, -1] = 1.0 + _PERTURBATION * np.arange(1, rows + 1) / rows
+    tableau[rows, :columns] = -1.0
+    basis = np.arange(columns, columns + rows)
+
+    stalled = 0
+    while True:
+        objective = tableau[rows, :-1]
+        if stalled < _MAX_DEGENERATE_PIVOTS:
+            entering = int(np.argmin(objective))
+            if objective[entering] >= -_EPSILON:
+                break
+        else:
+            negative = np.flatnonzero(objective < -_EPSILON)
+            if not len(negative):
+                break
+            entering = int(negative[0])
+
+        column = tableau[:rows, entering]
+        positive = column > _EPSILON
+        ratios = np.full(rows, np.inf)
+        ratios[positive] = tableau[:rows, -1][positive] / column[positive]
+        best_ratio = ratios.min()
+        ties = np.flatnonzero(ratios <= best_ratio + _EPSILON)
+        leaving = int(ties[np.argmin(basis[ties])])
+
+        tableau[leaving] /= tableau[leaving, entering]
+        factors = tableau[:, entering].copy()
+        factors[leaving] = 0.0
+        tableau -= np.outer(factors, tableau[leaving])
+        basis[leaving] = entering
+        stalled = stalled + 1 if best_ratio <= _EPSILON else 0
+
+    # La base óptima se reutiliza con el término independiente sin perturbar:
+    # las columnas de holgura guardan la inversa de la base
+    solution = tableau[:rows, columns:columns + rows].sum(axis=1)
+    in_columns = basis < columns
+    total = solution[in_columns].sum()
+    column_strategy = np.zeros(columns)
+    column_strategy[basis[in_columns]] = np.clip(solution[in_columns], 0.0, None) / total
+    row_strategy = tableau[rows, columns:columns + rows] / total
+    return EquilibriumSolution(
+        tuple(float(p) for p in row_strategy),
+        tuple(float(p) for p in column_strategy),
+        float(1.0 / total - shift),
+    )
+
+
+def _simplex_solve(matrix: Matrix) -> EquilibriumSolution:
+    """Resuelve el programa lineal del juego con el símplex de tabla en Python puro."""
+    rows = len(matrix)
+    columns = len(matrix[0])
+    one = matrix[0][0] ** 0
+    zero = one - one
+    shift = one - min(min(row) for row in matrix)
+
+    # Tabla: variables y_0..y_{n-1}, holguras s_0..s_{m-1} y término independiente
+    tableau: List[List[Payoff]] = []
+    for i, row in enumerate(matrix):
+        line = [value + shift for value in row] + [zero] * rows + [one]
+        line[columns + i] = one
+        tableau.append(line)
+    objective: List[Payoff] = [-one] * columns + [zero] * (rows + 1)
+    basis = [columns + i for i in range(rows)]
+
+    stalled = 0
+    while True:
+        entering = _choose_entering(objective, stalled)
+        if entering is None:
+            break
+
+        leaving: Optional[int] = None
+        best_ratio: Optional[Payoff] = None
+        for i in range(rows):
+            coefficient = tableau[i][entering]
+            if coefficient > _EPSILON:
+                ratio = tableau[i][-1] / coefficient
+                if (
+                    leaving is None
+                    or best_ratio is None
+                    or ratio < best_ratio - _EPSILON
+                    or (ratio <= best_ratio + _EPSILON and basis[i] < basis[leaving])
+                ):
+                    leaving, best_ratio = i, ratio
+        # Con pagos positivos el programa está acotado, siempre hay fila pivote
+        assert leaving is not None and best_ratio is not None
+
+        pivot_row = tableau[leaving]
+        pivot = pivot_row[entering]
+        pivot_row[:] = [value / pivot for value in pivot_row]
+        for line in tableau + [objective]:
+            if line is pivot_row:
+                continue
+            factor = line[entering]
+            if factor:
+                line[:] = [value - factor * pivot_value for value, pivot_value in zip(line, pivot_row)]
+        basis[leaving] = entering
+        stalled = stalled + 1 if best_ratio <= _EPSILON else 0
+
+    total = objective[-1]
+    column_strategy = [zero] * columns
+    for i, variable in enumerate(basis):
+        if variable < columns:
+            column_strategy[variable] = tableau[i][-1] / total
+    row_strategy = [objective[columns + i] / total for i in range(rows)]
+    value = one / total - shift
+    return EquilibriumSolution(tuple(row_strategy), tuple(column_strategy), value)
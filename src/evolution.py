@@ -0,0 +1,489 @@
+"""
+Búsqueda evolutiva de estrategias para la computadora
+
+Un algoritmo genético busca estrategias que ganen muchas partidas contra una
+población de jugadores (perfiles de estrategia mixta, p. ej. los integrados o
+los cargados con `strategies.load_profiles`). Los candidatos son estrategias
+mixtas (`MixedGenome`) o pequeñas máquinas de estados finitos
+(`MachineGenome`) y en cada generación se seleccionan por torneo, se cruzan y
+se mutan.
+
+La aptitud de un candidato es la proporción de partidas sin interfaz
+(`simulation.play_match`) que gana la computadora. Además de los perfiles de
+estrategia mixta, que no recuerdan nada, los rivales incluyen por defecto
+máquinas reactivas (`REACTIVE_OPPONENTS`) que responden a la última elección de
+la computadora, de modo que las máquinas no se optimizan sólo contra rivales
+sin memoria.
+
+La selección usa una semilla nueva por generación, pero el mejor genoma se
+elige por su aptitud en una evaluación fija (misma semilla en todas las
+generaciones): así la mejor aptitud no es la de la evaluación más afortunada.
+Con `jobs > 1` las
+evaluaciones se reparten en un pool de procesos y cada trabajador escribe su
+resultado directamente en un arreglo de memoria compartida, sin devolver
+objetos serializados al proceso principal.
+
+Búsqueda:
+    python -m src.evolution --generations 30 --jobs 4 --output perfil.json
+"""
+
+import json
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Final, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .game import GameEngine
+from .simulation import play_match
+from .strategies import (
+    BUILTIN_STRATEGIES,
+    CHOICES,
+    ComputerStrategy,
+    FiniteStateStrategy,
+    MixedStrategy,
+    load_profiles,
+)
+
+KINDS = ("mixed", "machine")
+
+DEFAULT_POPULATION = 40
+DEFAULT_GENERATIONS = 30
+DEFAULT_MATCHES = 20
+DEFAULT_STATES = 4
+
+# Tamaño de los torneos de selección
+_TOURNAMENT = 3
+
+# Bytes de cada aptitud en el arreglo compartido (float64)
+_SCORE_FORMAT: Final = "d"
+_SCORE_SIZE = 8
+
+
+class MixedGenome(NamedTuple):
+    """Genoma de una estrategia mixta: un peso por opción."""
+
+    weights: Tuple[float, ...]
+
+    def strategy(self, rng: Optional[random.Random] = None) -> ComputerStrategy:
+        """Construye la estrategia descrita por el genoma."""
+        return MixedStrategy(self.weights, name="evolucionada", rng=rng)
+
+
+class MachineGenome(NamedTuple):
+    """Genoma de una máquina de estados: salida y transiciones de cada estado."""
+
+    outputs: Tuple[int, ...]
+    transitions: Tuple[Tuple[int, ...], ...]
+
+    def strategy(self, rng: Optional[random.Random] = None) -> ComputerStrategy:
+        """Construye la estrategia descrita por el genoma."""
+        return FiniteStateStrategy(self.outputs, self.transitions, name="evolucionada")
+
+
+Genome = Union[MixedGenome, MachineGenome]
+
+
+def _reactive_rival(response: Callable[[int], int]) -> MachineGenome:
+    """Máquina cuyo estado es la última elección del rival y lanza `response(estado)`."""
+    states = range(len(CHOICES))
+    return MachineGenome(
+        tuple(response(state) for state in states),
+        tuple(tuple(states) for _ in states),
+    )
+
+
+def _beater(index: int) -> int:
+    """Primera opción (orden de GameChoice) que vence a la opción `index`."""
+    return next(j for j, choice in enumerate(CHOICES) if choice.beats(CHOICES[index]))
+
+
+# Rivales reactivos: repiten la última elección de la computadora o lanzan lo que la vence
+REACTIVE_OPPONENTS: Tuple[MachineGenome, ...] = (
+    _reactive_rival(lambda last: last),
+    _reactive_rival(_beater),
+)
+
+
+class EvolutionResult(NamedTuple):
+    """Resultado de una búsqueda evolutiva."""
+
+    best: Genome
+    """Mejor genoma encontrado"""
+
+    fitness: float
+    """Proporción de partidas que gana el mejor genoma en la evaluación fija"""
+
+    history: Tuple[float, ...]
+    """Aptitud en la evaluación fija del mejor candidato de cada generación"""
+
+
+def random_genome(kind: str, rng: random.Random, states: int = DEFAULT_STATES) -> Genome:
+    """
+    Genera un genoma al azar.
+
+    Args:
+        kind: "mixed" o "machine"
+        rng: Generador aleatorio
+        states: Estados de las máquinas
+
+    Returns:
+        Genome: Genoma nuevo
+
+    Raises:
+        ValueError: Si el tipo de genoma no existe
+    """
+    if kind == "mixed":
+        return MixedGenome(tuple(rng.random() + 1e-6 for _ in CHOICES))
+    if kind == "machine":
+        return MachineGenome(
+            tuple(rng.randrange(len(CHOICES)) for _ in range(states)),
+            tuple(tuple(rng.randrange(states) for _ in CHOICES) for _ in range(states)),
+        )
+    raise ValueError(f"Tipo de genoma desconocido: {kind}. Opciones: {', '.join(KINDS)}")
+
+
+def crossover(first: Genome, second: Genome, rng: random.Random) -> Genome:
+    """
+    Cruza dos genomas del mismo tipo gen a gen.
+
+    En las máquinas cada estado se hereda completo (salida y transiciones) de
+    uno de los padres para no romper su comportamiento.
+
+    Args:
+        first: Primer padre
+        second: Segundo padre
+        rng: Generador aleatorio
+
+    Returns:
+        Genome: Hijo
+
+    Raises:
+        TypeError: Si los padres son de tipos distintos
+    """
+    if isinstance(first, MixedGenome) and isinstance(second, MixedGenome):
+        return MixedGenome(tuple(
+            a if rng.random() < 0.5 else b for a, b in zip(first.weights, second.weights)
+        ))
+    if isinstance(first, MachineGenome) and isinstance(second, MachineGenome):
+        parents = [first if rng.random() < 0.5 else second for _ in first.outputs]
+        return MachineGenome(
+            tuple(parent.outputs[state] for state, parent in enumerate(parents)),
+            tuple(parent.transitions[state] for state, parent in enumerate(parents)),
+        )
+    raise TypeError("Sólo se cruzan genomas del mismo tipo.")
+
+
+def mutate(genome: Genome, rng: random.Random, rate: float) -> Genome:
+    """
+    Muta cada gen con probabilidad `rate`.
+
+    Args:
+        genome: Genoma original
+        rng: Generador aleatorio
+        rate: Probabilidad de mutación por gen
+
+    Returns:
+        Genome: Genoma mutado
+    """
+    if isinstance(genome, MixedGenome):
+        weights = tuple(
+            weight * rng.lognormvariate(0.0, 0.5) if rng.random() < rate else weight
+            for weight in genome.weights
+        )
+        return MixedGenome(weights if sum(weights) > 0 else genome.weights)
+    states = len(genome.outputs)
+    return MachineGenome(
+        tuple(rng.randrange(len(CHOICES)) if rng.random() < rate else output for output in genome.outputs),
+        tuple(
+            tuple(rng.randrange(states) if rng.random() < rate else target for target in row)
+            for row in genome.transitions
+        ),
+    )
+
+
+def evaluate(
+    genome: Genome,
+    opponents: Sequence[Sequence[float]],
+    matches: int,
+    max_score: int,
+    seed: int,
+    reactive: Sequence[MachineGenome] = (),
+) -> float:
+    """
+    Aptitud de un genoma: proporción de partidas que gana como computadora.
+
+    Args:
+        genome: Genoma a evaluar
+        opponents: Pesos de cada jugador de la población rival
+        matches: Partidas contra cada rival
+        max_score: Puntuación necesaria para ganar cada partida
+        seed: Semilla de la evaluación
+        reactive: Máquinas rivales que reaccionan a las elecciones de la computadora
+
+    Returns:
+        float: Proporción de partidas ganadas, entre 0 y 1
+    """
+    rng = random.Random(seed)
+    game = GameEngine(max_score, genome.strategy(rng))
+    users: List[ComputerStrategy] = [MixedStrategy(weights, name="rival", rng=rng) for weights in opponents]
+    users.extend(machine.strategy() for machine in reactive)
+    wins = 0
+    for user in users:
+        for _ in range(matches):
+            wins += play_match(game, user).computer_won
+    return wins / (len(users) * matches)
+
+
+# Estado de cada proceso trabajador, fijado por _init_worker
+_worker_memory: Optional[shared_memory.SharedMemory] = None
+_worker_scores: Optional["memoryview[float]"] = None
+_worker_config: Tuple[Sequence[Sequence[float]], int, int, Sequence[MachineGenome]] = ((), 0, 0, ())
+
+
+def _scores_view(memory: shared_memory.SharedMemory) -> "memoryview[float]":
+    """Vista float64 del arreglo compartido de aptitudes."""
+    buffer = memory.buf
+    assert buffer is not None
+    return buffer.cast(_SCORE_FORMAT)
+
+
+def _init_worker(
+    name: str,
+    opponents: Sequence[Sequence[float]],
+    matches: int,
+    max_score: int,
+    reactive: Sequence[MachineGenome],
+) -> None:
+    """Conecta el trabajador al arreglo compartido de aptitudes."""
+    global _worker_memory, _worker_scores, _worker_config
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    _worker_scores = _scores_view(_worker_memory)
+    _worker_config = (opponents, matches, max_score, reactive)
+
+
+def _evaluate_into(index: int, genome: Genome, seed: int) -> None:
+    """Evalúa un genoma y escribe su aptitud en la posición `index` del arreglo compartido."""
+    assert _worker_scores is not None
+    opponents, matches, max_score, reactive = _worker_config
+    _worker_scores[index] = evaluate(genome, opponents, matches, max_score, seed=seed, reactive=reactive)
+
+
+class EvolutionarySearch:
+    """
+    Algoritmo genético sobre estrategias de la computadora.
+
+    Uso:
+        search = EvolutionarySearch(kind="machine", jobs=4, seed=1)
+        result = search.run(generations=30)
+        result.best.strategy()
+    """
+
+    def __init__(
+        self,
+        kind: str = "mixed",
+        population_size: int = DEFAULT_POPULATION,
+        opponents: Optional[Sequence[Sequence[float]]] = None,
+        matches: int = DEFAULT_MATCHES,
+        max_score: int = 3,
+        elite: int = 2,
+        mutation_rate: float = 0.2,
+        states: int = DEFAULT_STATES,
+        jobs: int = 1,
+        seed: Optional[int] = None,
+        reactive_opponents: Sequence[MachineGenome] = REACTIVE_OPPONENTS,
+    ):
+        """
+        Configura la búsqueda.
+
+        Args:
+            kind: "mixed" (estrategias mixtas) o "machine" (máquinas de estados)
+            population_size: Candidatos por generación
+            opponents: Pesos de los jugadores rivales (por defecto, las
+                estrategias integradas)
+            matches: Partidas contra cada rival por evaluación
+            max_score: Puntuación necesaria para ganar cada partida
+            elite: Mejores candidatos que pasan intactos a la siguiente generación
+            mutation_rate: Probabilidad de mutación por gen
+            states: Estados de las máquinas
+            jobs: Procesos para evaluar la aptitud (1 evalúa en este proceso)
+            seed: Semilla para reproducir la búsqueda
+            reactive_opponents: Máquinas rivales que reaccionan a la
+                computadora (por defecto, `REACTIVE_OPPONENTS`; vacío para
+                evaluar sólo contra estrategias mixtas)
+
+        Raises:
+            ValueError: Si algún parámetro no es válido
+        """
+        if kind not in KINDS:
+            raise ValueError(f"Tipo de genoma desconocido: {kind}. Opciones: {', '.join(KINDS)}")
+        if population_size < 2 or not 0 <= elite < population_size:
+            raise ValueError("La población necesita al menos 2 candidatos y menos élite que candidatos.")
+        if matches < 1 or jobs < 1 or states < 1:
+            raise ValueError("Las partidas, los procesos y los estados deben ser al menos 1.")
+        self.kind = kind
+        self.population_size = population_size
+        self.opponents = tuple(
+            tuple(weights) for weights in (opponents if opponents is not None else BUILTIN_STRATEGIES.values())
+        )
+        self.reactive_opponents = tuple(reactive_opponents)
+        if not self.opponents and not self.reactive_opponents:
+            raise ValueError("Se necesita al menos un rival.")
+        self.matches = matches
+        self.max_score = max_score
+        self.elite = elite
+        self.mutation_rate = mutation_rate
+        self.states = states
+        self.jobs = jobs
+        self.rng = random.Random(seed)
+        # Semilla de la evaluación fija con la que se elige el mejor genoma
+        self.validation_seed = self.rng.getrandbits(64)
+
+    def run(self, generations: int = DEFAULT_GENERATIONS) -> EvolutionResult:
+        """
+        Ejecuta la búsqueda.
+
+        Args:
+            generations: Generaciones a evolucionar
+
+        Returns:
+            EvolutionResult: Mejor genoma, su aptitud y la evolución de la mejor aptitud
+        """
+        population = [random_genome(self.kind, self.rng, self.states) for _ in range(self.population_size)]
+        best: Genome = population[0]
+        best_fitness = -1.0
+        history: List[float] = []
+        validated: Dict[Genome, float] = {}
+
+        memory = None
+        pool = None
+        if self.jobs > 1:
+            memory = shared_memory.SharedMemory(create=True, size=self.population_size * _SCORE_SIZE)
+            pool = ProcessPoolExecutor(
+                max_workers=self.jobs,
+                initializer=_init_worker,
+                initargs=(memory.name, self.opponents, self.matches, self.max_score, self.reactive_opponents),
+            )
+        try:
+            for _ in range(generations):
+                scores = self._evaluate(population, pool, memory)
+                ranked = sorted(range(len(population)), key=scores.__getitem__, reverse=True)
+                leader = population[ranked[0]]
+                if leader not in validated:
+                    validated[leader] = self._fitness(leader, self.validation_seed)
+                history.append(validated[leader])
+                if validated[leader] > best_fitness:
+                    best, best_fitness = leader, validated[leader]
+                population = self._next_generation(population, scores, ranked)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            if memory is not None:
+                memory.close()
+                memory.unlink()
+        return EvolutionResult(best, best_fitness, tuple(history))
+
+    def _evaluate(
+        self,
+        population: List[Genome],
+        pool: Optional[ProcessPoolExecutor],
+        memory: Optional[shared_memory.SharedMemory],
+    ) -> List[float]:
+        """Aptitud de cada candidato, en serie o repartida en el pool."""
+        # Las semillas se sortean aquí para que el resultado no dependa de `jobs`
+        seeds = [self.rng.getrandbits(64) for _ in population]
+        if pool is None or memory is None:
+            return [self._fitness(genome, seed) for genome, seed in zip(population, seeds)]
+
+        for future in [
+            pool.submit(_evaluate_into, index, genome, seed)
+            for index, (genome, seed) in enumerate(zip(population, seeds))
+        ]:
+            future.result()
+        scores = _scores_view(memory)
+        try:
+            return list(scores)
+        finally:
+            scores.release()
+
+    def _fitness(self, genome: Genome, seed: int) -> float:
+        """Aptitud de un genoma contra todos los rivales de la búsqueda."""
+        return evaluate(
+            genome, self.opponents, self.matches, self.max_score, seed=seed, reactive=self.reactive_opponents
+        )
+
+    def _next_generation(
+        self, population: List[Genome], scores: List[float], ranked: List[int]
+    ) -> List[Genome]:
+        """Élite intacta más hijos de padres elegidos por torneo, cruzados y mutados."""
+        children = [population[index] for index in ranked[:self.elite]]
+        while len(children) < self.population_size:
+            first = self._select(population, scores)
+            second = self._select(population, scores)
+            children.append(mutate(crossover(first, second, self.rng), self.rng, self.mutation_rate))
+        return children
+
+    def _select(self, population: List[Genome], scores: List[float]) -> Genome:
+        """Selección por torneo: el mejor de unos pocos candidatos al azar."""
+        contenders = self.rng.sample(range(len(population)), min(_TOURNAMENT, len(population)))
+        return population[max(contenders, key=scores.__getitem__)]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Ejecuta la búsqueda desde la línea de comandos.
+
+    Args:
+        argv: Argumentos (por defecto, sys.argv[1:])
+
+    Returns:
+        int: Código de salida
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Búsqueda evolutiva de estrategias")
+    parser.add_argument("--kind", choices=KINDS, default="mixed", help="Tipo de candidato")
+    parser.add_argument("--generations", type=int, default=DEFAULT_GENERATIONS, help="Generaciones")
+    parser.add_argument("--population", type=int, default=DEFAULT_POPULATION, help="Candidatos por generación")
+    parser.add_argument("--matches", type=int, default=DEFAULT_MATCHES, help="Partidas contra cada rival")
+    parser.add_argument("--score", type=int, default=3, help="Puntuación para ganar cada partida")
+    parser.add_argument(
+        "--opponents", default=None, metavar="ARCHIVO", help="Perfiles JSON de los jugadores rivales"
+    )
+    parser.add_argument(
+        "--no-reactive", action="store_true", help="No incluir rivales reactivos, sólo estrategias mixtas"
+    )
+    parser.add_argument("--jobs", type=int, default=1, help="Procesos para evaluar la aptitud")
+    parser.add_argument("--seed", type=int, default=None, help="Semilla aleatoria")
+    parser.add_argument(
+        "--output", default=None, metavar="ARCHIVO", help="Guardar la mejor estrategia mixta como perfil JSON"
+    )
+    args = parser.parse_args(argv)
+    if args.output and args.kind != "mixed":
+        parser.error("--output sólo admite estrategias mixtas (--kind mixed)")
+
+    opponents = list(load_profiles(args.opponents).values()) if args.opponents else None
+    search = EvolutionarySearch(
+        kind=args.kind,
+        population_size=args.population,
+        opponents=opponents,
+        matches=args.matches,
+        max_score=args.score,
+        jobs=args.jobs,
+        seed=args.seed,
+        reactive_opponents=() if args.no_reactive else REACTIVE_OPPONENTS,
+    )
+    result = search.run(args.generations)
+
+    print(f"Mejor aptitud: {result.fitness:.1%} de partidas ganadas")
+    print(f"Mejor candidato: {result.best}")
+    if args.output and isinstance(result.best, MixedGenome):
+        total = sum(result.best.weights)
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump({"evolucionada": [weight / total for weight in result.best.weights]}, handle, indent=2)
+        print(f"Perfil escrito en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
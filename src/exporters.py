@@ -0,0 +1,334 @@
+"""
+Exportación de rondas y partidas a NDJSON o CSV
+
+Los históricos de partidas se exportan a millones de registros, y un
+`json.dumps` más un `print` por registro es el cuello de botella. `RecordExporter`
+escribe cualquier NamedTuple (`RoundRecord`, `MatchResult`...) así:
+
+- Al ver el primer registro construye una plantilla `%` de la línea completa,
+  con los nombres de campo y la puntuación de JSON o CSV ya escritos
+  (``{"round":%d,"user_choice":%s,...}``).
+- Los valores de los Enum (`GameChoice`, `GameResult`) se codifican una sola
+  vez y se buscan en una tabla; los enteros entran tal cual en la plantilla.
+- Un registro cuyos campos no tienen los tipos del primero (un flotante o un
+  None donde había un entero) no usa la plantilla: se codifica campo a campo.
+- Las líneas se acumulan y se escriben por bloques de `buffer_records`
+  registros, con una sola codificación UTF-8 y una sola llamada a `write` por
+  bloque.
+- Con `compress=True` (o si la ruta termina en ``.gz``) la salida va
+  comprimida con gzip.
+
+Uso:
+    with RecordExporter("partidas.ndjson.gz") as exporter:
+        exporter.write_many(iter_job_matches(job))
+"""
+
+import csv
+import gzip
+import io
+import json
+from enum import Enum
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+FORMATS = ("ndjson", "csv")
+DEFAULT_BUFFER_RECORDS = 8192
+
+# Búfer del archivo subyacente: cada bloque de registros cabe en una escritura
+_FILE_BUFFER = 1 << 20
+
+# Flujo binario de salida o de entrada: propio, ajeno o de gzip
+_Stream = Union[IO[bytes], gzip.GzipFile]
+# Conversores de campo de una plantilla: (posición, función)
+_Converters = Tuple[Tuple[int, Callable[[Any], Any]], ...]
+
+
+def _csv_text(value: Any) -> str:
+    """Campo CSV entre comillas sólo si hace falta (RFC 4180)."""
+    text = str(value)
+    if any(character in text for character in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _json_text(value: Any) -> str:
+    """Valor JSON de un campo sin plantilla específica."""
+    return json.dumps(value, ensure_ascii=False)
+
+
+class _Template(NamedTuple):
+    """Plantilla de línea de un tipo de registro."""
+
+    record_type: type
+    field_types: Tuple[type, ...]
+    line: str
+    converters: _Converters
+    header: Optional[str]
+    generic_line: str
+    encode: Callable[[Any], str]
+
+    def unpack(self) -> Tuple[type, Tuple[type, ...], str, _Converters, Callable[[Tuple[Any, ...]], str]]:
+        """Campos que usa el bucle de escritura, para guardarlos en variables locales."""
+        return self.record_type, self.field_types, self.line, self.converters, self.generic
+
+    def generic(self, record: Tuple[Any, ...]) -> str:
+        """Línea de un registro con otros tipos de campo, codificado campo a campo."""
+        return self.generic_line % tuple(
+            self.encode(value.value if isinstance(value, Enum) else value) for value in record
+        )
+
+
+def _line(fields: Sequence[str], placeholders: Sequence[str], format: str) -> str:
+    """Línea `%` con los nombres de campo y la puntuación del formato."""
+    # Los nombres de campo son identificadores: no llevan "%", comillas ni comas
+    if format == "ndjson":
+        members = (f'"{name}":{placeholder}' for name, placeholder in zip(fields, placeholders))
+        return "{" + ",".join(members) + "}\n"
+    return ",".join(placeholders) + "\n"
+
+
+def _build_template(record: Tuple[Any, ...], format: str) -> _Template:
+    """Plantilla de línea, con los valores de los Enum ya codificados."""
+    fields: Sequence[str] = getattr(record, "_fields", ())
+    if not fields:
+        raise TypeError(f"Sólo se exportan NamedTuple, no {type(record).__name__}.")
+    encode = _json_text if format == "ndjson" else _csv_text
+    placeholders: List[str] = []
+    converters: List[Tuple[int, Callable[[Any], Any]]] = []
+    for position, value in enumerate(record):
+        if isinstance(value, Enum):
+            table: Dict[Any, str] = {member: encode(member.value) for member in type(value)}
+            converters.append((position, table.__getitem__))
+            placeholders.append("%s")
+        elif isinstance(value, bool) or value is None:
+            # bool es subclase de int: se resuelve antes que los enteros
+            converters.append((position, encode if format == "ndjson" else str))
+            placeholders.append("%s")
+        elif isinstance(value, int):
+            placeholders.append("%d")
+        elif isinstance(value, float):
+            converters.append((position, repr))
+            placeholders.append("%s")
+        else:
+            converters.append((position, encode))
+            placeholders.append("%s")
+    header = ",".join(fields) + "\n" if format == "csv" else None
+    return _Template(
+        type(record),
+        tuple(map(type, record)),
+        _line(fields, placeholders, format),
+        tuple(converters),
+        header,
+        _line(fields, ["%s"] * len(fields), format),
+        encode,
+    )
+
+
+class RecordExporter:
+    """
+    Escribe registros NamedTuple en NDJSON o CSV por bloques.
+
+    Todos los registros de un exportador deben ser del mismo tipo; la
+    plantilla se construye con el primero, y los registros cuyos campos
+    tienen otros tipos se codifican campo a campo.
+    """
+
+    def __init__(
+        self,
+        target: Union[str, IO[bytes]],
+        format: Optional[str] = None,
+        compress: Optional[bool] = None,
+        buffer_records: int = DEFAULT_BUFFER_RECORDS,
+    ):
+        """
+        Abre la salida.
+
+        Args:
+            target: Ruta del archivo o flujo binario ya abierto (no se cierra)
+            format: "ndjson" o "csv" (por defecto, según la extensión de la
+                ruta; si no, "ndjson")
+            compress: Comprimir con gzip (por defecto, si la ruta termina en .gz)
+            buffer_records: Registros acumulados entre escrituras
+
+        Raises:
+            ValueError: Si el formato no existe o `buffer_records` no es positivo
+        """
+        path = target if isinstance(target, str) else None
+        stem = path[:-3] if path and path.endswith(".gz") else path
+        if format is None:
+            format = "csv" if stem and stem.endswith(".csv") else "ndjson"
+        if format not in FORMATS:
+            raise ValueError(f"Formato desconocido: {format}. Opciones: {', '.join(FORMATS)}")
+        if buffer_records < 1:
+            raise ValueError("El búfer debe admitir al menos un registro.")
+        if compress is None:
+            compress = bool(path and path.endswith(".gz"))
+        self.format = format
+        self.buffer_records = buffer_records
+        self.records = 0
+        self._owned: List[_Stream] = []
+        raw: _Stream
+        if isinstance(target, str):
+            raw = open(target, "wb", buffering=_FILE_BUFFER)
+            self._owned.append(raw)
+        else:
+            raw = target
+        if compress:
+            raw = gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6)
+            self._owned.insert(0, raw)
+        self._stream: Optional[_Stream] = raw
+        self._template: Optional[_Template] = None
+        self._pending: List[str] = []
+
+    def __enter__(self) -> "RecordExporter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _prepare(self, record: Tuple[Any, ...]) -> _Template:
+        template = _build_template(record, self.format)
+        self._template = template
+        if template.header is not None:
+            self._pending.append(template.header)
+        return template
+
+    def write(self, record: Tuple[Any, ...]) -> None:
+        """
+        Añade un registro.
+
+        Args:
+            record: NamedTuple del mismo tipo que los anteriores
+
+        Raises:
+            TypeError: Si el registro no es un NamedTuple o cambia de tipo
+        """
+        self.write_many((record,))
+
+    def write_many(self, records: Iterable[Tuple[Any, ...]]) -> int:
+        """
+        Añade registros de un iterable, que se consume de forma perezosa.
+
+        Args:
+            records: NamedTuple del mismo tipo (por ejemplo, un generador
+                `iter_rounds` o `iter_matches`)
+
+        Returns:
+            int: Registros escritos
+
+        Raises:
+            TypeError: Si algún registro no es un NamedTuple o cambia de tipo
+        """
+        template = self._template
+        pending = self._pending
+        written = 0
+        record_type: Optional[type] = None
+        field_types: Tuple[type, ...] = ()
+        line = ""
+        converters: _Converters = ()
+        generic: Callable[[Tuple[Any, ...]], str] = str
+        if template is not None:
+            record_type, field_types, line, converters, generic = template.unpack()
+        for record in records:
+            if type(record) is not record_type:
+                if template is not None:
+                    raise TypeError(f"Registro {type(record).__name__} en una exportación de "
+                                    f"{template.record_type.__name__}.")
+                template = self._prepare(record)
+                record_type, field_types, line, converters, generic = template.unpack()
+            if tuple(map(type, record)) != field_types:
+                pending.append(generic(record))
+            elif converters:
+                values = list(record)
+                for position, convert in converters:
+                    values[position] = convert(values[position])
+                pending.append(line % tuple(values))
+            else:
+                pending.append(line % record)
+            written += 1
+            if len(pending) >= self.buffer_records:
+                self._flush_pending()
+        self.records += written
+        return written
+
+    def _flush_pending(self) -> None:
+        """Escribe el bloque acumulado con una sola codificación."""
+        if self._pending:
+            self._open_stream().write("".join(self._pending).encode("utf-8"))
+            self._pending.clear()
+
+    def flush(self) -> None:
+        """Escribe los registros pendientes y vacía los búferes."""
+        self._flush_pending()
+        self._open_stream().flush()
+
+    def _open_stream(self) -> _Stream:
+        if self._stream is None:
+            raise ValueError("El exportador ya está cerrado.")
+        return self._stream
+
+    def close(self) -> None:
+        """Escribe lo pendiente y cierra la compresión y el archivo propios."""
+        if self._stream is None:
+            return
+        self.flush()
+        for stream in self._owned:
+            stream.close()
+        self._stream = None
+
+
+def export_records(
+    records: Iterable[Tuple[Any, ...]],
+    target: Union[str, IO[bytes]],
+    format: Optional[str] = None,
+    compress: Optional[bool] = None,
+) -> int:
+    """
+    Exporta registros a un archivo o flujo en una sola llamada.
+
+    Args:
+        records: NamedTuple del mismo tipo
+        target: Ruta del archivo o flujo binario
+        format: "ndjson" o "csv" (por defecto, según la extensión)
+        compress: Comprimir con gzip (por defecto, si la ruta termina en .gz)
+
+    Returns:
+        int: Registros escritos
+    """
+    with RecordExporter(target, format, compress) as exporter:
+        return exporter.write_many(records)
+
+
+def read_records(source: Union[str, IO[bytes]], format: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lee una exportación como diccionarios, para comprobaciones y pruebas.
+
+    Los valores CSV se devuelven como texto.
+
+    Args:
+        source: Ruta del archivo (descomprime si termina en .gz) o flujo binario
+        format: "ndjson" o "csv" (por defecto, según la extensión)
+
+    Yields:
+        Dict[str, Any]: Un diccionario por registro
+    """
+    path = source if isinstance(source, str) else None
+    stem = path[:-3] if path and path.endswith(".gz") else path
+    if format is None:
+        format = "csv" if stem and stem.endswith(".csv") else "ndjson"
+    raw: _Stream
+    if isinstance(source, str):
+        raw = gzip.GzipFile(source, "rb") if source.endswith(".gz") else open(source, "rb")
+    else:
+        raw = source
+    text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    try:
+        if format == "csv":
+            yield from csv.DictReader(text)
+        else:
+            for line in text:
+                yield json.loads(line)
+    finally:
+        if path is not None:
+            text.close()
+        else:
+            text.detach()
@@ -5,36 +5,99 @@ Este módulo contiene la lógica principal del juego implementada
 usando Programación Orientada a Objetos.
 """
 
-import random
-from typing import Tuple, Optional
+from typing import TYPE_CHECKING, Iterator, NamedTuple, Tuple, Optional
 from colorama import Fore, Back, Style, init
 
 from .game_enums import GameChoice, GameResult, GameState
+from .strategies import ComputerStrategy, UniformStrategy
 
+if TYPE_CHECKING:
+    from .odds_table import OddsTable
 
-class RockPaperScissorsGame:
+
+# Palabras que terminan la partida desde la consola
+QUIT_WORDS = frozenset(("q", "quit", "salir"))
+
+# Tope de rondas por partida: dos estrategias deterministas iguales empatan siempre
+DEFAULT_MAX_ROUNDS = 1000
+
+
+class RoundRecord(NamedTuple):
+    """Ronda jugada por `GameEngine.iter_rounds`, con el marcador tras ella."""
+
+    round: int
+    user_choice: GameChoice
+    computer_choice: GameChoice
+    result: GameResult
+    user_score: int
+    computer_score: int
+
+
+class MatchResult(NamedTuple):
+    """Resultado de una partida sin interfaz."""
+
+    user_score: int
+    computer_score: int
+    rounds: int
+
+    @property
+    def user_won(self) -> bool:
+        """True si el usuario ganó la partida."""
+        return self.user_score > self.computer_score
+
+    @property
+    def computer_won(self) -> bool:
+        """True si la computadora ganó la partida."""
+        return self.computer_score > self.user_score
+
+_console_ready = False
+
+
+def _init_console() -> None:
+    """Inicializa colorama una sola vez por proceso."""
+    global _console_ready
+    if not _console_ready:
+        init(autoreset=True)
+        _console_ready = True
+
+
+class GameEngine:
     """
-    Clase principal que maneja la lógica del juego Piedra, Papel, Tijeras, Lagarto, Spock.
+    Estado y reglas de una partida, sin entrada ni salida por consola.
     
-    Esta clase implementa toda la funcionalidad del juego siguiendo los principios
-    de Programación Orientada a Objetos.
+    Usa `__slots__` para que cada partida viva ocupe unos pocos bytes y no
+    tenga diccionario de atributos; es la clase que usan las simulaciones y el
+    pool de objetos de `object_pool`.
     """
     
-    def __init__(self, max_score: int = 3):
+    __slots__ = ("max_score", "user_score", "computer_score", "state", "rounds_played", "strategy", "odds_table")
+    
+    def __init__(
+        self,
+        max_score: int = 3,
+        strategy: Optional[ComputerStrategy] = None,
+        odds_table: Optional["OddsTable"] = None,
+    ):
         """
-        Inicializa una nueva instancia del juego.
+        Inicializa una nueva partida.
         
         Args:
             max_score: Puntuación máxima para ganar el juego (default: 3)
+            strategy: Estrategia de la computadora (default: aleatoria uniforme)
+            odds_table: Tabla precalculada para mostrar la probabilidad de ganar
+
+        Raises:
+            ValueError: Si la tabla no incluye la estrategia de la computadora
         """
-        # Inicializar colorama para colores en consola
-        init(autoreset=True)
-        
         self.max_score = max_score
         self.user_score = 0
         self.computer_score = 0
         self.state = GameState.MENU
         self.rounds_played = 0
+        self.strategy = strategy if strategy is not None else UniformStrategy()
+        if odds_table is not None and self.strategy.name not in odds_table.strategies:
+            raise ValueError(f"La tabla de probabilidades no incluye la estrategia {self.strategy.name}.")
+        self.odds_table = odds_table
         
     def reset_game(self) -> None:
         """Reinicia el juego a su estado inicial."""
@@ -42,6 +105,163 @@ class RockPaperScissorsGame:
         self.computer_score = 0
         self.state = GameState.MENU
         self.rounds_played = 0
+        self.strategy.reset()
+        
+    def get_computer_choice(self) -> GameChoice:
+        """
+        Genera la elección de la computadora según su estrategia.
+        
+        Returns:
+            GameChoice: Elección de la computadora
+        """
+        return self.strategy.choose()
+    
+    def compare_choices(self, user_choice: GameChoice, computer_choice: GameChoice) -> GameResult:
+        """
+        Compara las elecciones del usuario y la computadora para determinar el ganador.
+        
+        Args:
+            user_choice: Elección del usuario
+            computer_choice: Elección de la computadora
+            
+        Returns:
+            GameResult: Resultado de la comparación
+        """
+        if user_choice == computer_choice:
+            return GameResult.TIE
+        elif user_choice.beats(computer_choice):
+            return GameResult.USER_WINS
+        else:
+            return GameResult.COMPUTER_WINS
+    
+    def resolve_round(self, user_choice: GameChoice, computer_choice: GameChoice) -> GameResult:
+        """
+        Resuelve una ronda sin entrada ni salida por consola.
+        
+        Compara las elecciones, actualiza el marcador y avisa a la estrategia de
+        la computadora. Es el núcleo de `play_round` y lo usan directamente las
+        simulaciones.
+        
+        Args:
+            user_choice: Elección del usuario
+            computer_choice: Elección de la computadora
+            
+        Returns:
+            GameResult: Resultado de la ronda
+        """
+        result = self.compare_choices(user_choice, computer_choice)
+        self._update_score(result)
+        self.rounds_played += 1
+        self.strategy.observe(user_choice, computer_choice)
+        return result
+    
+    def _update_score(self, result: GameResult) -> None:
+        """
+        Actualiza la puntuación basada en el resultado de la ronda.
+        
+        Args:
+            result: Resultado de la ronda
+        """
+        if result == GameResult.USER_WINS:
+            self.user_score += 1
+        elif result == GameResult.COMPUTER_WINS:
+            self.computer_score += 1
+        # No se actualiza puntuación en caso de empate
+    
+    def _check_game_over(self) -> bool:
+        """
+        Verifica si el juego ha terminado.
+        
+        Returns:
+            bool: True si el juego terminó, False en caso contrario
+        """
+        return self.user_score >= self.max_score or self.computer_score >= self.max_score
+    
+    def iter_rounds(
+        self, user_strategy: ComputerStrategy, max_rounds: int = DEFAULT_MAX_ROUNDS
+    ) -> Iterator[RoundRecord]:
+        """
+        Juega una partida sin interfaz y entrega cada ronda a medida que se juega.
+        
+        La partida empieza desde el marcador inicial y sólo avanza cuando se
+        pide la siguiente ronda, así que se puede cortar en cualquier momento
+        (por ejemplo con `itertools.islice`). Mientras el generador esté vivo,
+        el juego no debe usarse para otra cosa.
+        
+        Args:
+            user_strategy: Estrategia que decide las elecciones del usuario
+            max_rounds: Rondas tras las que la partida se corta sin ganador
+            
+        Yields:
+            RoundRecord: Elecciones, resultado y marcador de cada ronda
+        """
+        self.reset_game()
+        user_strategy.reset()
+        while not self._check_game_over() and self.rounds_played < max_rounds:
+            user_choice = user_strategy.choose()
+            computer_choice = self.get_computer_choice()
+            result = self.resolve_round(user_choice, computer_choice)
+            user_strategy.observe(computer_choice, user_choice)
+            yield RoundRecord(
+                self.rounds_played, user_choice, computer_choice, result, self.user_score, self.computer_score
+            )
+    
+    def iter_matches(
+        self,
+        user_strategy: ComputerStrategy,
+        matches: Optional[int] = None,
+        max_rounds: int = DEFAULT_MAX_ROUNDS,
+    ) -> Iterator[MatchResult]:
+        """
+        Juega partidas sin interfaz una tras otra y entrega el resultado de cada una.
+        
+        Sólo se guarda la partida en curso, así que una simulación larga ocupa
+        memoria constante. Da los mismos resultados que llamar a
+        `simulation.play_match` en bucle.
+        
+        Args:
+            user_strategy: Estrategia que decide las elecciones del usuario
+            matches: Partidas a jugar (por defecto, sin fin)
+            max_rounds: Rondas tras las que cada partida se corta sin ganador
+            
+        Yields:
+            MatchResult: Marcador final y rondas de cada partida
+        """
+        played = 0
+        while matches is None or played < matches:
+            for _ in self.iter_rounds(user_strategy, max_rounds):
+                pass
+            played += 1
+            yield MatchResult(self.user_score, self.computer_score, self.rounds_played)
+    
+
+class RockPaperScissorsGame(GameEngine):
+    """
+    Clase principal que maneja la lógica del juego Piedra, Papel, Tijeras, Lagarto, Spock.
+    
+    Esta clase implementa toda la funcionalidad del juego siguiendo los principios
+    de Programación Orientada a Objetos. Añade la interfaz de consola a
+    `GameEngine`; no declara `__slots__`, así que sus instancias admiten
+    atributos propios.
+    """
+    
+    def __init__(
+        self,
+        max_score: int = 3,
+        strategy: Optional[ComputerStrategy] = None,
+        odds_table: Optional["OddsTable"] = None,
+    ):
+        """
+        Inicializa una nueva instancia del juego.
+        
+        Args:
+            max_score: Puntuación máxima para ganar el juego (default: 3)
+            strategy: Estrategia de la computadora (default: aleatoria uniforme)
+            odds_table: Tabla precalculada para mostrar la probabilidad de ganar
+        """
+        # Inicializar colorama para colores en consola (sólo la primera vez)
+        _init_console()
+        super().__init__(max_score, strategy, odds_table)
         
     def get_user_choice(self) -> Optional[GameChoice]:
         """
@@ -57,7 +277,7 @@ class RockPaperScissorsGame:
                 choice_input = input(f"{Fore.CYAN}Selecciona tu opción (1-5, o 'q' para salir): {Style.RESET_ALL}").strip()
                 
                 # Verificar si el usuario quiere salir
-                if choice_input.lower() in ['q', 'quit', 'salir']:
+                if choice_input.lower() in QUIT_WORDS:
                     return None
                 
                 # Verificar entrada vacía
@@ -80,33 +300,6 @@ class RockPaperScissorsGame:
             except Exception as e:
                 print(f"{Fore.RED}❌ Error: {e}{Style.RESET_ALL}")
     
-    def get_computer_choice(self) -> GameChoice:
-        """
-        Genera una elección aleatoria para la computadora.
-        
-        Returns:
-            GameChoice: Elección aleatoria de la computadora
-        """
-        return random.choice(GameChoice.get_all_choices())
-    
-    def compare_choices(self, user_choice: GameChoice, computer_choice: GameChoice) -> GameResult:
-        """
-        Compara las elecciones del usuario y la computadora para determinar el ganador.
-        
-        Args:
-            user_choice: Elección del usuario
-            computer_choice: Elección de la computadora
-            
-        Returns:
-            GameResult: Resultado de la comparación
-        """
-        if user_choice == computer_choice:
-            return GameResult.TIE
-        elif user_choice.beats(computer_choice):
-            return GameResult.USER_WINS
-        else:
-            return GameResult.COMPUTER_WINS
-    
     def play_round(self) -> bool:
         """
         Juega una ronda completa del juego.
@@ -114,8 +307,9 @@ class RockPaperScissorsGame:
         Returns:
             bool: True si se debe continuar el juego, False si se debe salir
         """
-        print(f"\n{Back.BLUE}{Fore.WHITE} === RONDA {self.rounds_played + 1} === {Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}Marcador: Tú {self.user_score} - {self.computer_score} Computadora{Style.RESET_ALL}")
+        self._display_round_header()
+        if self.odds_table is not None:
+            self._display_win_odds()
         
         # Obtener elección del usuario
         user_choice = self.get_user_choice()
@@ -126,18 +320,12 @@ class RockPaperScissorsGame:
         computer_choice = self.get_computer_choice()
         
         # Mostrar elecciones
-        print(f"\n{Fore.GREEN}Tu elección: {user_choice}{Style.RESET_ALL}")
-        print(f"{Fore.MAGENTA}Computadora eligió: {computer_choice}{Style.RESET_ALL}")
+        self._display_moves(user_choice, computer_choice)
         
-        # Comparar y mostrar resultado
-        result = self.compare_choices(user_choice, computer_choice)
+        # Resolver la ronda y mostrar resultado
+        result = self.resolve_round(user_choice, computer_choice)
         self._display_round_result(result, user_choice, computer_choice)
         
-        # Actualizar puntuación
-        self._update_score(result)
-        
-        self.rounds_played += 1
-        
         # Verificar si el juego terminó
         if self._check_game_over():
             self._display_final_result()
@@ -145,6 +333,39 @@ class RockPaperScissorsGame:
             
         return True
     
+    def _display_round_header(self) -> None:
+        """Muestra el número de ronda y el marcador actual."""
+        print(f"\n{Back.BLUE}{Fore.WHITE} === RONDA {self.rounds_played + 1} === {Style.RESET_ALL}")
+        print(f"{Fore.YELLOW}Marcador: Tú {self.user_score} - {self.computer_score} Computadora{Style.RESET_ALL}")
+    
+    def _display_moves(self, user_choice: GameChoice, computer_choice: GameChoice) -> None:
+        """
+        Muestra las elecciones de la ronda.
+        
+        Args:
+            user_choice: Elección del usuario
+            computer_choice: Elección de la computadora
+        """
+        print(f"\n{Fore.GREEN}Tu elección: {user_choice}{Style.RESET_ALL}")
+        print(f"{Fore.MAGENTA}Computadora eligió: {computer_choice}{Style.RESET_ALL}")
+    
+    def _display_win_odds(self) -> None:
+        """
+        Muestra la probabilidad de ganar la partida desde el marcador actual.
+        
+        La tabla supone que el usuario juega siempre la mejor respuesta a la
+        estrategia de la computadora, así que es una cota superior y se
+        presenta como tal.
+        """
+        if self.odds_table is None:
+            return
+        odds = self.odds_table.lookup(
+            self.strategy.name, self.max_score, self.user_score, self.computer_score
+        )
+        if odds is not None:
+            print(f"{Fore.CYAN}Probabilidad máxima de ganar la partida (con la mejor respuesta): "
+                  f"{odds:.1%}{Style.RESET_ALL}")
+    
     def _display_choices(self) -> None:
         """Muestra las opciones disponibles al usuario."""
         print(f"\n{Back.GREEN}{Fore.BLACK} === OPCIONES DEL JUEGO === {Style.RESET_ALL}")
@@ -175,28 +396,6 @@ class RockPaperScissorsGame:
         
         print(f"{'-' * 40}")
     
-    def _update_score(self, result: GameResult) -> None:
-        """
-        Actualiza la puntuación basada en el resultado de la ronda.
-        
-        Args:
-            result: Resultado de la ronda
-        """
-        if result == GameResult.USER_WINS:
-            self.user_score += 1
-        elif result == GameResult.COMPUTER_WINS:
-            self.computer_score += 1
-        # No se actualiza puntuación en caso de empate
-    
-    def _check_game_over(self) -> bool:
-        """
-        Verifica si el juego ha terminado.
-        
-        Returns:
-            bool: True si el juego terminó, False en caso contrario
-        """
-        return self.user_score >= self.max_score or self.computer_score >= self.max_score
-    
     def _display_final_result(self) -> None:
         """Muestra el resultado final del juego."""
         print(f"\n{Back.YELLOW}{Fore.BLACK} === JUEGO TERMINADO === {Style.RESET_ALL}")
@@ -241,7 +440,7 @@ class RockPaperScissorsGame:
             # Preguntar si quiere continuar después de cada ronda
             if not self._check_game_over():
                 continue_input = input(f"\n{Fore.CYAN}¿Continuar? (Enter para continuar, 'q' para salir): {Style.RESET_ALL}").strip()
-                if continue_input.lower() in ['q', 'quit', 'salir']:
+                if continue_input.lower() in QUIT_WORDS:
                     break
         
         print(f"\n{Fore.YELLOW}¡Gracias por jugar! 🎮✨{Style.RESET_ALL}")
\ No newline at end of file
@@ -6,7 +6,8 @@ y otros estados necesarios.
 """
 
 from enum import Enum
-from typing import Dict, List
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Tuple
 
 
 class GameChoice(Enum):
@@ -22,20 +23,14 @@ class GameChoice(Enum):
         return self.value
     
     @classmethod
-    def get_choices_dict(cls) -> Dict[int, 'GameChoice']:
+    def get_choices_dict(cls) -> Mapping[int, 'GameChoice']:
         """
         Retorna un diccionario que mapea números (1-5) a opciones del juego.
         
         Returns:
-            Dict[int, GameChoice]: Diccionario con mapeo numérico
+            Mapping[int, GameChoice]: Mapeo numérico de sólo lectura, compartido
         """
-        return {
-            1: cls.ROCK,
-            2: cls.PAPER,
-            3: cls.SCISSORS,
-            4: cls.LIZARD,
-            5: cls.SPOCK
-        }
+        return _CHOICES_BY_NUMBER
     
     @classmethod
     def get_choice_by_number(cls, number: int) -> 'GameChoice':
@@ -51,20 +46,20 @@ class GameChoice(Enum):
         Raises:
             ValueError: Si el número no está en el rango 1-5
         """
-        choices = cls.get_choices_dict()
-        if number not in choices:
+        choice = _CHOICES_BY_NUMBER.get(number)
+        if choice is None:
             raise ValueError(f"Número inválido: {number}. Debe ser entre 1 y 5.")
-        return choices[number]
+        return choice
     
     @classmethod
-    def get_all_choices(cls) -> List['GameChoice']:
+    def get_all_choices(cls) -> Tuple['GameChoice', ...]:
         """
-        Retorna todas las opciones del juego como lista.
+        Retorna todas las opciones del juego.
         
         Returns:
-            List[GameChoice]: Lista con todas las opciones
+            Tuple[GameChoice, ...]: Tupla compartida con todas las opciones
         """
-        return list(cls)
+        return _ALL_CHOICES
     
     def beats(self, other: 'GameChoice') -> bool:
         """
@@ -76,15 +71,7 @@ class GameChoice(Enum):
         Returns:
             bool: True si esta opción vence a la otra
         """
-        winning_combinations = {
-            GameChoice.ROCK: [GameChoice.SCISSORS, GameChoice.LIZARD],
-            GameChoice.PAPER: [GameChoice.ROCK, GameChoice.SPOCK],
-            GameChoice.SCISSORS: [GameChoice.PAPER, GameChoice.LIZARD],
-            GameChoice.LIZARD: [GameChoice.PAPER, GameChoice.SPOCK],
-            GameChoice.SPOCK: [GameChoice.SCISSORS, GameChoice.ROCK]
-        }
-        
-        return other in winning_combinations.get(self, [])
+        return other in _BEATS[self]
     
     def get_win_description(self, other: 'GameChoice') -> str:
         """
@@ -96,20 +83,10 @@ class GameChoice(Enum):
         Returns:
             str: Descripción de la victoria
         """
-        descriptions = {
-            (GameChoice.ROCK, GameChoice.SCISSORS): "Piedra aplasta Tijeras",
-            (GameChoice.ROCK, GameChoice.LIZARD): "Piedra aplasta Lagarto",
-            (GameChoice.PAPER, GameChoice.ROCK): "Papel cubre Piedra",
-            (GameChoice.PAPER, GameChoice.SPOCK): "Papel desautoriza Spock",
-            (GameChoice.SCISSORS, GameChoice.PAPER): "Tijeras cortan Papel",
-            (GameChoice.SCISSORS, GameChoice.LIZARD): "Tijeras decapitan Lagarto",
-            (GameChoice.LIZARD, GameChoice.PAPER): "Lagarto come Papel",
-            (GameChoice.LIZARD, GameChoice.SPOCK): "Lagarto envenena Spock",
-            (GameChoice.SPOCK, GameChoice.SCISSORS): "Spock aplasta Tijeras",
-            (GameChoice.SPOCK, GameChoice.ROCK): "Spock vaporiza Piedra"
-        }
-        
-        return descriptions.get((self, other), f"{self} vence a {other}")
+        description = _WIN_DESCRIPTIONS.get((self, other))
+        if description is None:
+            return f"{self} vence a {other}"
+        return description
 
 
 class GameResult(Enum):
@@ -120,12 +97,7 @@ class GameResult(Enum):
     TIE = "tie"
     
     def __str__(self) -> str:
-        result_strings = {
-            GameResult.USER_WINS: "¡Ganaste!",
-            GameResult.COMPUTER_WINS: "Ganó la computadora",
-            GameResult.TIE: "¡Empate!"
-        }
-        return result_strings[self]
+        return _RESULT_STRINGS[self]
 
 
 class GameState(Enum):
@@ -134,4 +106,43 @@ class GameState(Enum):
     MENU = "menu"
     PLAYING = "playing"
     GAME_OVER = "game_over"
-    QUIT = "quit"
\ No newline at end of file
+    QUIT = "quit"
+
+
+# Tablas precalculadas: las consultas de cada ronda no construyen contenedores
+_CHOICES_BY_NUMBER: Mapping[int, GameChoice] = MappingProxyType({
+    1: GameChoice.ROCK,
+    2: GameChoice.PAPER,
+    3: GameChoice.SCISSORS,
+    4: GameChoice.LIZARD,
+    5: GameChoice.SPOCK
+})
+
+_ALL_CHOICES: Tuple[GameChoice, ...] = tuple(GameChoice)
+
+_BEATS: Mapping[GameChoice, FrozenSet[GameChoice]] = MappingProxyType({
+    GameChoice.ROCK: frozenset((GameChoice.SCISSORS, GameChoice.LIZARD)),
+    GameChoice.PAPER: frozenset((GameChoice.ROCK, GameChoice.SPOCK)),
+    GameChoice.SCISSORS: frozenset((GameChoice.PAPER, GameChoice.LIZARD)),
+    GameChoice.LIZARD: frozenset((GameChoice.PAPER, GameChoice.SPOCK)),
+    GameChoice.SPOCK: frozenset((GameChoice.SCISSORS, GameChoice.ROCK))
+})
+
+_WIN_DESCRIPTIONS: Mapping[Tuple[GameChoice, GameChoice], str] = MappingProxyType({
+    (GameChoice.ROCK, GameChoice.SCISSORS): "Piedra aplasta Tijeras",
+    (GameChoice.ROCK, GameChoice.LIZARD): "Piedra aplasta Lagarto",
+    (GameChoice.PAPER, GameChoice.ROCK): "Papel cubre Piedra",
+    (GameChoice.PAPER, GameChoice.SPOCK): "Papel desautoriza Spock",
+    (GameChoice.SCISSORS, GameChoice.PAPER): "Tijeras cortan Papel",
+    (GameChoice.SCISSORS, GameChoice.LIZARD): "Tijeras decapitan Lagarto",
+    (GameChoice.LIZARD, GameChoice.PAPER): "Lagarto come Papel",
+    (GameChoice.LIZARD, GameChoice.SPOCK): "Lagarto envenena Spock",
+    (GameChoice.SPOCK, GameChoice.SCISSORS): "Spock aplasta Tijeras",
+    (GameChoice.SPOCK, GameChoice.ROCK): "Spock vaporiza Piedra"
+})
+
+_RESULT_STRINGS: Mapping[GameResult, str] = MappingProxyType({
+    GameResult.USER_WINS: "¡Ganaste!",
+    GameResult.COMPUTER_WINS: "Ganó la computadora",
+    GameResult.TIE: "¡Empate!"
+})
@@ -0,0 +1,203 @@
+"""
+Pool de partidas en arreglos paralelos (struct-of-arrays)
+
+`GamePool` guarda el estado de muchas partidas simultáneas en arreglos de NumPy
+(un arreglo por campo de `RockPaperScissorsGame`: marcadores, rondas jugadas,
+puntuación máxima y estado) en lugar de un objeto por partida. Cada `step`
+avanza una ronda de todas las partidas activas con operaciones en bloque; las
+partidas terminadas quedan congeladas por una máscara.
+
+Una partida ocupa 13 bytes frente a los cientos de bytes de un objeto de
+Python, y un paso sobre un millón de partidas son unas pocas operaciones
+vectorizadas. Requiere numpy (dependencia opcional).
+"""
+
+from typing import Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depende del entorno
+    raise ImportError(
+        "El pool de partidas requiere numpy. Instálalo con: pip install numpy"
+    ) from exc
+
+from .equilibrium import game_choice_matrix
+from .game_enums import GameState
+from .simulation import DEFAULT_MAX_ROUNDS, MatchResult
+
+# Códigos del arreglo de estado
+PLAYING = 0
+GAME_OVER = 1
+STATES: Tuple[GameState, ...] = (GameState.PLAYING, GameState.GAME_OVER)
+
+# OUTCOMES[usuario, computadora]: +1 gana el usuario, -1 la computadora, 0 empate
+OUTCOMES = np.array(game_choice_matrix(), dtype=np.int8)
+
+_UNIFORM = (1.0,) * len(OUTCOMES)
+
+
+def _cumulative(weights: Sequence[float]) -> "np.ndarray":
+    """Probabilidades acumuladas de una estrategia mixta, validadas."""
+    array = np.asarray(weights, dtype=np.float64)
+    if array.shape != (len(OUTCOMES),) or (array < 0).any() or array.sum() <= 0:
+        raise ValueError(f"Una estrategia debe tener {len(OUTCOMES)} pesos no negativos con suma positiva.")
+    cumulative = np.cumsum(array / array.sum())
+    cumulative[-1] = 1.0
+    return cumulative
+
+
+class GamePool:
+    """
+    Estado de muchas partidas en arreglos paralelos, avanzadas en bloque.
+
+    Uso:
+        pool = GamePool(1_000_000, max_score=3, seed=1)
+        while pool.step():
+            pass
+        pool.user_wins()
+    """
+
+    def __init__(
+        self,
+        size: int,
+        max_score: Union[int, Sequence[int]] = 3,
+        user_weights: Sequence[float] = _UNIFORM,
+        computer_weights: Sequence[float] = _UNIFORM,
+        seed: Optional[int] = None,
+    ):
+        """
+        Crea `size` partidas en su estado inicial.
+
+        Args:
+            size: Número de partidas
+            max_score: Puntuación para ganar, común o una por partida
+            user_weights: Estrategia mixta de los usuarios simulados
+            computer_weights: Estrategia mixta de la computadora
+            seed: Semilla del generador de elecciones
+
+        Raises:
+            ValueError: Si el tamaño, las puntuaciones o las estrategias no son válidos
+        """
+        if size < 1:
+            raise ValueError("El pool necesita al menos una partida.")
+        self.size = size
+        self.max_score = np.broadcast_to(np.asarray(max_score, dtype=np.int32), (size,)).copy()
+        if (self.max_score < 1).any():
+            raise ValueError("La puntuación máxima debe ser al menos 1.")
+        self.user_score = np.zeros(size, dtype=np.int16)
+        self.computer_score = np.zeros(size, dtype=np.int16)
+        self.rounds_played = np.zeros(size, dtype=np.int32)
+        self.state = np.full(size, PLAYING, dtype=np.int8)
+        self._user_cumulative = _cumulative(user_weights)
+        self._computer_cumulative = _cumulative(computer_weights)
+        self.rng = np.random.default_rng(seed)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes que ocupa el estado de todas las partidas."""
+        return sum(
+            array.nbytes
+            for array in (self.user_score, self.computer_score, self.rounds_played, self.max_score, self.state)
+        )
+
+    @property
+    def active(self) -> "np.ndarray":
+        """Máscara de las partidas que siguen en juego."""
+        mask: np.ndarray = self.state == PLAYING
+        return mask
+
+    def active_count(self) -> int:
+        """Número de partidas que siguen en juego."""
+        return int(np.count_nonzero(self.state == PLAYING))
+
+    def _sample(self, cumulative: "np.ndarray") -> "np.ndarray":
+        choices = np.searchsorted(cumulative, self.rng.random(self.size), side="right")
+        return choices.astype(np.int8)
+
+    def step(
+        self,
+        user_choices: Optional["np.ndarray"] = None,
+        computer_choices: Optional["np.ndarray"] = None,
+    ) -> int:
+        """
+        Juega una ronda en todas las partidas activas.
+
+        Args:
+            user_choices: Índice de la opción del usuario en cada partida (orden
+                de GameChoice); por defecto se sortea con su estrategia
+            computer_choices: Ídem para la computadora
+
+        Returns:
+            int: Partidas que siguen en juego tras la ronda
+        """
+        if user_choices is None:
+            user_choices = self._sample(self._user_cumulative)
+        if computer_choices is None:
+            computer_choices = self._sample(self._computer_cumulative)
+        active = self.state == PLAYING
+        outcome = OUTCOMES[user_choices, computer_choices]
+
+        self.user_score += (outcome > 0) & active
+        self.computer_score += (outcome < 0) & active
+        self.rounds_played += active
+        finished = active & (
+            (self.user_score >= self.max_score) | (self.computer_score >= self.max_score)
+        )
+        self.state[finished] = GAME_OVER
+        return self.active_count()
+
+    def run(self, max_rounds: int = DEFAULT_MAX_ROUNDS) -> int:
+        """
+        Avanza hasta que todas las partidas terminen o se alcance el tope de rondas.
+
+        Args:
+            max_rounds: Rondas tras las que se deja de avanzar
+
+        Returns:
+            int: Partidas que siguen en juego (0 si todas terminaron)
+        """
+        remaining = self.active_count()
+        for _ in range(max_rounds):
+            if not remaining:
+                break
+            remaining = self.step()
+        return remaining
+
+    def reset(self, mask: Optional["np.ndarray"] = None) -> None:
+        """
+        Devuelve partidas a su estado inicial, como `reset_game`.
+
+        Args:
+            mask: Partidas a reiniciar (por defecto, todas)
+        """
+        selected = slice(None) if mask is None else mask
+        self.user_score[selected] = 0
+        self.computer_score[selected] = 0
+        self.rounds_played[selected] = 0
+        self.state[selected] = PLAYING
+
+    def user_wins(self) -> int:
+        """Partidas terminadas que ganó el usuario."""
+        return int(np.count_nonzero(self.user_score >= self.max_score))
+
+    def computer_wins(self) -> int:
+        """Partidas terminadas que ganó la computadora."""
+        return int(np.count_nonzero(self.computer_score >= self.max_score))
+
+    def game_state(self, index: int) -> GameState:
+        """Estado de una partida como GameState."""
+        return STATES[int(self.state[index])]
+
+    def match(self, index: int) -> MatchResult:
+        """
+        Marcador de una partida.
+
+        Args:
+            index: Índice de la partida
+
+        Returns:
+            MatchResult: Marcador y rondas jugadas
+        """
+        return MatchResult(
+            int(self.user_score[index]), int(self.computer_score[index]), int(self.rounds_played[index])
+        )
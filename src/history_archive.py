@@ -0,0 +1,403 @@
+"""
+Archivo de históricos de rondas comprimido por bloques, con índice
+
+El histórico crece decenas de GB al día y descomprimir el archivo entero para
+consultar las rondas de un jugador no es viable. Este formato guarda las rondas
+en registros binarios de tamaño fijo, agrupados en bloques de
+`records_per_block` registros que se comprimen por separado con zlib o lzma.
+Al cerrar el archivo se escribe un índice al final con, para cada bloque, su
+posición, el rango de tiempo que cubre y las sesiones que contiene; una
+consulta por sesión o por rango de tiempo sólo lee y descomprime los bloques
+que pueden tener rondas suyas.
+
+Formato del archivo (little endian):
+    magic b"RPSHIST1"
+    bloques comprimidos, uno tras otro
+    índice: JSON UTF-8 comprimido con el mismo códec
+    cola: u64 posición del índice | u64 longitud del índice | magic b"RPSHIST1"
+
+Cada registro ocupa 23 bytes: f64 instante | u32 sesión | u32 ronda |
+u8 elección del usuario | u8 elección de la computadora | u8 resultado |
+u16 puntos del usuario | u16 puntos de la computadora.
+
+Los bloques siguen el orden de escritura: para que la consulta de una sesión
+lea pocos bloques, conviene escribir seguidas las rondas de cada sesión (por
+ejemplo, una partida completa con `write_rounds`) en vez de intercalarlas
+ronda a ronda. El índice sólo existe tras `close`: un archivo que no se cerró
+no se puede leer.
+
+Consulta desde la línea de comandos:
+    python -m src.history_archive historico.rpsh --session ana > ana.ndjson
+"""
+
+import bisect
+import json
+import lzma
+import struct
+import sys
+import time
+import zlib
+from typing import IO, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from .game import RoundRecord
+from .game_enums import GameChoice, GameResult
+
+MAGIC = b"RPSHIST1"
+VERSION = 1
+CODECS = ("zlib", "lzma")
+DEFAULT_RECORDS_PER_BLOCK = 4096
+
+_RECORD = struct.Struct("<dIIBBBHH")
+_TRAILER = struct.Struct("<QQ8s")
+
+_CHOICES: Tuple[GameChoice, ...] = tuple(GameChoice)
+_CHOICE_INDEX: Dict[GameChoice, int] = {choice: index for index, choice in enumerate(_CHOICES)}
+_RESULTS: Tuple[GameResult, ...] = tuple(GameResult)
+_RESULT_INDEX: Dict[GameResult, int] = {result: index for index, result in enumerate(_RESULTS)}
+
+
+def _compressor(codec: str, level: Optional[int]) -> Callable[[bytes], bytes]:
+    """Función de compresión del códec, con su nivel por defecto si no se indica."""
+    if codec == "zlib":
+        return lambda data: zlib.compress(data, -1 if level is None else level)
+    return lambda data: lzma.compress(data, preset=level)
+
+
+def _decompressor(codec: str) -> Callable[[bytes], bytes]:
+    """Función de descompresión del códec."""
+    return zlib.decompress if codec == "zlib" else lzma.decompress
+
+
+class ArchivedRound(NamedTuple):
+    """Ronda guardada en el archivo: sesión, instante y datos de la ronda."""
+
+    session: str
+    timestamp: float
+    round: int
+    user_choice: GameChoice
+    computer_choice: GameChoice
+    result: GameResult
+    user_score: int
+    computer_score: int
+
+
+class BlockInfo(NamedTuple):
+    """Entrada del índice de un bloque."""
+
+    offset: int
+    """Posición del bloque comprimido en el archivo"""
+
+    length: int
+    """Bytes comprimidos"""
+
+    records: int
+    """Rondas del bloque"""
+
+    start: float
+    """Primer instante del bloque"""
+
+    end: float
+    """Último instante del bloque"""
+
+    sessions: Tuple[int, ...]
+    """Identificadores de sesión presentes, ordenados"""
+
+    def contains(self, session_id: int) -> bool:
+        """True si el bloque tiene rondas de la sesión."""
+        position = bisect.bisect_left(self.sessions, session_id)
+        return position < len(self.sessions) and self.sessions[position] == session_id
+
+    def overlaps(self, start: Optional[float], end: Optional[float]) -> bool:
+        """True si el bloque cubre algún instante de [start, end)."""
+        return (start is None or self.end >= start) and (end is None or self.start < end)
+
+
+class HistoryArchiveWriter:
+    """
+    Escribe rondas en un archivo de históricos nuevo.
+
+    Uso:
+        with HistoryArchiveWriter("historico.rpsh") as writer:
+            writer.write_rounds("ana", game.iter_rounds(estrategia))
+    """
+
+    def __init__(
+        self,
+        path: str,
+        codec: str = "zlib",
+        records_per_block: int = DEFAULT_RECORDS_PER_BLOCK,
+        level: Optional[int] = None,
+    ):
+        """
+        Crea el archivo.
+
+        Args:
+            path: Ruta del archivo (se sobrescribe)
+            codec: "zlib" o "lzma"
+            records_per_block: Rondas por bloque comprimido
+            level: Nivel de compresión (por defecto, el del códec)
+
+        Raises:
+            ValueError: Si el códec no existe o el tamaño de bloque no es positivo
+        """
+        if codec not in CODECS:
+            raise ValueError(f"Códec desconocido: {codec}. Opciones: {', '.join(CODECS)}")
+        if records_per_block < 1:
+            raise ValueError("Cada bloque debe tener al menos una ronda.")
+        self.codec = codec
+        self.records_per_block = records_per_block
+        self._compress = _compressor(codec, level)
+        self._handle: Optional[IO[bytes]] = open(path, "wb")
+        self._handle.write(MAGIC)
+        self._offset = len(MAGIC)
+        self._session_ids: Dict[str, int] = {}
+        self._blocks: List[BlockInfo] = []
+        self._pending: List[bytes] = []
+        self._pending_sessions: Set[int] = set()
+        self._start = self._end = 0.0
+
+    def __enter__(self) -> "HistoryArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def write(self, entry: ArchivedRound) -> None:
+        """
+        Añade una ronda.
+
+        Args:
+            entry: Ronda con su sesión e instante
+        """
+        session_id = self._session_ids.setdefault(entry.session, len(self._session_ids))
+        if not self._pending:
+            self._start = self._end = entry.timestamp
+        else:
+            self._start = min(self._start, entry.timestamp)
+            self._end = max(self._end, entry.timestamp)
+        self._pending.append(_RECORD.pack(
+            entry.timestamp,
+            session_id,
+            entry.round,
+            _CHOICE_INDEX[entry.user_choice],
+            _CHOICE_INDEX[entry.computer_choice],
+            _RESULT_INDEX[entry.result],
+            entry.user_score,
+            entry.computer_score,
+        ))
+        self._pending_sessions.add(session_id)
+        if len(self._pending) >= self.records_per_block:
+            self._flush_block()
+
+    def write_rounds(self, session: str, rounds: Iterable[RoundRecord], timestamp: Optional[float] = None) -> int:
+        """
+        Añade las rondas de una sesión, por ejemplo de `GameEngine.iter_rounds`.
+
+        Args:
+            session: Sesión o jugador al que pertenecen las rondas
+            rounds: Rondas a guardar
+            timestamp: Instante de todas las rondas (por defecto, el reloj al
+                guardar cada una)
+
+        Returns:
+            int: Rondas escritas
+        """
+        written = 0
+        for record in rounds:
+            self.write(ArchivedRound(session, time.time() if timestamp is None else timestamp, *record))
+            written += 1
+        return written
+
+    def _flush_block(self) -> None:
+        """Comprime el bloque en curso y lo añade al índice."""
+        if not self._pending or self._handle is None:
+            return
+        data = self._compress(b"".join(self._pending))
+        self._handle.write(data)
+        self._blocks.append(BlockInfo(
+            self._offset, len(data), len(self._pending), self._start, self._end,
+            tuple(sorted(self._pending_sessions)),
+        ))
+        self._offset += len(data)
+        self._pending.clear()
+        self._pending_sessions.clear()
+
+    def close(self) -> None:
+        """Escribe el último bloque, el índice y la cola, y cierra el archivo."""
+        if self._handle is None:
+            return
+        self._flush_block()
+        index = {
+            "version": VERSION,
+            "codec": self.codec,
+            "sessions": sorted(self._session_ids, key=self._session_ids.__getitem__),
+            "blocks": [list(block) for block in self._blocks],
+        }
+        footer = self._compress(json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        self._handle.write(footer)
+        self._handle.write(_TRAILER.pack(self._offset, len(footer), MAGIC))
+        self._handle.close()
+        self._handle = None
+
+
+class HistoryArchive:
+    """
+    Lee un archivo de históricos descomprimiendo sólo los bloques necesarios.
+
+    Uso:
+        with HistoryArchive("historico.rpsh") as archive:
+            for entry in archive.read(session="ana", start=ayer):
+                ...
+    """
+
+    def __init__(self, path: str):
+        """
+        Abre el archivo y carga el índice.
+
+        Args:
+            path: Ruta del archivo
+
+        Raises:
+            ValueError: Si el archivo no es un histórico válido o no se cerró
+        """
+        self.path = path
+        self._handle = open(path, "rb")
+        try:
+            self._load_index()
+        except Exception:
+            self._handle.close()
+            raise
+
+    def _load_index(self) -> None:
+        handle = self._handle
+        if handle.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{self.path} no es un archivo de históricos.")
+        size = handle.seek(0, 2)
+        if size < len(MAGIC) + _TRAILER.size:
+            raise ValueError(f"{self.path} está incompleto: falta el índice.")
+        handle.seek(size - _TRAILER.size)
+        offset, length, magic = _TRAILER.unpack(handle.read(_TRAILER.size))
+        if magic != MAGIC or offset + length + _TRAILER.size != size:
+            raise ValueError(f"{self.path} está incompleto: falta el índice.")
+        handle.seek(offset)
+        footer = handle.read(length)
+        for codec in CODECS:
+            try:
+                index = json.loads(_decompressor(codec)(footer))
+                break
+            except (zlib.error, lzma.LZMAError):
+                continue
+        else:
+            raise ValueError(f"El índice de {self.path} está dañado.")
+        if index.get("version") != VERSION:
+            raise ValueError(f"Versión de histórico no soportada: {index.get('version')}")
+        self.codec: str = index["codec"]
+        self.sessions: Tuple[str, ...] = tuple(index["sessions"])
+        self.blocks: Tuple[BlockInfo, ...] = tuple(
+            BlockInfo(offset, length, records, start, end, tuple(sessions))
+            for offset, length, records, start, end, sessions in index["blocks"]
+        )
+        self._session_ids = {name: session_id for session_id, name in enumerate(self.sessions)}
+        self._decompress = _decompressor(self.codec)
+
+    def __enter__(self) -> "HistoryArchive":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(block.records for block in self.blocks)
+
+    def __iter__(self) -> Iterator[ArchivedRound]:
+        return self.read()
+
+    def blocks_for(
+        self, session: Optional[str] = None, start: Optional[float] = None, end: Optional[float] = None
+    ) -> List[BlockInfo]:
+        """
+        Bloques que pueden tener rondas de la consulta, según el índice.
+
+        Args:
+            session: Sesión buscada (por defecto, todas)
+            start: Primer instante incluido
+            end: Instante final, excluido
+
+        Returns:
+            List[BlockInfo]: Bloques a descomprimir, en orden de archivo
+        """
+        if session is not None:
+            session_id = self._session_ids.get(session)
+            if session_id is None:
+                return []
+            return [block for block in self.blocks if block.contains(session_id) and block.overlaps(start, end)]
+        return [block for block in self.blocks if block.overlaps(start, end)]
+
+    def read(
+        self, session: Optional[str] = None, start: Optional[float] = None, end: Optional[float] = None
+    ) -> Iterator[ArchivedRound]:
+        """
+        Rondas de una sesión y un rango de tiempo, en el orden en que se escribieron.
+
+        Args:
+            session: Sesión buscada (por defecto, todas)
+            start: Primer instante incluido
+            end: Instante final, excluido
+
+        Yields:
+            ArchivedRound: Rondas que cumplen la consulta
+        """
+        session_id = self._session_ids.get(session) if session is not None else None
+        sessions, choices, results = self.sessions, _CHOICES, _RESULTS
+        for block in self.blocks_for(session, start, end):
+            for timestamp, record_session, number, user, computer, result, user_score, computer_score in (
+                _RECORD.iter_unpack(self._read_block(block))
+            ):
+                if session_id is not None and record_session != session_id:
+                    continue
+                if (start is not None and timestamp < start) or (end is not None and timestamp >= end):
+                    continue
+                yield ArchivedRound(
+                    sessions[record_session], timestamp, number,
+                    choices[user], choices[computer], results[result], user_score, computer_score,
+                )
+
+    def _read_block(self, block: BlockInfo) -> bytes:
+        """Lee y descomprime un bloque."""
+        self._handle.seek(block.offset)
+        return self._decompress(self._handle.read(block.length))
+
+    def close(self) -> None:
+        """Cierra el archivo."""
+        self._handle.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Exporta rondas de un archivo de históricos a NDJSON o CSV por la salida estándar.
+
+    Args:
+        argv: Argumentos (por defecto, sys.argv[1:])
+
+    Returns:
+        int: Código de salida
+    """
+    import argparse
+
+    from .exporters import FORMATS, export_records
+
+    parser = argparse.ArgumentParser(description="Consulta un archivo de históricos de rondas")
+    parser.add_argument("path", help="Archivo de históricos")
+    parser.add_argument("--session", default=None, help="Sólo las rondas de esta sesión")
+    parser.add_argument("--since", type=float, default=None, help="Primer instante (segundos Unix)")
+    parser.add_argument("--until", type=float, default=None, help="Instante final, excluido")
+    parser.add_argument("--format", choices=FORMATS, default="ndjson", help="Formato de salida")
+    args = parser.parse_args(argv)
+    with HistoryArchive(args.path) as archive:
+        export_records(archive.read(args.session, args.since, args.until), sys.stdout.buffer, args.format)
+    sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
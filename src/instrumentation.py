@@ -0,0 +1,300 @@
+"""
+Instrumentación por fases de una ronda del juego Piedra, Papel, Tijeras, Lagarto, Spock
+
+Este módulo mide cuánto tiempo consume cada fase de `play_round` (espera de la
+entrada, elección de la computadora, comparación, renderizado y actualización
+del marcador) y cuenta las llamadas a `beats`, `compare_choices` y al generador
+aleatorio.
+
+La instrumentación se instala envolviendo los métodos de una instancia concreta
+del juego; mientras no se instala, el juego ejecuta sus métodos originales sin
+ningún coste adicional. Cada fase mide su tiempo propio: el menú que pinta
+`get_user_choice` cuenta como renderizado, no como espera de la entrada. Los
+contadores se toman en los puntos de llamada del juego instrumentado:
+`compare_choices` consulta `beats` sólo si las elecciones difieren, y el
+generador de la estrategia (`strategy.rng`, o el módulo `random` si no tiene uno
+propio) se envuelve para contar cada extracción. Nada se sustituye fuera de la
+instancia, así que los demás juegos e hilos no se ven afectados.
+"""
+
+import random
+import time
+from typing import Any, Callable, Dict, List, Mapping
+
+# Fases medidas dentro de una ronda, en el orden en que ocurren
+PHASES = ("input", "computer_choice", "comparison", "render", "score_update")
+
+# Contadores de llamadas del camino caliente
+COUNTERS = ("beats", "compare_choices", "rng")
+
+# Método del juego -> fase a la que se imputa su tiempo
+PHASE_METHODS = {
+    "get_user_choice": "input",
+    "get_computer_choice": "computer_choice",
+    "compare_choices": "comparison",
+    "_display_round_header": "render",
+    "_display_win_odds": "render",
+    "_display_choices": "render",
+    "_display_moves": "render",
+    "_display_round_result": "render",
+    "_display_final_result": "render",
+    "_update_score": "score_update",
+}
+
+_MISSING = object()
+
+WrapperFactory = Callable[[Callable[..., Any]], Callable[..., Any]]
+
+# Métodos de random.Random que extraen números del generador
+RNG_DRAWS = frozenset((
+    "random", "randrange", "randint", "choice", "choices", "sample", "shuffle",
+    "uniform", "getrandbits", "gauss", "normalvariate",
+))
+
+class CountingRandom:
+    """
+    Envoltorio de un generador aleatorio que cuenta sus extracciones.
+
+    Delega cada atributo en el generador envuelto en el momento de usarlo, así
+    que los cambios posteriores sobre él (por ejemplo, en los tests) se respetan.
+    """
+
+    def __init__(self, target: Any, on_draw: Callable[[], None]):
+        """
+        Args:
+            target: `random.Random` o el módulo `random`
+            on_draw: Función a llamar en cada extracción
+        """
+        self._target = target
+        self._on_draw = on_draw
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if name not in RNG_DRAWS:
+            return attribute
+        on_draw = self._on_draw
+
+        def draw(*args: Any, **kwargs: Any) -> Any:
+            on_draw()
+            return attribute(*args, **kwargs)
+
+        return draw
+
+
+def install_wrappers(obj: Any, factories: Mapping[str, WrapperFactory]) -> Dict[str, Any]:
+    """
+    Reemplaza métodos de una instancia por envoltorios.
+
+    Args:
+        obj: Instancia cuyos métodos se envuelven
+        factories: Nombre del método -> función que recibe el método actual
+            y devuelve su envoltorio
+
+    Returns:
+        Dict[str, Any]: Atributos de instancia previos, para `restore_wrappers`
+    """
+    previous: Dict[str, Any] = {}
+    for name, factory in factories.items():
+        previous[name] = vars(obj).get(name, _MISSING)
+        setattr(obj, name, factory(getattr(obj, name)))
+    return previous
+
+
+def restore_wrappers(obj: Any, previous: Mapping[str, Any]) -> None:
+    """
+    Deshace `install_wrappers` restaurando los atributos previos.
+
+    Args:
+        obj: Instancia instrumentada
+        previous: Valor devuelto por `install_wrappers`
+    """
+    for name, value in previous.items():
+        if value is _MISSING:
+            vars(obj).pop(name, None)
+        else:
+            setattr(obj, name, value)
+
+
+class RoundInstrumentation:
+    """
+    Acumula tiempos por fase y contadores de llamadas de `play_round`.
+
+    Uso:
+        instrumentation = RoundInstrumentation()
+        instrumentation.attach(game)
+        game.run()
+        print(instrumentation.format_report())
+    """
+
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns):
+        """
+        Inicializa los acumuladores vacíos.
+
+        Args:
+            clock: Reloj monotónico en nanosegundos
+        """
+        self._clock = clock
+        # Tiempo de las fases anidadas en la fase en curso, para descontarlo
+        self._nested_ns = 0
+        self._installed: Dict[int, Dict[str, Any]] = {}
+        self._rngs: Dict[int, List[Any]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Pone a cero todos los tiempos y contadores."""
+        self.rounds = 0
+        self.round_ns = 0
+        self.phase_ns: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.phase_max_ns: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.counts: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+
+    def record(self, phase: str, elapsed_ns: int) -> None:
+        """
+        Registra la duración de una fase.
+
+        Args:
+            phase: Nombre de la fase (ver PHASES)
+            elapsed_ns: Duración en nanosegundos
+        """
+        self.phase_ns[phase] += elapsed_ns
+        if elapsed_ns > self.phase_max_ns[phase]:
+            self.phase_max_ns[phase] = elapsed_ns
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """
+        Incrementa un contador de llamadas.
+
+        Args:
+            name: Nombre del contador (ver COUNTERS)
+            amount: Cantidad a sumar
+        """
+        self.counts[name] += amount
+
+    def attach(self, game: Any) -> None:
+        """
+        Instala la instrumentación sobre una instancia del juego.
+
+        Args:
+            game: Instancia de RockPaperScissorsGame
+        """
+        if id(game) in self._installed:
+            return
+        factories: Dict[str, WrapperFactory] = {
+            name: self._timed(phase) for name, phase in PHASE_METHODS.items()
+        }
+        factories["play_round"] = self._timed_round
+        self._installed[id(game)] = install_wrappers(game, factories)
+        strategy = getattr(game, "strategy", None)
+        if strategy is not None and hasattr(strategy, "rng"):
+            self._rngs[id(game)] = [strategy, strategy.rng]
+            strategy.rng = CountingRandom(strategy.rng or random, self._count_rng)
+
+    def detach(self, game: Any) -> None:
+        """
+        Retira la instrumentación y devuelve al juego sus métodos originales.
+
+        Args:
+            game: Instancia previamente instrumentada
+        """
+        previous = self._installed.pop(id(game), None)
+        if previous is not None:
+            restore_wrappers(game, previous)
+        rng = self._rngs.pop(id(game), None)
+        if rng is not None:
+            strategy, original = rng
+            strategy.rng = original
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Retorna un resumen serializable de las mediciones.
+
+        Returns:
+            Dict[str, Any]: Rondas, tiempos por fase (ns) y contadores
+        """
+        return {
+            "rounds": self.rounds,
+            "round_ns": self.round_ns,
+            "phases": {
+                phase: {"total_ns": self.phase_ns[phase], "max_ns": self.phase_max_ns[phase]}
+                for phase in PHASES
+            },
+            "counts": dict(self.counts),
+        }
+
+    def format_report(self) -> str:
+        """
+        Genera un informe legible con el desglose por fase.
+
+        Returns:
+            str: Tabla de texto con tiempos medios, máximos y porcentajes
+        """
+        rounds = max(self.rounds, 1)
+        total = max(self.round_ns, 1)
+        lines = [
+            f"Rondas instrumentadas: {self.rounds}",
+            f"{'fase':<16}{'media (µs)':>12}{'máx (µs)':>12}{'% ronda':>10}",
+        ]
+        for phase in PHASES:
+            elapsed = self.phase_ns[phase]
+            lines.append(
+                f"{phase:<16}{elapsed / rounds / 1000:>12.1f}"
+                f"{self.phase_max_ns[phase] / 1000:>12.1f}"
+                f"{100 * elapsed / total:>10.1f}"
+            )
+        lines.append(
+            "Llamadas: " + ", ".join(f"{name}={self.counts[name]}" for name in COUNTERS)
+        )
+        return "\n".join(lines)
+
+    def _timed(self, phase: str) -> WrapperFactory:
+        """
+        Crea la fábrica de envoltorios que mide el tiempo propio de una fase.
+
+        El tiempo de las fases anidadas (el menú dentro de `get_user_choice`)
+        se descuenta de la fase que las contiene.
+        """
+        clock = self._clock
+        record = self.record
+
+        def factory(method: Callable[..., Any]) -> Callable[..., Any]:
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                outer_nested = self._nested_ns
+                self._nested_ns = 0
+                start = clock()
+                try:
+                    result = method(*args, **kwargs)
+                finally:
+                    elapsed = clock() - start
+                    record(phase, elapsed - self._nested_ns)
+                    self._nested_ns = outer_nested + elapsed
+                if phase == "comparison":
+                    self._count_comparison(*args, **kwargs)
+                return result
+
+            return wrapper
+
+        return factory
+
+    def _count_comparison(self, user_choice: Any, computer_choice: Any) -> None:
+        """Cuenta una llamada a `compare_choices` y, si no es empate, su consulta a `beats`."""
+        self.counts["compare_choices"] += 1
+        if user_choice != computer_choice:
+            self.counts["beats"] += 1
+
+    def _timed_round(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Envuelve `play_round` para medir la duración total de cada ronda."""
+        clock = self._clock
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            self._nested_ns = 0
+            start = clock()
+            result = method(*args, **kwargs)
+            self.round_ns += clock() - start
+            self.rounds += 1
+            return result
+
+        return wrapper
+
+    def _count_rng(self) -> None:
+        """Suma una extracción del generador de la estrategia."""
+        self.counts["rng"] += 1
@@ -6,8 +6,13 @@ Este módulo proporciona la interfaz de línea de comandos (CLI) para ejecutar e
 
 import sys
 import argparse
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from colorama import Fore, Style
 from .game import RockPaperScissorsGame
+from .strategies import DEFAULT_STRATEGY, available_strategies, builtin_strategy_names, create_strategy, load_profiles
+
+if TYPE_CHECKING:
+    from .profiling import MemoryProfiler
 
 
 def main() -> int:
@@ -24,8 +29,20 @@ def main() -> int:
 Ejemplos de uso:
   python -m src.main                # Juego normal (primero a 3 puntos)
   python -m src.main --score 5      # Juego hasta 5 puntos
+  python -m src.main --strategy piedra --odds-table odds.bin  # Con probabilidad en vivo
+  python -m src.main --profiles perfiles.json --strategy equilibrio  # Bot entrenado
+  python -m src.main --strategy prediccion --player ana  # Recuerda tus patrones
   python -m src.main --rules        # Mostrar solo las reglas
   python -m src.main --demo         # Modo demostración
+  python -m src.main --players 6    # Multijugador: tú contra 5 computadoras
+  python -m src.main --battle-royale 1000000  # Torneo de eliminación simulado
+  python -m src.main --simulate 1000000 --strategy clasica --jobs 8 --output stats.json
+  python -m src.main --instrument   # Juego con desglose de tiempos por fase
+  python -m src.main --metrics-port 9464  # Exponer métricas Prometheus
+  python -m src.main --trace partida.json # Traza para chrome://tracing o Perfetto
+  python -m src.main --profile juego.pstats         # Perfil con cProfile
+  python -m src.main --demo --profile demo.folded --profile-mode sample
+  python -m src.main --profile-memory     # Asignaciones de memoria por ronda
         """
     )
     
@@ -48,12 +65,159 @@ Ejemplos de uso:
         help="Ejecutar en modo demostración"
     )
     
+    parser.add_argument(
+        "--strategy",
+        default=DEFAULT_STRATEGY,
+        help=f"Estrategia de la computadora: {', '.join(builtin_strategy_names())}, "
+             f"un plugin instalado o un perfil de --profiles (default: {DEFAULT_STRATEGY})"
+    )
+    
+    parser.add_argument(
+        "--profiles",
+        default=None,
+        metavar="ARCHIVO",
+        help="Cargar perfiles de estrategia entrenados con 'python -m src.training ARCHIVO'"
+    )
+    
+    parser.add_argument(
+        "--player",
+        default=None,
+        metavar="ID",
+        help="Identificador del jugador: las estrategias adaptativas recuerdan lo aprendido entre sesiones"
+    )
+    
+    parser.add_argument(
+        "--model-store",
+        default="modelos.sqlite3",
+        metavar="ARCHIVO",
+        help="Base SQLite con los modelos de cada jugador (default: modelos.sqlite3)"
+    )
+    
+    parser.add_argument(
+        "--odds-table",
+        default=None,
+        metavar="ARCHIVO",
+        help="Mostrar la probabilidad máxima de ganar (jugando la mejor respuesta) "
+             "usando una tabla generada con 'python -m src.odds_table ARCHIVO'"
+    )
+    
+    parser.add_argument(
+        "--players",
+        type=int,
+        default=None,
+        help="Jugar en modo multijugador contra PLAYERS-1 jugadores de la computadora"
+    )
+    
+    parser.add_argument(
+        "--battle-royale",
+        type=int,
+        default=None,
+        metavar="JUGADORES",
+        help="Simular un torneo de eliminación con JUGADORES jugadores (requiere numpy)"
+    )
+    
+    parser.add_argument(
+        "--simulate",
+        type=int,
+        default=None,
+        metavar="PARTIDAS",
+        help="Simular PARTIDAS partidas sin interfaz a --score puntos y escribir las estadísticas"
+    )
+    
+    parser.add_argument(
+        "--user-strategy",
+        default=DEFAULT_STRATEGY,
+        help=f"Estrategia del usuario simulado en --simulate (default: {DEFAULT_STRATEGY})"
+    )
+    
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Hilos o procesos de --simulate (default: uno por núcleo)"
+    )
+    
+    parser.add_argument(
+        "--output",
+        default=None,
+        metavar="ARCHIVO",
+        help="Archivo de estadísticas de --simulate (default: salida estándar)"
+    )
+    
+    parser.add_argument(
+        "--format",
+        choices=["json", "ndjson"],
+        default="json",
+        help="json (reescribe ARCHIVO) o ndjson (añade una línea por simulación)"
+    )
+    
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Semilla aleatoria para los modos de simulación"
+    )
+    
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        metavar="ARCHIVO",
+        help="Guardar el avance de la simulación en ARCHIVO y reanudarla si ya existe"
+    )
+    
+    parser.add_argument(
+        "--instrument",
+        action="store_true",
+        help="Medir el tiempo de cada fase de la ronda y mostrar un informe al salir"
+    )
+    
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Servir métricas OpenMetrics en http://127.0.0.1:PUERTO/metrics"
+    )
+    
+    parser.add_argument(
+        "--metrics-textfile",
+        default=None,
+        help="Escribir periódicamente las métricas en este archivo .prom"
+    )
+    
+    parser.add_argument(
+        "--trace",
+        default=None,
+        metavar="ARCHIVO",
+        help="Guardar una traza Chrome trace-event/Perfetto de la partida"
+    )
+    
+    parser.add_argument(
+        "--profile",
+        default=None,
+        metavar="ARCHIVO",
+        help="Ejecutar bajo un perfilador y guardar el perfil en ARCHIVO"
+    )
+    
+    parser.add_argument(
+        "--profile-mode",
+        choices=["cprofile", "sample"],
+        default="cprofile",
+        help="cprofile (salida pstats) o sample (pilas colapsadas para flamegraph)"
+    )
+    
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Informar las asignaciones de memoria por ronda con tracemalloc"
+    )
+    
     parser.add_argument(
         "--version",
         action="version",
         version="Piedra, Papel, Tijeras, Lagarto, Spock v0.1.0"
     )
     
+    args: Optional[argparse.Namespace] = None
     try:
         args = parser.parse_args()
         
@@ -61,6 +225,37 @@ Ejemplos de uso:
         if args.score < 1 or args.score > 10:
             print(f"{Fore.RED}❌ Error: La puntuación debe estar entre 1 y 10{Style.RESET_ALL}")
             return 1
+        
+        if args.players is not None and args.players < 2:
+            print(f"{Fore.RED}❌ Error: El modo multijugador necesita al menos 2 jugadores{Style.RESET_ALL}")
+            return 1
+        
+        if args.battle_royale is not None and args.battle_royale < 2:
+            print(f"{Fore.RED}❌ Error: El battle royale necesita al menos 2 jugadores{Style.RESET_ALL}")
+            return 1
+        
+        if args.simulate is not None and args.simulate < 1:
+            print(f"{Fore.RED}❌ Error: La simulación necesita al menos 1 partida{Style.RESET_ALL}")
+            return 1
+        
+        if args.profile_memory and (args.demo or args.simulate is not None):
+            print(f"{Fore.RED}❌ Error: --profile-memory mide las rondas del juego, del multijugador "
+                  f"o del battle royale; no está disponible con --demo ni --simulate{Style.RESET_ALL}")
+            return 1
+        
+        if args.jobs is not None and args.jobs < 1:
+            print(f"{Fore.RED}❌ Error: --jobs debe ser al menos 1{Style.RESET_ALL}")
+            return 1
+        
+        profiles = load_profiles(args.profiles) if args.profiles else None
+        for strategy in (args.strategy, args.user_strategy):
+            # Los plugins de terceros sólo se buscan si el nombre no es conocido
+            if strategy in builtin_strategy_names() or strategy in (profiles or {}):
+                continue
+            if strategy not in available_strategies(profiles):
+                print(f"{Fore.RED}❌ Error: Estrategia desconocida: {strategy}. "
+                      f"Opciones: {', '.join(available_strategies(profiles))}{Style.RESET_ALL}")
+                return 1
             
         # Mostrar solo reglas si se solicita
         if args.rules:
@@ -68,24 +263,95 @@ Ejemplos de uso:
             game.display_rules()
             return 0
             
-        # Modo demostración
-        if args.demo:
-            return run_demo_mode()
-            
-        # Ejecutar juego normal
-        game = RockPaperScissorsGame(max_score=args.score)
-        game.run()
-        
-        return 0
+        return run_selected_mode(args, profiles)
         
     except KeyboardInterrupt:
         print(f"\n{Fore.YELLOW}🎮 Juego interrumpido por el usuario. ¡Hasta luego!{Style.RESET_ALL}")
+        # Sólo la simulación por lotes y el battle royale guardan su avance
+        if args is not None and args.checkpoint and (args.simulate is not None or args.battle_royale is not None):
+            print(f"{Fore.YELLOW}💾 Progreso guardado en {args.checkpoint}; "
+                  f"repite el comando para reanudar.{Style.RESET_ALL}")
         return 0
     except Exception as e:
         print(f"{Fore.RED}❌ Error inesperado: {e}{Style.RESET_ALL}")
         return 1
 
 
+def run_selected_mode(
+    args: argparse.Namespace, profiles: Optional[Dict[str, Tuple[float, ...]]] = None
+) -> int:
+    """
+    Ejecuta el modo elegido (juego, demo, simulación, multijugador o battle
+    royale), perfilado si se solicitó.
+    
+    Args:
+        args: Argumentos ya validados del CLI
+        profiles: Perfiles de estrategia cargados con --profiles
+        
+    Returns:
+        int: Código de salida
+    """
+    memory_profiler = None
+    if args.profile_memory:
+        from .profiling import MemoryProfiler
+        memory_profiler = MemoryProfiler()
+        memory_profiler.start()
+    
+    odds_table = None
+    persistent = None
+    strategy = None
+    if args.demo:
+        action = run_demo_mode
+    elif args.simulate is not None:
+        action = lambda: run_simulation_mode(args, profiles)  # noqa: E731
+    elif args.battle_royale is not None:
+        action = lambda: run_battle_royale_mode(  # noqa: E731
+            args.battle_royale, args.seed, args.checkpoint, memory_profiler
+        )
+    elif args.players is not None:
+        action = lambda: run_multiplayer_mode(args.players, args.score, memory_profiler)  # noqa: E731
+    else:
+        if args.odds_table:
+            from .odds_table import OddsTable
+            odds_table = OddsTable(args.odds_table)
+        strategy = create_strategy(args.strategy, profiles=profiles)
+        if odds_table is not None and not odds_table.covers(strategy.name, args.score):
+            print(f"{Fore.YELLOW}⚠️  La tabla de probabilidades no incluye la estrategia {strategy.name} "
+                  f"a {args.score} puntos; no se mostrará la probabilidad de ganar.{Style.RESET_ALL}")
+            odds_table.close()
+            odds_table = None
+        if args.player and hasattr(strategy, "dumps"):
+            from .model_store import ModelStore, PersistentStrategy
+            persistent = PersistentStrategy(strategy, ModelStore(args.model_store), args.player)
+            strategy = persistent
+        game = RockPaperScissorsGame(
+            max_score=args.score,
+            strategy=strategy,
+            odds_table=odds_table,
+        )
+        action = lambda: run_game(game, args, memory_profiler)  # noqa: E731
+    
+    try:
+        if args.profile:
+            from .profiling import profile_call
+            code = profile_call(action, args.profile, mode=args.profile_mode)
+            print(f"\n{Fore.CYAN}📈 Perfil guardado en {args.profile}{Style.RESET_ALL}")
+            return code
+        return action()
+    finally:
+        if odds_table is not None:
+            odds_table.close()
+        if persistent is not None:
+            persistent.save()
+            persistent.store.close()
+        if strategy is not None:
+            strategy.close()
+        if memory_profiler is not None:
+            memory_profiler.stop()
+            print(f"\n{Fore.CYAN}🧠 Asignaciones de memoria{Style.RESET_ALL}")
+            print(memory_profiler.format_report())
+
+
 def run_demo_mode() -> int:
     """
     Ejecuta el modo demostración del juego.
@@ -120,6 +386,227 @@ def run_demo_mode() -> int:
     return 0
 
 
+def run_multiplayer_mode(
+    num_players: int, max_score: int, memory_profiler: Optional["MemoryProfiler"] = None
+) -> int:
+    """
+    Ejecuta una partida multijugador: el usuario contra jugadores de la computadora.
+    
+    Args:
+        num_players: Número total de jugadores (el usuario es el jugador 1)
+        max_score: Puntuación necesaria para ganar
+        memory_profiler: Perfilador de memoria a instalar sobre la partida
+        
+    Returns:
+        int: Código de salida
+    """
+    from .game_enums import GameChoice
+    from .multiplayer import MultiplayerGame, random_choices
+    
+    console = RockPaperScissorsGame(max_score=max_score)
+    game = MultiplayerGame(num_players, max_score=max_score)
+    if memory_profiler is not None:
+        memory_profiler.attach(game)
+    
+    print(f"{Fore.CYAN}🎮 MODO MULTIJUGADOR: {num_players} jugadores{Style.RESET_ALL}")
+    console.display_rules()
+    
+    while not game.is_over():
+        print(f"\n{Fore.YELLOW}Ronda {game.rounds_played + 1} - Tus puntos: {game.scores[0]}, "
+              f"mejor rival: {max(game.scores[1:])}{Style.RESET_ALL}")
+        user_choice = console.get_user_choice()
+        if user_choice is None:
+            break
+        
+        choices = [user_choice] + random_choices(num_players - 1)
+        result = game.play_round(choices)
+        thrown = ", ".join(
+            f"{choice}: {count}" for choice, count in zip(GameChoice, result.histogram) if count
+        )
+        print(f"{Fore.MAGENTA}Lanzamientos: {thrown}{Style.RESET_ALL}")
+        if result.is_tie:
+            print(f"{Fore.YELLOW}🤝 ¡Empate! Nadie suma puntos{Style.RESET_ALL}")
+        else:
+            winners = ", ".join(str(choice) for choice in GameChoice if choice in result.winners)
+            color = Fore.GREEN if user_choice in result.winners else Fore.RED
+            print(f"{color}Opciones ganadoras: {winners}{Style.RESET_ALL}")
+    
+    if game.is_over():
+        leaders = game.leaders()
+        if 0 in leaders:
+            print(f"{Fore.GREEN}🏆 ¡FELICITACIONES! ¡Ganaste el juego!{Style.RESET_ALL}")
+        else:
+            players = ", ".join(str(player + 1) for player in leaders)
+            print(f"{Fore.RED}😔 Ganó el jugador {players}. ¡Mejor suerte la próxima vez!{Style.RESET_ALL}")
+    print(f"\n{Fore.YELLOW}¡Gracias por jugar! 🎮✨{Style.RESET_ALL}")
+    return 0
+
+
+def run_battle_royale_mode(
+    num_players: int,
+    seed: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
+    memory_profiler: Optional["MemoryProfiler"] = None,
+) -> int:
+    """
+    Simula un torneo battle royale e informa rondas y rendimiento.
+    
+    Args:
+        num_players: Jugadores simulados
+        seed: Semilla aleatoria
+        checkpoint_path: Archivo para guardar y reanudar el avance
+        memory_profiler: Perfilador de memoria a instalar sobre cada ronda del torneo
+        
+    Returns:
+        int: Código de salida
+    """
+    from .battle_royale import BattleRoyale
+    
+    print(f"{Fore.CYAN}⚔️  BATTLE ROYALE: {num_players:,} jugadores{Style.RESET_ALL}")
+    royale = BattleRoyale(num_players, seed=seed)
+    if memory_profiler is not None:
+        memory_profiler.attach(royale)
+    result = royale.run(checkpoint_path)
+    print(f"{Fore.GREEN}🏆 Campeón: jugador {result.champion + 1}{Style.RESET_ALL}")
+    print(f"Rondas hasta el campeón: {result.rounds}")
+    print(f"Duelos: {result.duels:,} ({result.throws:,} lanzamientos) en {result.elapsed:.3f} s")
+    print(f"Rendimiento: {result.duels_per_second:,.0f} duelos/s, "
+          f"{result.throws_per_second:,.0f} lanzamientos/s")
+    return 0
+
+
+def run_simulation_mode(
+    args: argparse.Namespace, profiles: Optional[Dict[str, Tuple[float, ...]]] = None
+) -> int:
+    """
+    Juega partidas sin interfaz con `SimulationExecutor` y escribe las estadísticas.
+    
+    Sin --output, el informe va a la salida estándar y el resumen legible a
+    la salida de errores, para poder encadenar el comando con otras herramientas.
+    
+    Args:
+        args: Argumentos ya validados del CLI
+        profiles: Perfiles de estrategia cargados con --profiles
+        
+    Returns:
+        int: Código de salida
+    """
+    import json
+    import os
+    import random
+    import time
+    from .batch import SimulationCheckpoint, SimulationExecutor, SimulationJob, simulation_report
+    
+    resumed = None
+    if args.checkpoint and os.path.exists(args.checkpoint):
+        resumed = SimulationCheckpoint.load(args.checkpoint)
+    if args.seed is not None:
+        seed = args.seed
+    elif resumed is not None:
+        # Al reanudar sin --seed se repite la semilla de la simulación guardada
+        seed = resumed.job.seed
+    else:
+        seed = random.SystemRandom().randrange(2**32)
+    job = SimulationJob(
+        args.simulate,
+        user_strategy=args.user_strategy,
+        computer_strategy=args.strategy,
+        max_score=args.score,
+        seed=seed,
+        profiles=profiles,
+    )
+    console = sys.stdout if args.output else sys.stderr
+    print(f"{Fore.CYAN}📊 SIMULACIÓN: {job.matches:,} partidas, {job.user_strategy} contra "
+          f"{job.computer_strategy} (semilla {seed}){Style.RESET_ALL}", file=console)
+    # El rendimiento cuenta también los segundos de las ejecuciones interrumpidas
+    start = time.perf_counter() - (resumed.elapsed if resumed is not None else 0.0)
+    summary = SimulationExecutor(jobs=args.jobs).run(job, checkpoint_path=args.checkpoint)
+    report = simulation_report(job, summary, time.perf_counter() - start)
+    
+    if args.format == "ndjson":
+        record = json.dumps(report, ensure_ascii=False, separators=(",", ":")) + "\n"
+    else:
+        record = json.dumps(report, ensure_ascii=False, indent=2) + "\n"
+    if args.output:
+        with open(args.output, "a" if args.format == "ndjson" else "w", encoding="utf-8") as handle:
+            handle.write(record)
+    else:
+        sys.stdout.write(record)
+    
+    print(f"Usuario: {report['user_win_rate']:.2%}  Computadora: {report['computer_win_rate']:.2%}  "
+          f"Rondas por partida: {report['rounds_per_match']:.2f}", file=console)
+    print(f"Rendimiento: {report['matches_per_second']:,.0f} partidas/s en {report['elapsed']:.3f} s",
+          file=console)
+    if args.output:
+        print(f"{Fore.GREEN}💾 Estadísticas guardadas en {args.output}{Style.RESET_ALL}", file=console)
+    return 0
+
+
+def run_game(
+    game: RockPaperScissorsGame,
+    args: argparse.Namespace,
+    memory_profiler: Optional["MemoryProfiler"] = None,
+) -> int:
+    """
+    Ejecuta el juego con la observabilidad solicitada en la línea de comandos.
+    
+    Args:
+        game: Juego a ejecutar
+        args: Argumentos ya validados del CLI
+        memory_profiler: Perfilador de memoria a instalar sobre el juego
+        
+    Returns:
+        int: Código de salida
+    """
+    instrumentation = None
+    metrics = None
+    server = None
+    writer = None
+    tracer = None
+    
+    if args.instrument:
+        from .instrumentation import RoundInstrumentation
+        instrumentation = RoundInstrumentation()
+        instrumentation.attach(game)
+    
+    if args.metrics_port is not None or args.metrics_textfile:
+        from .metrics import GameMetrics, serve_metrics, start_textfile_writer
+        metrics = GameMetrics()
+        metrics.attach(game)
+        if args.metrics_port is not None:
+            server = serve_metrics(metrics, port=args.metrics_port)
+        if args.metrics_textfile:
+            writer = start_textfile_writer(metrics, args.metrics_textfile)
+    
+    if args.trace:
+        from .tracing import ChromeTracer
+        tracer = ChromeTracer(args.trace)
+        tracer.attach(game)
+    
+    if memory_profiler is not None:
+        memory_profiler.attach(game)
+    
+    try:
+        game.run()
+    finally:
+        if memory_profiler is not None:
+            memory_profiler.detach(game)
+        if tracer is not None:
+            tracer.detach(game)
+            tracer.close()
+        if metrics is not None:
+            from .metrics import stop_textfile_writer
+            stop_textfile_writer(writer)
+            if server is not None:
+                server.shutdown()
+            metrics.detach(game)
+        if instrumentation is not None:
+            instrumentation.detach(game)
+            print(f"\n{Fore.CYAN}📊 Instrumentación por fases{Style.RESET_ALL}")
+            print(instrumentation.format_report())
+    return 0
+
+
 def run_interactive() -> None:
     """Ejecuta el juego en modo interactivo (sin argumentos de línea de comandos)."""
     try:
@@ -0,0 +1,331 @@
+"""
+Métricas Prometheus/OpenMetrics para el juego Piedra, Papel, Tijeras, Lagarto, Spock
+
+Este módulo expone contadores e histogramas de rondas jugadas, partidas
+terminadas, resultados por `GameResult`, latencia de ronda y sesiones activas.
+
+Cada hilo acumula en su propio fragmento (shard) sin tomar ningún lock; sólo la
+exportación recorre los fragmentos y suma sus valores. Las métricas se pueden
+servir por HTTP en un endpoint local o escribir periódicamente en un archivo
+para el textfile collector de node_exporter.
+"""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .game_enums import GameResult
+from .instrumentation import install_wrappers, restore_wrappers
+
+# Límites superiores (segundos) de los buckets del histograma de latencia
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+class _Shard:
+    """Acumuladores de un único hilo; sólo ese hilo los modifica."""
+
+    __slots__ = ("rounds", "matches", "results", "buckets", "latency_sum", "sessions")
+
+    def __init__(self) -> None:
+        self.rounds = 0
+        self.matches = 0
+        self.results: Dict[GameResult, int] = dict.fromkeys(GameResult, 0)
+        self.buckets: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.sessions = 0
+
+
+class GameMetrics:
+    """
+    Registro de métricas del servicio de juego con acumulación por hilo.
+
+    Uso:
+        metrics = GameMetrics()
+        metrics.attach(game)
+        server = serve_metrics(metrics, port=9464)
+    """
+
+    def __init__(self, prefix: str = "rpsls"):
+        """
+        Inicializa un registro vacío.
+
+        Args:
+            prefix: Prefijo de los nombres de las métricas exportadas
+        """
+        self.prefix = prefix
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._register_lock = threading.Lock()
+        self._installed: Dict[int, Dict[str, Any]] = {}
+
+    def _shard(self) -> _Shard:
+        """Retorna el fragmento del hilo actual, creándolo la primera vez."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard()
+            self._local.shard = shard
+            # El lock sólo se toma una vez por hilo, nunca en el camino caliente
+            with self._register_lock:
+                self._shards.append(shard)
+        return shard
+
+    def observe_round(self, result: GameResult) -> None:
+        """
+        Registra una ronda resuelta.
+
+        Args:
+            result: Resultado de la ronda
+        """
+        shard = self._shard()
+        shard.rounds += 1
+        shard.results[result] += 1
+
+    def observe_latency(self, seconds: float) -> None:
+        """
+        Registra la duración de una llamada a `play_round`.
+
+        Args:
+            seconds: Duración en segundos
+        """
+        shard = self._shard()
+        index = 0
+        for bound in LATENCY_BUCKETS:
+            if seconds <= bound:
+                break
+            index += 1
+        shard.buckets[index] += 1
+        shard.latency_sum += seconds
+
+    def match_finished(self) -> None:
+        """Registra una partida que llegó a la puntuación máxima."""
+        self._shard().matches += 1
+
+    def session_started(self) -> None:
+        """Incrementa el número de sesiones activas."""
+        self._shard().sessions += 1
+
+    def session_ended(self) -> None:
+        """Decrementa el número de sesiones activas."""
+        self._shard().sessions -= 1
+
+    def attach(self, game: Any) -> None:
+        """
+        Instala la recolección de métricas sobre una instancia del juego.
+
+        Args:
+            game: Instancia de RockPaperScissorsGame
+        """
+        if id(game) in self._installed:
+            return
+        self._installed[id(game)] = install_wrappers(game, {
+            "run": self._wrap_run,
+            "play_round": self._wrap_play_round,
+            "_update_score": self._wrap_update_score,
+            "_display_final_result": self._wrap_final_result,
+        })
+
+    def detach(self, game: Any) -> None:
+        """
+        Retira la recolección de métricas de una instancia del juego.
+
+        Args:
+            game: Instancia previamente instrumentada
+        """
+        previous = self._installed.pop(id(game), None)
+        if previous is not None:
+            restore_wrappers(game, previous)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Suma los fragmentos de todos los hilos.
+
+        Returns:
+            Dict[str, Any]: Valores agregados de cada métrica
+        """
+        with self._register_lock:
+            shards = list(self._shards)
+        results = dict.fromkeys(GameResult, 0)
+        buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        totals = {"rounds": 0, "matches": 0, "sessions": 0, "latency_sum": 0.0}
+        for shard in shards:
+            totals["rounds"] += shard.rounds
+            totals["matches"] += shard.matches
+            totals["sessions"] += shard.sessions
+            totals["latency_sum"] += shard.latency_sum
+            for result, count in shard.results.items():
+                results[result] += count
+            for index, count in enumerate(shard.buckets):
+                buckets[index] += count
+        return {**totals, "results": results, "buckets": buckets}
+
+    def render(self) -> str:
+        """
+        Genera la exposición en formato OpenMetrics.
+
+        Returns:
+            str: Texto listo para servir en /metrics
+        """
+        data = self.snapshot()
+        p = self.prefix
+        lines = [
+            f"# TYPE {p}_rounds counter",
+            f"# HELP {p}_rounds Rondas resueltas.",
+            f"{p}_rounds_total {data['rounds']}",
+            f"# TYPE {p}_matches_finished counter",
+            f"# HELP {p}_matches_finished Partidas que alcanzaron la puntuación máxima.",
+            f"{p}_matches_finished_total {data['matches']}",
+            f"# TYPE {p}_round_results counter",
+            f"# HELP {p}_round_results Rondas por resultado.",
+        ]
+        for result, count in data["results"].items():
+            lines.append(f'{p}_round_results_total{{result="{result.value}"}} {count}')
+
+        lines += [
+            f"# TYPE {p}_round_latency_seconds histogram",
+            f"# HELP {p}_round_latency_seconds Duración de play_round.",
+        ]
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), data["buckets"]):
+            cumulative += count
+            label = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'{p}_round_latency_seconds_bucket{{le="{label}"}} {cumulative}')
+        lines += [
+            f"{p}_round_latency_seconds_sum {data['latency_sum']}",
+            f"{p}_round_latency_seconds_count {cumulative}",
+            f"# TYPE {p}_active_sessions gauge",
+            f"# HELP {p}_active_sessions Sesiones de juego en curso.",
+            f"{p}_active_sessions {data['sessions']}",
+            "# EOF",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def _wrap_run(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            self.session_started()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.session_ended()
+
+        return wrapper
+
+    def _wrap_play_round(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.observe_latency(time.perf_counter() - start)
+
+        return wrapper
+
+    def _wrap_update_score(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(result: GameResult) -> Any:
+            self.observe_round(result)
+            return method(result)
+
+        return wrapper
+
+    def _wrap_final_result(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            self.match_finished()
+            return method(*args, **kwargs)
+
+        return wrapper
+
+
+def serve_metrics(
+    metrics: GameMetrics, host: str = "127.0.0.1", port: int = 9464
+) -> ThreadingHTTPServer:
+    """
+    Sirve las métricas por HTTP en un hilo demonio.
+
+    Args:
+        metrics: Registro a exponer
+        host: Dirección de escucha (por defecto sólo local)
+        port: Puerto de escucha; 0 elige uno libre
+
+    Returns:
+        ThreadingHTTPServer: Servidor en marcha; `shutdown()` lo detiene
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 (nombre impuesto por http.server)
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            # Las peticiones de scraping no deben ensuciar la consola del juego
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True)
+    thread.start()
+    return server
+
+
+def write_textfile(metrics: GameMetrics, path: str) -> None:
+    """
+    Escribe las métricas en un archivo de forma atómica.
+
+    Args:
+        metrics: Registro a exportar
+        path: Ruta del archivo .prom leído por el textfile collector
+    """
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as handle:
+        handle.write(metrics.render())
+    os.replace(temporary, path)
+
+
+def start_textfile_writer(
+    metrics: GameMetrics, path: str, interval: float = 15.0
+) -> Tuple[threading.Thread, threading.Event]:
+    """
+    Escribe las métricas periódicamente en un hilo demonio.
+
+    Args:
+        metrics: Registro a exportar
+        path: Ruta del archivo .prom
+        interval: Segundos entre escrituras
+
+    Returns:
+        Tuple[threading.Thread, threading.Event]: Hilo escritor y evento que lo
+        detiene (al detenerse escribe una última vez)
+    """
+    stop = threading.Event()
+
+    def loop() -> None:
+        while not stop.wait(interval):
+            write_textfile(metrics, path)
+        write_textfile(metrics, path)
+
+    thread = threading.Thread(target=loop, name="metrics-textfile", daemon=True)
+    thread.start()
+    return thread, stop
+
+
+def stop_textfile_writer(writer: Optional[Tuple[threading.Thread, threading.Event]]) -> None:
+    """
+    Detiene un escritor creado con `start_textfile_writer`.
+
+    Args:
+        writer: Valor devuelto por `start_textfile_writer` (o None)
+    """
+    if writer is None:
+        return
+    thread, stop = writer
+    stop.set()
+    thread.join()
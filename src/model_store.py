@@ -0,0 +1,221 @@
+"""
+Almacén persistente de modelos de jugador para estrategias adaptativas
+
+Las estrategias adaptativas (como `prediction.SketchPredictorStrategy`) aprenden
+de cada jugador. `ModelStore` guarda el modelo aprendido de cada par
+(jugador, estrategia) en una base SQLite, comprimido con zlib, para que la
+siguiente partida del mismo jugador empiece con lo ya aprendido.
+
+`PersistentStrategy` envuelve una estrategia adaptativa: carga el modelo del
+jugador de forma perezosa en la primera decisión de la partida y lo devuelve al
+almacén al terminar cada partida. El almacén acumula los modelos pendientes y
+los escribe en lotes dentro de una sola transacción.
+
+Una estrategia es persistible si implementa `dumps() -> bytes` y
+`loads(bytes)`.
+"""
+
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from .game_enums import GameChoice
+from .strategies import ComputerStrategy
+
+DEFAULT_PATH = "modelos.sqlite3"
+DEFAULT_BATCH_SIZE = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS models (
+    player_id TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    data BLOB NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (player_id, strategy)
+)
+"""
+
+_UPSERT = """
+INSERT INTO models (player_id, strategy, data, updated) VALUES (?, ?, ?, ?)
+ON CONFLICT (player_id, strategy) DO UPDATE SET data = excluded.data, updated = excluded.updated
+"""
+
+
+class ModelStore:
+    """
+    Modelos de jugador en SQLite con escrituras por lotes.
+
+    Uso:
+        with ModelStore("modelos.sqlite3") as store:
+            strategy = PersistentStrategy(SketchPredictorStrategy(), store, "ana")
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Abre (o crea) el almacén.
+
+        Args:
+            path: Archivo SQLite (":memory:" para un almacén temporal)
+            batch_size: Modelos pendientes que disparan una escritura
+
+        Raises:
+            ValueError: Si el tamaño de lote no es positivo
+        """
+        if batch_size < 1:
+            raise ValueError("El tamaño de lote debe ser al menos 1.")
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str], bytes] = {}
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(_SCHEMA)
+        self._closed = False
+
+    def __enter__(self) -> "ModelStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def load(self, player_id: str, strategy: str) -> Optional[bytes]:
+        """
+        Obtiene el modelo guardado de un jugador.
+
+        Args:
+            player_id: Identificador del jugador
+            strategy: Nombre de la estrategia
+
+        Returns:
+            Optional[bytes]: Modelo serializado, o None si el jugador es nuevo
+        """
+        key = (player_id, strategy)
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+            row = self._connection.execute(
+                "SELECT data FROM models WHERE player_id = ? AND strategy = ?", key
+            ).fetchone()
+        return zlib.decompress(row[0]) if row is not None else None
+
+    def save(self, player_id: str, strategy: str, data: bytes) -> None:
+        """
+        Encola el modelo de un jugador; se escribe al completar un lote.
+
+        Args:
+            player_id: Identificador del jugador
+            strategy: Nombre de la estrategia
+            data: Modelo serializado
+        """
+        with self._lock:
+            self._pending[(player_id, strategy)] = data
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Escribe todos los modelos pendientes en una transacción."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        now = time.time()
+        rows: List[Tuple[str, str, bytes, float]] = [
+            (player_id, strategy, zlib.compress(data), now)
+            for (player_id, strategy), data in self._pending.items()
+        ]
+        with self._connection:
+            self._connection.executemany(_UPSERT, rows)
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Escribe lo pendiente y cierra la base de datos."""
+        if self._closed:
+            return
+        self.flush()
+        self._connection.close()
+        self._closed = True
+
+
+class PersistentStrategy(ComputerStrategy):
+    """
+    Estrategia adaptativa cuyo modelo se conserva entre sesiones de un jugador.
+
+    El modelo se carga en la primera decisión (no al crear el juego) y se
+    devuelve al almacén al reiniciar la partida o al llamar a `save`.
+    """
+
+    def __init__(self, strategy: ComputerStrategy, store: ModelStore, player_id: str):
+        """
+        Envuelve una estrategia persistible.
+
+        Args:
+            strategy: Estrategia con `dumps()` y `loads(data)`
+            store: Almacén de modelos
+            player_id: Identificador del jugador
+
+        Raises:
+            TypeError: Si la estrategia no se puede serializar
+        """
+        if not (hasattr(strategy, "dumps") and hasattr(strategy, "loads")):
+            raise TypeError(f"La estrategia {strategy.name} no guarda modelos.")
+        self.strategy = strategy
+        self.store = store
+        self.player_id = player_id
+        self.name = strategy.name
+        self._loaded = False
+        self._dirty = False
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        data = self.store.load(self.player_id, self.name)
+        if data is not None:
+            self.strategy.loads(data)
+
+    def choose(self) -> GameChoice:
+        """
+        Decide con el modelo del jugador, cargándolo si hace falta.
+
+        Returns:
+            GameChoice: Elección de la computadora
+        """
+        self._ensure_loaded()
+        return self.strategy.choose()
+
+    def observe(self, opponent_choice: GameChoice, own_choice: GameChoice) -> None:
+        """
+        Entrena el modelo del jugador con la ronda.
+
+        Args:
+            opponent_choice: Elección del jugador
+            own_choice: Elección de la computadora
+        """
+        self._ensure_loaded()
+        self.strategy.observe(opponent_choice, own_choice)
+        self._dirty = True
+
+    def reset(self) -> None:
+        """Guarda lo aprendido en la partida y reinicia la estrategia."""
+        self.save()
+        self.strategy.reset()
+
+    def close(self) -> None:
+        """Libera los recursos de la estrategia envuelta (no cierra el almacén)."""
+        self.strategy.close()
+
+    def save(self) -> None:
+        """Encola el modelo en el almacén si cambió desde el último guardado."""
+        if not self._dirty:
+            return
+        try:
+            data = self.strategy.dumps()
+        except TimeoutError:
+            # Estrategia aislada ocupada: se reintenta en el siguiente guardado
+            return
+        self.store.save(self.player_id, self.name, data)
+        self._dirty = False
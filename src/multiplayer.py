@@ -0,0 +1,218 @@
+"""
+Modo multijugador del juego Piedra, Papel, Tijeras, Lagarto, Spock
+
+En cada ronda N jugadores lanzan a la vez. En lugar de comparar todos los pares
+de jugadores (O(N²) llamadas a `compare_choices`), la ronda se resuelve a partir
+del histograma de opciones lanzadas y de máscaras de bits de víctimas derivadas
+de `GameChoice.beats`: contar es O(N) y el resto sólo depende de las 5 opciones.
+
+Reglas de la ronda:
+- Cada opción presente recibe un balance neto por pares: jugadores a los que
+  vence menos jugadores que la vencen.
+- Ganan los jugadores cuya opción tiene el mayor balance, si es positivo.
+- Si el mayor balance es cero (todos eligieron lo mismo o las opciones
+  presentes forman un ciclo equilibrado), la ronda es empate.
+
+Con muchos jugadores casi siempre están presentes las 5 opciones, así que exigir
+una opción invicta haría que todas las rondas fueran empate; el balance neto
+sigue eligiendo un ganador.
+"""
+
+import random
+from collections import Counter
+from typing import FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .game_enums import GameChoice
+
+CHOICES: Tuple[GameChoice, ...] = tuple(GameChoice)
+CHOICE_INDEX = {choice: index for index, choice in enumerate(CHOICES)}
+
+# Bit j de VICTIM_MASKS[i]: la opción i vence a la opción j
+VICTIM_MASKS: Tuple[int, ...] = tuple(
+    sum(1 << j for j, other in enumerate(CHOICES) if choice.beats(other)) for choice in CHOICES
+)
+
+# Bit j de PREDATOR_MASKS[i]: la opción j vence a la opción i
+PREDATOR_MASKS: Tuple[int, ...] = tuple(
+    sum(1 << j for j, other in enumerate(CHOICES) if other.beats(choice)) for choice in CHOICES
+)
+
+
+class MultiplayerRoundResult(NamedTuple):
+    """Resultado de una ronda multijugador."""
+
+    histogram: Tuple[int, ...]
+    """Cantidad de jugadores que lanzó cada opción, en el orden de GameChoice"""
+
+    winners: FrozenSet[GameChoice]
+    """Opciones presentes con el mayor balance neto positivo (vacío si es empate)"""
+
+    wins: Tuple[int, ...]
+    """Por opción: jugadores a los que vence (equivale a sus victorias por pares)"""
+
+    losses: Tuple[int, ...]
+    """Por opción: jugadores que la vencen (equivale a sus derrotas por pares)"""
+
+    @property
+    def net(self) -> Tuple[int, ...]:
+        """Por opción: balance neto de victorias menos derrotas por pares."""
+        return tuple(won - lost for won, lost in zip(self.wins, self.losses))
+
+    @property
+    def is_tie(self) -> bool:
+        """True si nadie gana la ronda."""
+        return not self.winners
+
+
+def choice_histogram(choices: Iterable[GameChoice]) -> Tuple[int, ...]:
+    """
+    Cuenta cuántos jugadores lanzaron cada opción.
+
+    Args:
+        choices: Opciones lanzadas por los jugadores
+
+    Returns:
+        Tuple[int, ...]: Conteo por opción, en el orden de GameChoice
+    """
+    counts = Counter(choices)
+    return tuple(counts.get(choice, 0) for choice in CHOICES)
+
+
+def resolve_histogram(histogram: Sequence[int]) -> MultiplayerRoundResult:
+    """
+    Resuelve una ronda a partir del histograma de opciones.
+
+    Args:
+        histogram: Conteo por opción, en el orden de GameChoice
+
+    Returns:
+        MultiplayerRoundResult: Opciones ganadoras y totales por opción
+    """
+    present = 0
+    for index, count in enumerate(histogram):
+        if count:
+            present |= 1 << index
+
+    wins = []
+    losses = []
+    for index in range(len(CHOICES)):
+        victims = VICTIM_MASKS[index] & present
+        predators = PREDATOR_MASKS[index] & present
+        wins.append(sum(histogram[j] for j in range(len(CHOICES)) if victims >> j & 1))
+        losses.append(sum(histogram[j] for j in range(len(CHOICES)) if predators >> j & 1))
+
+    net = [wins[index] - losses[index] for index in range(len(CHOICES)) if histogram[index]]
+    best = max(net, default=0)
+    winners = []
+    if best > 0:
+        winners = [
+            choice
+            for index, choice in enumerate(CHOICES)
+            if histogram[index] and wins[index] - losses[index] == best
+        ]
+
+    return MultiplayerRoundResult(tuple(histogram), frozenset(winners), tuple(wins), tuple(losses))
+
+
+def resolve_round(choices: Iterable[GameChoice]) -> MultiplayerRoundResult:
+    """
+    Resuelve una ronda en la que todos los jugadores lanzan a la vez.
+
+    Args:
+        choices: Opción de cada jugador
+
+    Returns:
+        MultiplayerRoundResult: Resultado de la ronda
+    """
+    return resolve_histogram(choice_histogram(choices))
+
+
+class MultiplayerGame:
+    """
+    Partida multijugador: gana quien alcance primero la puntuación máxima.
+
+    Cada ronda suma un punto a todos los jugadores cuya opción resultó ganadora.
+    """
+
+    def __init__(self, num_players: int, max_score: int = 3):
+        """
+        Inicializa una partida multijugador.
+
+        Args:
+            num_players: Número de jugadores (mínimo 2)
+            max_score: Puntuación necesaria para ganar la partida
+
+        Raises:
+            ValueError: Si hay menos de 2 jugadores
+        """
+        if num_players < 2:
+            raise ValueError(f"Número de jugadores inválido: {num_players}. Debe ser al menos 2.")
+        self.num_players = num_players
+        self.max_score = max_score
+        self.scores: List[int] = [0] * num_players
+        self.rounds_played = 0
+
+    def reset_game(self) -> None:
+        """Reinicia la partida a su estado inicial."""
+        self.scores = [0] * self.num_players
+        self.rounds_played = 0
+
+    def play_round(self, choices: Sequence[GameChoice]) -> MultiplayerRoundResult:
+        """
+        Juega una ronda con las opciones de todos los jugadores.
+
+        Args:
+            choices: Opción de cada jugador, en orden de jugador
+
+        Returns:
+            MultiplayerRoundResult: Resultado de la ronda
+
+        Raises:
+            ValueError: Si no hay una opción por jugador
+        """
+        if len(choices) != self.num_players:
+            raise ValueError(
+                f"Se esperaban {self.num_players} opciones, se recibieron {len(choices)}."
+            )
+        result = resolve_round(choices)
+        if result.winners:
+            winners = result.winners
+            scores = self.scores
+            for player, choice in enumerate(choices):
+                if choice in winners:
+                    scores[player] += 1
+        self.rounds_played += 1
+        return result
+
+    def is_over(self) -> bool:
+        """
+        Verifica si algún jugador alcanzó la puntuación máxima.
+
+        Returns:
+            bool: True si la partida terminó
+        """
+        return max(self.scores) >= self.max_score
+
+    def leaders(self) -> List[int]:
+        """
+        Retorna los jugadores con la puntuación más alta.
+
+        Returns:
+            List[int]: Índices (desde 0) de los jugadores en cabeza
+        """
+        best = max(self.scores)
+        return [player for player, score in enumerate(self.scores) if score == best]
+
+
+def random_choices(count: int, rng: Optional[random.Random] = None) -> List[GameChoice]:
+    """
+    Genera opciones aleatorias para varios jugadores controlados por la computadora.
+
+    Args:
+        count: Número de opciones a generar
+        rng: Generador a usar (por defecto, el módulo random)
+
+    Returns:
+        List[GameChoice]: Opciones aleatorias
+    """
+    return (rng or random).choices(CHOICES, k=count)
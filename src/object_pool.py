@@ -0,0 +1,126 @@
+"""
+Pool de objetos de partida
+
+Un servidor abre y cierra sesiones constantemente; crear un juego nuevo por
+sesión genera millones de objetos de vida corta y presión sobre el recolector
+de basura. `GameObjectPool` recicla las partidas terminadas: `release` las
+guarda y `acquire` las devuelve reiniciadas con `reset_game`, en lugar de
+construir instancias nuevas.
+
+Las partidas son `GameEngine` (con `__slots__`, sin diccionario de atributos)
+y comparten una estrategia uniforme cuando no se indica otra.
+"""
+
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, NamedTuple, Optional
+
+from .game import GameEngine
+from .strategies import ComputerStrategy, UniformStrategy
+
+DEFAULT_POOL_SIZE = 1024
+
+# La estrategia uniforme sin generador propio no guarda estado: se comparte
+_SHARED_UNIFORM = UniformStrategy()
+
+
+class PoolStats(NamedTuple):
+    """Contadores de un pool de partidas."""
+
+    created: int
+    """Partidas construidas"""
+
+    reused: int
+    """Partidas entregadas a partir de una reciclada"""
+
+    idle: int
+    """Partidas libres a la espera de reutilizarse"""
+
+
+class GameObjectPool:
+    """
+    Recicla partidas terminadas en lugar de construir instancias nuevas.
+
+    Uso:
+        pool = GameObjectPool()
+        with pool.lease(max_score=5, strategy=strategy) as game:
+            play_match(game, user)
+    """
+
+    def __init__(self, max_size: int = DEFAULT_POOL_SIZE, factory: Callable[[], GameEngine] = GameEngine):
+        """
+        Crea un pool vacío.
+
+        Args:
+            max_size: Partidas libres que se conservan como mucho; las demás se descartan
+            factory: Constructor de partidas nuevas
+
+        Raises:
+            ValueError: Si el tamaño máximo es negativo
+        """
+        if max_size < 0:
+            raise ValueError("El tamaño máximo del pool no puede ser negativo.")
+        self.max_size = max_size
+        self.factory = factory
+        self._free: List[GameEngine] = []
+        self._created = 0
+        self._reused = 0
+
+    @property
+    def stats(self) -> PoolStats:
+        """Contadores actuales del pool."""
+        return PoolStats(self._created, self._reused, len(self._free))
+
+    def acquire(self, max_score: int = 3, strategy: Optional[ComputerStrategy] = None) -> GameEngine:
+        """
+        Entrega una partida lista para jugar.
+
+        Args:
+            max_score: Puntuación máxima para ganar
+            strategy: Estrategia de la computadora (por defecto, uniforme compartida)
+
+        Returns:
+            GameEngine: Partida en su estado inicial
+        """
+        if self._free:
+            game = self._free.pop()
+            self._reused += 1
+        else:
+            game = self.factory()
+            self._created += 1
+        game.max_score = max_score
+        game.strategy = strategy if strategy is not None else _SHARED_UNIFORM
+        game.reset_game()
+        return game
+
+    def release(self, game: GameEngine) -> None:
+        """
+        Devuelve una partida al pool.
+
+        La partida no debe usarse después de devolverla. Se suelta la referencia
+        a su estrategia para no retenerla mientras espera.
+
+        Args:
+            game: Partida terminada
+        """
+        if len(self._free) < self.max_size:
+            game.strategy = _SHARED_UNIFORM
+            game.odds_table = None
+            self._free.append(game)
+
+    @contextmanager
+    def lease(self, max_score: int = 3, strategy: Optional[ComputerStrategy] = None) -> Iterator[GameEngine]:
+        """
+        Presta una partida y la devuelve al pool al salir del bloque.
+
+        Args:
+            max_score: Puntuación máxima para ganar
+            strategy: Estrategia de la computadora
+
+        Yields:
+            GameEngine: Partida en su estado inicial
+        """
+        game = self.acquire(max_score, strategy)
+        try:
+            yield game
+        finally:
+            self.release(game)
@@ -0,0 +1,168 @@
+"""
+Probabilidad exacta de ganar una partida de Piedra, Papel, Tijeras, Lagarto, Spock
+
+La partida es una cadena de Markov absorbente sobre los estados
+(user_score, computer_score): en cada ronda el usuario suma con probabilidad p,
+la computadora con probabilidad q y con probabilidad 1 - p - q hay empate y el
+estado no cambia. Como los empates sólo repiten el estado, la probabilidad de
+ganar depende únicamente de p / (p + q) y de los puntos que le faltan a cada
+lado, y se resuelve con programación dinámica memorizada en lugar de simular
+millones de partidas.
+
+Las estrategias mixtas son secuencias de 5 pesos en el orden de `GameChoice`.
+Con `fractions.Fraction` como pesos el resultado es exacto.
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+from typing import NamedTuple, Sequence, Tuple, Union
+
+from .game_enums import GameChoice
+
+CHOICES: Tuple[GameChoice, ...] = tuple(GameChoice)
+
+# Probabilidad en coma flotante o exacta (los enteros valen como float)
+Probability = Union[float, Fraction]
+
+MixedStrategy = Sequence[Probability]
+
+UNIFORM_STRATEGY: Tuple[float, ...] = (0.2,) * len(CHOICES)
+
+
+class RoundProbabilities(NamedTuple):
+    """Probabilidades de los resultados de una ronda."""
+
+    user_wins: Probability
+    computer_wins: Probability
+    tie: Probability
+
+
+class MatchOdds(NamedTuple):
+    """Probabilidad de que cada lado gane la partida."""
+
+    user: Probability
+    computer: Probability
+
+
+def normalize_strategy(strategy: MixedStrategy) -> Tuple[Probability, ...]:
+    """
+    Valida una estrategia mixta y la normaliza para que sume 1.
+
+    Args:
+        strategy: Pesos de cada opción en el orden de GameChoice
+
+    Returns:
+        Tuple[Probability, ...]: Probabilidades normalizadas
+
+    Raises:
+        ValueError: Si no hay 5 pesos no negativos con suma positiva
+    """
+    if len(strategy) != len(CHOICES):
+        raise ValueError(f"Una estrategia debe tener {len(CHOICES)} pesos, se recibieron {len(strategy)}.")
+    if any(weight < 0 for weight in strategy):
+        raise ValueError("Los pesos de una estrategia no pueden ser negativos.")
+    total = sum(strategy)
+    if total <= 0:
+        raise ValueError("Los pesos de una estrategia deben sumar más que 0.")
+    return tuple(weight / total for weight in strategy)
+
+
+def round_probabilities(
+    user_strategy: MixedStrategy, computer_strategy: MixedStrategy
+) -> RoundProbabilities:
+    """
+    Calcula la probabilidad de cada resultado de una ronda.
+
+    Args:
+        user_strategy: Estrategia mixta del usuario
+        computer_strategy: Estrategia mixta de la computadora
+
+    Returns:
+        RoundProbabilities: Probabilidades de victoria, derrota y empate
+    """
+    user = normalize_strategy(user_strategy)
+    computer = normalize_strategy(computer_strategy)
+    user_wins = 0 * user[0]
+    computer_wins = 0 * user[0]
+    for i, user_choice in enumerate(CHOICES):
+        for j, computer_choice in enumerate(CHOICES):
+            if user_choice.beats(computer_choice):
+                user_wins += user[i] * computer[j]
+            elif computer_choice.beats(user_choice):
+                computer_wins += user[i] * computer[j]
+    return RoundProbabilities(user_wins, computer_wins, 1 - user_wins - computer_wins)
+
+
+@lru_cache(maxsize=256)
+def _win_table(decisive_user: Probability, size: int) -> Tuple[Tuple[Probability, ...], ...]:
+    """
+    Tabla de probabilidades de victoria del usuario por puntos faltantes.
+
+    La celda [a][b] es la probabilidad de que el usuario gane cuando le faltan
+    `a` puntos y a la computadora `b`. Se rellena de abajo hacia arriba.
+
+    Args:
+        decisive_user: Probabilidad de que una ronda no empatada la gane el usuario
+        size: Máximo de puntos faltantes por lado
+
+    Returns:
+        Tuple[Tuple[Probability, ...], ...]: Tabla de (size + 1) x (size + 1)
+    """
+    one = decisive_user ** 0
+    zero = one - one
+    decisive_computer = one - decisive_user
+    table = [[zero] * (size + 1) for _ in range(size + 1)]
+    for b in range(1, size + 1):
+        table[0][b] = one
+    for a in range(1, size + 1):
+        for b in range(1, size + 1):
+            table[a][b] = decisive_user * table[a - 1][b] + decisive_computer * table[a][b - 1]
+    return tuple(tuple(row) for row in table)
+
+
+def match_win_probability(
+    max_score: int,
+    user_score: int = 0,
+    computer_score: int = 0,
+    user_strategy: MixedStrategy = UNIFORM_STRATEGY,
+    computer_strategy: MixedStrategy = UNIFORM_STRATEGY,
+) -> MatchOdds:
+    """
+    Calcula la probabilidad exacta de que cada lado gane la partida.
+
+    Args:
+        max_score: Puntuación necesaria para ganar
+        user_score: Puntuación actual del usuario
+        computer_score: Puntuación actual de la computadora
+        user_strategy: Estrategia mixta del usuario
+        computer_strategy: Estrategia mixta de la computadora
+
+    Returns:
+        MatchOdds: Probabilidades de victoria de usuario y computadora. Si
+        ninguna ronda puede decidirse (p. ej. ambos juegan siempre lo mismo),
+        la partida no termina y ambas son 0.
+
+    Raises:
+        ValueError: Si la puntuación máxima o el marcador no son válidos
+    """
+    if max_score < 1:
+        raise ValueError(f"Puntuación máxima inválida: {max_score}. Debe ser al menos 1.")
+    if not (0 <= user_score <= max_score and 0 <= computer_score <= max_score):
+        raise ValueError(f"Marcador inválido: {user_score}-{computer_score} con máximo {max_score}.")
+    if user_score >= max_score and computer_score >= max_score:
+        raise ValueError("Ambos lados no pueden haber alcanzado la puntuación máxima.")
+
+    probabilities = round_probabilities(user_strategy, computer_strategy)
+    one = probabilities.tie ** 0
+    if user_score >= max_score:
+        return MatchOdds(one, one - one)
+    if computer_score >= max_score:
+        return MatchOdds(one - one, one)
+
+    decisive = probabilities.user_wins + probabilities.computer_wins
+    if decisive == 0:
+        return MatchOdds(one - one, one - one)
+
+    table = _win_table(probabilities.user_wins / decisive, max_score)
+    user = table[max_score - user_score][max_score - computer_score]
+    return MatchOdds(user, one - user)
@@ -0,0 +1,237 @@
+"""
+Tabla precalculada de probabilidades de victoria, mapeada en memoria
+
+La tabla cubre todos los estados (user_score, computer_score) de cada
+puntuación máxima entre 1 y el límite del CLI, para cada estrategia integrada
+de la computadora. Se genera una vez fuera de línea y en tiempo de juego se abre
+con mmap, de modo que cada consulta es un desplazamiento y una lectura de 8 bytes.
+
+La probabilidad almacenada supone que el usuario responde de forma óptima a la
+estrategia de la computadora (la opción pura con mejor proporción de rondas
+decididas ganadas, que es la mejor respuesta en la partida completa).
+
+Formato del archivo (little endian):
+    magic b"RPSODDS1" | u32 versión | u32 puntuación máxima | u32 estrategias
+    por estrategia: u16 longitud + nombre UTF-8
+    relleno hasta múltiplo de 8
+    float64 por estado, en orden (estrategia, max_score, user_score, computer_score)
+
+Generación:
+    python -m src.odds_table odds.bin
+"""
+
+import mmap
+import struct
+import sys
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+from .odds import CHOICES, match_win_probability, normalize_strategy
+from .strategies import BUILTIN_STRATEGIES
+
+MAGIC = b"RPSODDS1"
+VERSION = 1
+DEFAULT_MAX_SCORE = 10
+
+_HEADER = struct.Struct("<8sIII")
+_NAME_LENGTH = struct.Struct("<H")
+_VALUE = struct.Struct("<d")
+
+
+def _cells_before(max_score: int) -> int:
+    """Estados de todas las puntuaciones máximas menores que `max_score`."""
+    return sum(score * score for score in range(1, max_score))
+
+
+def best_response(strategy: Sequence[float]) -> Tuple[float, ...]:
+    """
+    Calcula la mejor respuesta pura del usuario a una estrategia mixta.
+
+    Args:
+        strategy: Pesos de la computadora en el orden de GameChoice
+
+    Returns:
+        Tuple[float, ...]: Estrategia pura del usuario con más proporción de
+        rondas decididas ganadas
+    """
+    computer = tuple(float(weight) for weight in normalize_strategy(strategy))
+    best_index = 0
+    best_ratio = -1.0
+    for index, choice in enumerate(CHOICES):
+        wins = sum(p for other, p in zip(CHOICES, computer) if choice.beats(other))
+        losses = sum(p for other, p in zip(CHOICES, computer) if other.beats(choice))
+        ratio = wins / (wins + losses) if wins + losses else 0.0
+        if ratio > best_ratio:
+            best_index, best_ratio = index, ratio
+    return tuple(1.0 if index == best_index else 0.0 for index in range(len(CHOICES)))
+
+
+def build_odds_table(
+    path: str,
+    strategies: Mapping[str, Sequence[float]] = BUILTIN_STRATEGIES,
+    max_score: int = DEFAULT_MAX_SCORE,
+) -> int:
+    """
+    Genera el archivo de la tabla de probabilidades.
+
+    Args:
+        path: Ruta del archivo a escribir
+        strategies: Nombre -> pesos de cada estrategia de la computadora
+        max_score: Mayor puntuación máxima cubierta
+
+    Returns:
+        int: Tamaño del archivo en bytes
+    """
+    header = bytearray(_HEADER.pack(MAGIC, VERSION, max_score, len(strategies)))
+    for name in strategies:
+        encoded = name.encode("utf-8")
+        header += _NAME_LENGTH.pack(len(encoded)) + encoded
+    header += b"\0" * (-len(header) % _VALUE.size)
+
+    values = bytearray()
+    for weights in strategies.values():
+        user = best_response(weights)
+        for score in range(1, max_score + 1):
+            for user_score in range(score):
+                for computer_score in range(score):
+                    odds = match_win_probability(score, user_score, computer_score, user, weights)
+                    values += _VALUE.pack(float(odds.user))
+
+    with open(path, "wb") as handle:
+        handle.write(header)
+        handle.write(values)
+    return len(header) + len(values)
+
+
+class OddsTable:
+    """
+    Tabla de probabilidades abierta con mmap para consultas sin coste.
+
+    Uso:
+        with OddsTable("odds.bin") as table:
+            table.lookup("piedra", max_score=3, user_score=1, computer_score=0)
+    """
+
+    def __init__(self, path: str):
+        """
+        Abre y mapea en memoria el archivo de la tabla.
+
+        Args:
+            path: Ruta del archivo generado con `build_odds_table`
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado
+        """
+        with open(path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, max_score, count = _HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} no es una tabla de probabilidades válida.")
+            offset = _HEADER.size
+            names = []
+            for _ in range(count):
+                (length,) = _NAME_LENGTH.unpack_from(self._map, offset)
+                offset += _NAME_LENGTH.size
+                names.append(bytes(self._map[offset:offset + length]).decode("utf-8"))
+                offset += length
+            offset += -offset % _VALUE.size
+            cells = _cells_before(max_score + 1)
+            if len(self._map) != offset + count * cells * _VALUE.size:
+                raise ValueError(f"{path} está truncado o corrupto.")
+        except (ValueError, struct.error):
+            self._map.close()
+            raise
+
+        self.max_score = max_score
+        self._cells = cells
+        self._data_offset = offset
+        self._strategy_index: Dict[str, int] = {name: index for index, name in enumerate(names)}
+        self._score_offset = tuple(_cells_before(score) for score in range(max_score + 1))
+
+    def __enter__(self) -> "OddsTable":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def strategies(self) -> Tuple[str, ...]:
+        """Nombres de las estrategias incluidas en la tabla."""
+        return tuple(self._strategy_index)
+
+    def covers(self, strategy: str, max_score: int) -> bool:
+        """
+        Indica si la tabla tiene las partidas de una estrategia y puntuación.
+
+        Args:
+            strategy: Nombre de la estrategia de la computadora
+            max_score: Puntuación necesaria para ganar
+
+        Returns:
+            bool: True si `lookup` tiene datos para esa estrategia y puntuación
+        """
+        return strategy in self._strategy_index and 1 <= max_score <= self.max_score
+
+    def lookup(
+        self, strategy: str, max_score: int, user_score: int, computer_score: int
+    ) -> Optional[float]:
+        """
+        Consulta la probabilidad de que el usuario gane la partida.
+
+        Args:
+            strategy: Nombre de la estrategia de la computadora
+            max_score: Puntuación necesaria para ganar
+            user_score: Puntuación actual del usuario
+            computer_score: Puntuación actual de la computadora
+
+        Returns:
+            Optional[float]: Probabilidad, o None si el marcador no está en la
+            tabla (partida terminada o puntuación máxima no cubierta)
+
+        Raises:
+            KeyError: Si la tabla no incluye la estrategia (perfiles, plugins
+                y otras estrategias no integradas no tienen probabilidades)
+        """
+        index = self._strategy_index.get(strategy)
+        if index is None:
+            raise KeyError(f"La tabla de probabilidades no incluye la estrategia {strategy}.")
+        if (
+            not 1 <= max_score <= self.max_score
+            or not 0 <= user_score < max_score
+            or not 0 <= computer_score < max_score
+        ):
+            return None
+        cell = index * self._cells + self._score_offset[max_score] + user_score * max_score + computer_score
+        value: float = _VALUE.unpack_from(self._map, self._data_offset + cell * _VALUE.size)[0]
+        return value
+
+    def close(self) -> None:
+        """Libera el mapeo en memoria."""
+        self._map.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Genera la tabla desde la línea de comandos.
+
+    Args:
+        argv: Argumentos (por defecto, sys.argv[1:])
+
+    Returns:
+        int: Código de salida
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Genera la tabla de probabilidades de victoria")
+    parser.add_argument("path", help="Archivo de salida")
+    parser.add_argument(
+        "--max-score", type=int, default=DEFAULT_MAX_SCORE, help="Mayor puntuación máxima cubierta"
+    )
+    args = parser.parse_args(argv)
+    size = build_odds_table(args.path, max_score=args.max_score)
+    print(f"Tabla escrita en {args.path} ({size} bytes, {len(BUILTIN_STRATEGIES)} estrategias)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,428 @@
+"""
+Estrategias de la computadora como plugins
+
+Además de las estrategias integradas, la computadora puede usar estrategias
+registradas por otros paquetes en el grupo de entry points
+`rpsls.strategies`:
+
+    [project.entry-points."rpsls.strategies"]
+    espejo = "mi_paquete.estrategias:EstrategiaEspejo"
+
+El descubrimiento sólo lee los metadatos de los paquetes instalados; el módulo
+de un plugin se importa cuando se elige esa estrategia. El objeto registrado
+debe ser una subclase de `ComputerStrategy` (o una fábrica) que acepte el
+argumento `rng`.
+
+Cada estrategia declara su presupuesto de latencia por decisión
+(`ComputerStrategy.latency_budget`). Las estrategias de terceros se ejecutan
+en un hilo propio a través de `GuardedStrategy`: si una decisión tarda más que
+el presupuesto o falla, la computadora elige al azar y la ronda sigue. Los
+plugins incluidos en el proyecto son de confianza y se ejecutan en el mismo
+hilo, sin respaldo al azar (las simulaciones con semilla siguen siendo
+reproducibles), pero `MeasuredStrategy` también mide su latencia frente al
+presupuesto. El hilo de una estrategia aislada se libera con `close()`. Si la
+estrategia guarda modelos (`dumps`/`loads`), `PersistableGuardedStrategy` los
+pasa a su hilo para que `--player` también conserve lo aprendido por plugins.
+"""
+
+import importlib
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from .game_enums import GameChoice
+from .strategies import CHOICES, ComputerStrategy
+
+ENTRY_POINT_GROUP = "rpsls.strategies"
+
+# Plugins incluidos en el proyecto: se tratan como de confianza y sólo se miden
+BUILTIN_PLUGINS: Dict[str, str] = {
+    "prediccion": f"{__package__}.prediction:SketchPredictorStrategy",
+}
+
+StrategyFactory = Callable[..., ComputerStrategy]
+
+# Segundos que se espera a que una estrategia aislada entregue o cargue su modelo
+MODEL_TIMEOUT = 1.0
+
+
+def discover_plugins() -> Dict[str, str]:
+    """
+    Lista los plugins de estrategia disponibles sin importarlos.
+
+    Returns:
+        Dict[str, str]: Nombre -> referencia "módulo:objeto"; los incluidos en
+        el proyecto tienen prioridad sobre los de terceros con el mismo nombre
+    """
+    plugins = {entry_point.name: entry_point.value for entry_point in entry_points(group=ENTRY_POINT_GROUP)}
+    plugins.update(BUILTIN_PLUGINS)
+    return plugins
+
+
+def load_plugin(name: str) -> StrategyFactory:
+    """
+    Importa la estrategia de un plugin.
+
+    Args:
+        name: Nombre del plugin
+
+    Returns:
+        StrategyFactory: Clase o fábrica de la estrategia
+
+    Raises:
+        ValueError: Si no hay ningún plugin con ese nombre
+    """
+    reference = BUILTIN_PLUGINS.get(name)
+    if reference is not None:
+        module_name, _, attribute = reference.partition(":")
+        return getattr(importlib.import_module(module_name), attribute)  # type: ignore[no-any-return]
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name == name:
+            return entry_point.load()  # type: ignore[no-any-return]
+    raise ValueError(f"No hay ningún plugin de estrategia llamado {name}.")
+
+
+def create_plugin_strategy(name: str, rng: Optional[random.Random] = None) -> ComputerStrategy:
+    """
+    Crea la estrategia de un plugin: medida si es del proyecto, aislada si es de terceros.
+
+    Quien crea la estrategia debe llamar a `close()` al terminar de usarla.
+
+    Args:
+        name: Nombre del plugin
+        rng: Generador aleatorio
+
+    Returns:
+        ComputerStrategy: Estrategia lista para el juego
+    """
+    strategy = load_plugin(name)(rng=rng)
+    if name in BUILTIN_PLUGINS:
+        return MeasuredStrategy(strategy)
+    if hasattr(strategy, "dumps") and hasattr(strategy, "loads"):
+        return PersistableGuardedStrategy(strategy, rng=rng)
+    return GuardedStrategy(strategy, rng=rng)
+
+
+class GuardStats(NamedTuple):
+    """Estadísticas de las decisiones de una estrategia aislada o medida."""
+
+    decisions: int
+    """Decisiones pedidas"""
+
+    timeouts: int
+    """Decisiones que superaron el presupuesto o llegaron con el hilo ocupado"""
+
+    errors: int
+    """Decisiones u observaciones que lanzaron una excepción"""
+
+    max_latency: float
+    """Mayor latencia observada de una decisión, en segundos"""
+
+    over_budget: int = 0
+    """Decisiones de una estrategia medida que superaron el presupuesto (se respetan igual)"""
+
+    @property
+    def fallbacks(self) -> int:
+        """Decisiones resueltas al azar en lugar de por la estrategia."""
+        return self.timeouts + self.errors
+
+
+class MeasuredStrategy(ComputerStrategy):
+    """
+    Mide la latencia de una estrategia de confianza sin aislarla.
+
+    Las decisiones se toman en el mismo hilo y siempre se respetan; las que
+    superan `latency_budget` se cuentan en `stats.over_budget`. El resto de
+    atributos (`dumps`, `loads`, `predict`...) se leen de la estrategia medida.
+    """
+
+    def __init__(self, strategy: ComputerStrategy):
+        """
+        Envuelve una estrategia.
+
+        Args:
+            strategy: Estrategia a medir
+        """
+        self.strategy = strategy
+        self.name = strategy.name
+        self.latency_budget = strategy.latency_budget
+        self._decisions = 0
+        self._over_budget = 0
+        self._max_latency = 0.0
+
+    def __getattr__(self, name: str) -> Any:
+        # Sólo se llama para atributos que el envoltorio no define
+        if name == "strategy":
+            raise AttributeError(name)
+        return getattr(self.strategy, name)
+
+    @property
+    def stats(self) -> GuardStats:
+        """Estadísticas acumuladas de la estrategia medida."""
+        return GuardStats(self._decisions, 0, 0, self._max_latency, self._over_budget)
+
+    def choose(self) -> GameChoice:
+        """
+        Decide con la estrategia y mide cuánto tardó.
+
+        Returns:
+            GameChoice: Elección de la estrategia
+        """
+        start = time.perf_counter()
+        choice = self.strategy.choose()
+        elapsed = time.perf_counter() - start
+        self._decisions += 1
+        if elapsed > self.latency_budget:
+            self._over_budget += 1
+        if elapsed > self._max_latency:
+            self._max_latency = elapsed
+        return choice
+
+    def observe(self, opponent_choice: GameChoice, own_choice: GameChoice) -> None:
+        """
+        Pasa la ronda a la estrategia.
+
+        Args:
+            opponent_choice: Elección del rival
+            own_choice: Elección que hizo la computadora
+        """
+        self.strategy.observe(opponent_choice, own_choice)
+
+    def reset(self) -> None:
+        """Reinicia la estrategia."""
+        self.strategy.reset()
+
+    def close(self) -> None:
+        """Libera los recursos de la estrategia."""
+        self.strategy.close()
+
+
+class GuardedStrategy(ComputerStrategy):
+    """
+    Ejecuta una estrategia en un hilo propio con presupuesto de latencia por decisión.
+
+    `choose` espera como mucho `latency_budget` segundos; si la estrategia no
+    responde a tiempo o falla, se elige al azar. Mientras una decisión atascada
+    siga ejecutándose, las siguientes se resuelven al azar sin encolarse detrás.
+    `observe` y `reset` se encolan en el mismo hilo, en orden, sin esperar.
+
+    `close()` (o usarla como gestor de contexto) termina el hilo; después las
+    decisiones se resuelven al azar y las observaciones se descartan.
+    """
+
+    def __init__(
+        self,
+        strategy: ComputerStrategy,
+        latency_budget: Optional[float] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Aísla una estrategia.
+
+        Args:
+            strategy: Estrategia a aislar
+            latency_budget: Segundos por decisión (por defecto, el que declara la estrategia)
+            rng: Generador aleatorio de la elección de respaldo
+
+        Raises:
+            ValueError: Si el presupuesto no es positivo
+        """
+        budget = strategy.latency_budget if latency_budget is None else latency_budget
+        if budget <= 0:
+            raise ValueError(f"El presupuesto de latencia debe ser positivo: {budget}.")
+        self.strategy = strategy
+        self.name = strategy.name
+        self.latency_budget = budget
+        self.rng = rng
+        self._lock = threading.Lock()
+        self._decisions = 0
+        self._timeouts = 0
+        self._errors = 0
+        self._max_latency = 0.0
+        self._pending: Optional["Future[GameChoice]"] = None
+        self._closed = False
+        # None es la señal de parada del hilo
+        self._tasks: "queue.SimpleQueue[Optional[Tuple[Future[Any], Callable[..., Any], Tuple[Any, ...]]]]" = (
+            queue.SimpleQueue()
+        )
+        # Hilo daemon: una estrategia colgada no impide que el programa termine
+        self._worker = threading.Thread(target=self._run, name=f"estrategia-{self.name}", daemon=True)
+        self._worker.start()
+
+    def _run(self) -> None:
+        """Bucle del hilo de la estrategia."""
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            future, method, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(method(*args))
+            except BaseException as exc:  # noqa: B902 - se informa a quien espera
+                future.set_exception(exc)
+
+    def __enter__(self) -> "GuardedStrategy":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _submit(self, method: Callable[..., Any], *args: Any) -> "Future[Any]":
+        future: "Future[Any]" = Future()
+        if self._closed:
+            future.set_exception(RuntimeError(f"La estrategia {self.name} está cerrada."))
+        else:
+            self._tasks.put((future, method, args))
+        return future
+
+    def _count_error(self, future: "Future[Any]") -> None:
+        if future.exception() is not None:
+            with self._lock:
+                self._errors += 1
+
+    def _fallback(self) -> GameChoice:
+        return (self.rng or random).choice(CHOICES)
+
+    @property
+    def stats(self) -> GuardStats:
+        """Estadísticas acumuladas de la estrategia aislada."""
+        with self._lock:
+            return GuardStats(self._decisions, self._timeouts, self._errors, self._max_latency)
+
+    def choose(self) -> GameChoice:
+        """
+        Pide la decisión a la estrategia dentro del presupuesto.
+
+        Returns:
+            GameChoice: Elección de la estrategia, o una al azar si no llegó a tiempo
+        """
+        if self._closed:
+            return self._fallback()
+        with self._lock:
+            self._decisions += 1
+            if self._pending is not None and not self._pending.done():
+                self._timeouts += 1
+                return self._fallback()
+
+        start = time.perf_counter()
+        future = self._submit(self.strategy.choose)
+        try:
+            choice: GameChoice = future.result(timeout=self.latency_budget)
+        except FutureTimeoutError:
+            with self._lock:
+                self._timeouts += 1
+                self._pending = future
+            return self._fallback()
+        except Exception:
+            with self._lock:
+                self._errors += 1
+            return self._fallback()
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._max_latency = max(self._max_latency, elapsed)
+        if choice not in CHOICES:
+            with self._lock:
+                self._errors += 1
+            return self._fallback()
+        return choice
+
+    def observe(self, opponent_choice: GameChoice, own_choice: GameChoice) -> None:
+        """
+        Encola la observación en el hilo de la estrategia.
+
+        Args:
+            opponent_choice: Elección del rival
+            own_choice: Elección que hizo la computadora
+        """
+        if not self._closed:
+            self._submit(self.strategy.observe, opponent_choice, own_choice).add_done_callback(self._count_error)
+
+    def reset(self) -> None:
+        """Encola el reinicio en el hilo de la estrategia."""
+        if not self._closed:
+            self._submit(self.strategy.reset).add_done_callback(self._count_error)
+
+    def close(self) -> None:
+        """
+        Termina el hilo de la estrategia tras las tareas ya encoladas.
+
+        No espera: si una decisión sigue atascada, el hilo (daemon) termina
+        cuando esa decisión acabe.
+        """
+        if self._closed:
+            return
+        self._submit(self.strategy.close).add_done_callback(self._count_error)
+        self._tasks.put(None)
+        self._closed = True
+
+
+class PersistableGuardedStrategy(GuardedStrategy):
+    """
+    Estrategia aislada que además guarda y carga su modelo.
+
+    `dumps` y `loads` se ejecutan en el hilo de la estrategia, después de las
+    observaciones ya encoladas, y esperan como mucho `MODEL_TIMEOUT` segundos.
+    """
+
+    def __init__(
+        self,
+        strategy: ComputerStrategy,
+        latency_budget: Optional[float] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Aísla una estrategia persistible.
+
+        Args:
+            strategy: Estrategia con `dumps()` y `loads(data)`
+            latency_budget: Segundos por decisión (por defecto, el que declara la estrategia)
+            rng: Generador aleatorio de la elección de respaldo
+
+        Raises:
+            TypeError: Si la estrategia no se puede serializar
+            ValueError: Si el presupuesto no es positivo
+        """
+        if not (hasattr(strategy, "dumps") and hasattr(strategy, "loads")):
+            raise TypeError(f"La estrategia {strategy.name} no guarda modelos.")
+        super().__init__(strategy, latency_budget, rng)
+        self._dumps: Callable[[], bytes] = strategy.dumps
+        self._loads: Callable[[bytes], None] = strategy.loads
+
+    def _wait(self, future: "Future[Any]") -> Any:
+        try:
+            return future.result(timeout=MODEL_TIMEOUT)
+        except FutureTimeoutError as exc:
+            raise TimeoutError(f"La estrategia {self.name} no respondió en {MODEL_TIMEOUT} s.") from exc
+
+    def dumps(self) -> bytes:
+        """
+        Serializa el modelo de la estrategia aislada.
+
+        Returns:
+            bytes: Modelo, legible con `loads`
+
+        Raises:
+            TimeoutError: Si la estrategia no lo entrega a tiempo
+        """
+        data: bytes = self._wait(self._submit(self._dumps))
+        return data
+
+    def loads(self, data: bytes) -> None:
+        """
+        Carga un modelo en la estrategia aislada.
+
+        Args:
+            data: Modelo serializado con `dumps`
+
+        Raises:
+            TimeoutError: Si la estrategia no lo carga a tiempo
+        """
+        self._wait(self._submit(self._loads, data))
@@ -0,0 +1,295 @@
+"""
+Predicción del usuario con n-gramas largos en memoria acotada
+
+`SketchPredictorStrategy` predice la próxima elección del usuario a partir de
+sus últimas elecciones y lanza una opción que la vence. Usa el contexto más
+largo (hasta `order` elecciones) que ya tiene cuentas y, si no, retrocede a
+contextos más cortos hasta llegar a la frecuencia global de cada opción, de
+modo que predice desde las primeras rondas. Las cuentas de (contexto, siguiente
+elección) de todos los órdenes viven en un mismo count-min sketch de tamaño
+fijo, así que la memoria por sesión no crece con la longitud del contexto ni de
+la historia: con los valores por defecto ocupa 2 KB.
+
+El contexto se mantiene como un entero rodante en base 5 (las últimas `k`
+elecciones son sus `k` cifras menos significativas) y se conserva entre
+partidas. Cada ronda actualiza y consulta `depth` celdas por orden y opción: el
+coste por ronda es O(order · depth) en lugar de O(depth). Es el precio del
+retroceso: contar sólo el contexto más largo dejaría sin cuentas a los
+contextos cortos, y la estrategia no predeciría hasta que se repitiera una
+secuencia completa de `order` elecciones. Con el orden por defecto son siete
+actualizaciones de cuatro celdas por ronda, sin memoria adicional.
+"""
+
+import random
+import struct
+import sys
+from array import array
+from typing import Optional, Tuple
+
+from .game_enums import GameChoice
+from .strategies import CHOICES, ComputerStrategy
+
+DEFAULT_ORDER = 6
+DEFAULT_WIDTH = 256
+DEFAULT_DEPTH = 4
+
+# Primo de Mersenne 2^61 - 1 para el hash universal multiplicativo
+_PRIME = (1 << 61) - 1
+
+# Cuenta máxima de una celda (contadores de 16 bits con saturación)
+_MAX_COUNT = 0xFFFF
+
+# Cabeceras de serialización (little endian)
+_SKETCH_HEADER = struct.Struct("<4sIIQ")
+_SKETCH_MAGIC = b"CMS1"
+_ORDER = struct.Struct("<H")
+
+_CHOICE_INDEX = {choice: index for index, choice in enumerate(CHOICES)}
+
+# Opciones que vencen a cada opción, en el orden de GameChoice
+_COUNTERS: Tuple[Tuple[GameChoice, ...], ...] = tuple(
+    tuple(choice for choice in CHOICES if choice.beats(target)) for target in CHOICES
+)
+
+
+class CountMinSketch:
+    """
+    Count-min sketch con actualización conservadora y contadores de 16 bits.
+
+    Estima por exceso la cuenta de cada clave entera con memoria fija de
+    `width * depth` contadores.
+    """
+
+    __slots__ = ("width", "depth", "seed", "_hashes", "_table")
+
+    def __init__(self, width: int = DEFAULT_WIDTH, depth: int = DEFAULT_DEPTH, seed: int = 0):
+        """
+        Inicializa el sketch vacío.
+
+        Args:
+            width: Contadores por fila
+            depth: Filas (funciones hash independientes)
+            seed: Semilla de las funciones hash
+
+        Raises:
+            ValueError: Si el ancho o la profundidad no son positivos
+        """
+        if width < 1 or depth < 1:
+            raise ValueError("El ancho y la profundidad del sketch deben ser al menos 1.")
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        rng = random.Random(seed)
+        self._hashes = tuple((rng.randrange(1, _PRIME), rng.randrange(_PRIME)) for _ in range(depth))
+        self._table = array("H", bytes(2 * width * depth))
+
+    def _cells(self, key: int) -> Tuple[int, ...]:
+        """Posición de la clave en cada fila de la tabla."""
+        width = self.width
+        return tuple(
+            row * width + (a * key + b) % _PRIME % width for row, (a, b) in enumerate(self._hashes)
+        )
+
+    def add(self, key: int) -> None:
+        """
+        Suma 1 a la cuenta de una clave.
+
+        Sólo se incrementan las celdas que tienen el mínimo actual
+        (actualización conservadora), lo que reduce la sobreestimación.
+
+        Args:
+            key: Clave entera no negativa
+        """
+        table = self._table
+        cells = self._cells(key)
+        current = min(table[cell] for cell in cells)
+        if current < _MAX_COUNT:
+            for cell in cells:
+                if table[cell] == current:
+                    table[cell] = current + 1
+
+    def estimate(self, key: int) -> int:
+        """
+        Estima la cuenta de una clave.
+
+        Args:
+            key: Clave entera no negativa
+
+        Returns:
+            int: Cuenta estimada, nunca menor que la real
+        """
+        table = self._table
+        return min(table[cell] for cell in self._cells(key))
+
+    def clear(self) -> None:
+        """Pone todas las cuentas a 0."""
+        self._table = array("H", bytes(2 * self.width * self.depth))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes que ocupan los contadores."""
+        return self._table.itemsize * len(self._table)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializa el sketch (dimensiones, semilla y contadores).
+
+        Returns:
+            bytes: Representación binaria, legible con `from_bytes`
+        """
+        table = self._table
+        if sys.byteorder != "little":  # pragma: no cover - depende de la plataforma
+            table = array("H", table)
+            table.byteswap()
+        return _SKETCH_HEADER.pack(_SKETCH_MAGIC, self.width, self.depth, self.seed) + table.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CountMinSketch":
+        """
+        Reconstruye un sketch serializado con `to_bytes`.
+
+        Args:
+            data: Representación binaria
+
+        Returns:
+            CountMinSketch: Sketch con las mismas cuentas
+
+        Raises:
+            ValueError: Si los datos no son un sketch válido
+        """
+        try:
+            magic, width, depth, seed = _SKETCH_HEADER.unpack_from(data)
+        except struct.error as exc:
+            raise ValueError("Datos de sketch truncados.") from exc
+        if magic != _SKETCH_MAGIC or len(data) != _SKETCH_HEADER.size + 2 * width * depth:
+            raise ValueError("Los datos no corresponden a un count-min sketch válido.")
+        sketch = cls(width, depth, seed)
+        sketch._table = array("H", data[_SKETCH_HEADER.size:])
+        if sys.byteorder != "little":  # pragma: no cover - depende de la plataforma
+            sketch._table.byteswap()
+        return sketch
+
+
+class SketchPredictorStrategy(ComputerStrategy):
+    """
+    Estrategia que predice al usuario por n-gramas y lanza lo que vence a la predicción.
+
+    Las cuentas aprendidas y el contexto se conservan entre partidas de la
+    misma sesión: la racha de elecciones del usuario continúa de una partida a
+    la siguiente.
+    """
+
+    name = "prediccion"
+
+    def __init__(
+        self,
+        order: int = DEFAULT_ORDER,
+        width: int = DEFAULT_WIDTH,
+        depth: int = DEFAULT_DEPTH,
+        seed: int = 0,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Inicializa la estrategia sin historia.
+
+        Args:
+            order: Longitud máxima del contexto (elecciones previas del usuario)
+            width: Contadores por fila del sketch
+            depth: Filas del sketch
+            seed: Semilla de las funciones hash del sketch
+            rng: Generador aleatorio (por defecto, el módulo random)
+
+        Raises:
+            ValueError: Si el orden no es positivo
+        """
+        if order < 1:
+            raise ValueError("El orden del predictor debe ser al menos 1.")
+        self.order = order
+        self.rng = rng
+        self.sketch = CountMinSketch(width, depth, seed)
+        # Contextos distintos de cada orden; también separan las claves de cada
+        # orden en el sketch (5^k + contexto cae en [5^k, 2 * 5^k))
+        self._moduli: Tuple[int, ...] = tuple(len(CHOICES) ** k for k in range(order + 1))
+        self._context = 0
+        self._seen = 0
+
+    def _key(self, k: int, index: int) -> int:
+        """Clave del sketch para la elección `index` tras las últimas `k` elecciones."""
+        modulus = self._moduli[k]
+        return (modulus + self._context % modulus) * len(CHOICES) + index
+
+    def predict(self) -> Optional[GameChoice]:
+        """
+        Predice la próxima elección del usuario según el contexto actual.
+
+        Prueba del contexto más largo al más corto y usa el primero con alguna
+        cuenta. Las colisiones del sketch pueden dar cuentas a un contexto que
+        nunca se vio; en ese caso la predicción sale de esas cuentas ajenas.
+
+        Returns:
+            Optional[GameChoice]: Elección más frecuente tras el contexto más
+            largo con cuentas, o None si el sketch no tiene ninguna
+        """
+        for k in range(self._seen, -1, -1):
+            counts = [self.sketch.estimate(self._key(k, index)) for index in range(len(CHOICES))]
+            best = max(counts)
+            if best:
+                return CHOICES[counts.index(best)]
+        return None
+
+    def choose(self) -> GameChoice:
+        """
+        Lanza una opción que vence a la predicción, o una al azar sin predicción.
+
+        Returns:
+            GameChoice: Elección de la computadora
+        """
+        rng = self.rng or random
+        prediction = self.predict()
+        if prediction is None:
+            return rng.choice(CHOICES)
+        return rng.choice(_COUNTERS[_CHOICE_INDEX[prediction]])
+
+    def observe(self, opponent_choice: GameChoice, own_choice: GameChoice) -> None:
+        """
+        Cuenta la elección del usuario tras el contexto de cada orden y avanza el contexto.
+
+        Args:
+            opponent_choice: Elección del usuario en la ronda
+            own_choice: Elección que hizo esta estrategia
+        """
+        index = _CHOICE_INDEX[opponent_choice]
+        for k in range(self._seen + 1):
+            self.sketch.add(self._key(k, index))
+        self._context = (self._context * len(CHOICES) + index) % self._moduli[-1]
+        self._seen = min(self._seen + 1, self.order)
+
+    def reset(self) -> None:
+        """No hace nada: las cuentas y el contexto se conservan entre partidas."""
+
+    def dumps(self) -> bytes:
+        """
+        Serializa el modelo aprendido (orden y sketch), sin el contexto de la partida.
+
+        Returns:
+            bytes: Modelo, legible con `loads`
+        """
+        return _ORDER.pack(self.order) + self.sketch.to_bytes()
+
+    def loads(self, data: bytes) -> None:
+        """
+        Reemplaza el modelo aprendido por uno serializado con `dumps`.
+
+        Args:
+            data: Modelo serializado
+
+        Raises:
+            ValueError: Si el modelo no es válido o tiene otro orden
+        """
+        try:
+            (order,) = _ORDER.unpack_from(data)
+        except struct.error as exc:
+            raise ValueError("Modelo de predicción truncado.") from exc
+        if order != self.order:
+            raise ValueError(f"El modelo guardado es de orden {order}, no {self.order}.")
+        self.sketch = CountMinSketch.from_bytes(data[_ORDER.size:])
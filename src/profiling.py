@@ -0,0 +1,236 @@
+"""
+Perfilado integrado para el juego Piedra, Papel, Tijeras, Lagarto, Spock
+
+Este módulo permite capturar un perfil desde el mismo punto de entrada que se
+usa en producción:
+
+- cProfile, con salida en formato pstats (`python -m pstats`, snakeviz...).
+- Un perfilador por muestreo que guarda pilas colapsadas (formato de
+  flamegraph.pl / speedscope).
+- Un modo de memoria basado en tracemalloc que informa las asignaciones de
+  cada ronda y los sitios que más memoria reservan.
+"""
+
+import cProfile
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from .instrumentation import install_wrappers, restore_wrappers
+
+PROFILE_MODES = ("cprofile", "sample")
+
+T = TypeVar("T")
+
+
+def _frame_label(frame: FrameType) -> str:
+    """Etiqueta de un frame sin ';', que separa los niveles de la pila."""
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+class StackSampler:
+    """
+    Perfilador por muestreo de un hilo mediante sys._current_frames.
+
+    Un hilo demonio toma la pila del hilo observado cada `interval` segundos y
+    cuenta cuántas veces aparece cada pila.
+    """
+
+    def __init__(self, interval: float = 0.001, thread_id: Optional[int] = None):
+        """
+        Inicializa el muestreador.
+
+        Args:
+            interval: Segundos entre muestras
+            thread_id: Hilo a observar (por defecto, el que llama a start)
+        """
+        self.interval = interval
+        self.thread_id = thread_id
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Comienza a muestrear en segundo plano."""
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Detiene el muestreo y espera al hilo muestreador."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def sample(self) -> None:
+        """Toma una muestra de la pila del hilo observado."""
+        frame = sys._current_frames().get(self.thread_id)  # type: ignore[arg-type]
+        labels: List[str] = []
+        while frame is not None:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        if labels:
+            self.stacks[";".join(reversed(labels))] += 1
+
+    def write_collapsed(self, path: str) -> None:
+        """
+        Escribe las pilas en formato colapsado ("a;b;c N" por línea).
+
+        Args:
+            path: Ruta del archivo de salida
+        """
+        with open(path, "w", encoding="utf-8") as handle:
+            for stack, count in self.stacks.most_common():
+                handle.write(f"{stack} {count}\n")
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+def profile_call(
+    func: Callable[[], T], output: str, mode: str = "cprofile", interval: float = 0.001
+) -> T:
+    """
+    Ejecuta una función bajo el perfilador indicado y guarda el resultado.
+
+    Args:
+        func: Función sin argumentos a perfilar
+        output: Ruta del archivo de salida
+        mode: "cprofile" (pstats) o "sample" (pilas colapsadas)
+        interval: Segundos entre muestras en modo "sample"
+
+    Returns:
+        T: Lo que devuelva `func`
+
+    Raises:
+        ValueError: Si el modo no es válido
+    """
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func)
+        finally:
+            profiler.dump_stats(output)
+    if mode == "sample":
+        sampler = StackSampler(interval=interval)
+        sampler.start()
+        try:
+            return func()
+        finally:
+            sampler.stop()
+            sampler.write_collapsed(output)
+    raise ValueError(f"Modo de perfilado inválido: {mode}. Opciones: {', '.join(PROFILE_MODES)}")
+
+
+class MemoryProfiler:
+    """
+    Informe de asignaciones de memoria por ronda con tracemalloc.
+
+    Uso:
+        profiler = MemoryProfiler()
+        profiler.start()
+        profiler.attach(game)
+        game.run()
+        profiler.stop()
+        print(profiler.format_report())
+    """
+
+    def __init__(self, top: int = 10, frames: int = 1):
+        """
+        Inicializa el perfilador de memoria.
+
+        Args:
+            top: Cantidad de sitios de asignación a mostrar
+            frames: Profundidad de pila que guarda tracemalloc por asignación
+        """
+        self.top = top
+        self.frames = frames
+        # (bytes netos, pico de bytes) de cada ronda
+        self.rounds: List[Tuple[int, int]] = []
+        self.top_sites: List[Tuple[str, int, int]] = []
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._started_here = False
+        self._installed: Dict[int, Dict[str, Any]] = {}
+
+    def start(self) -> None:
+        """Activa tracemalloc (si no lo estaba) y toma la instantánea base."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_here = True
+        self._baseline = tracemalloc.take_snapshot()
+
+    def stop(self) -> None:
+        """Calcula los sitios con más asignaciones y desactiva tracemalloc."""
+        if self._baseline is not None:
+            snapshot = tracemalloc.take_snapshot()
+            stats = snapshot.compare_to(self._baseline, "lineno")[: self.top]
+            self.top_sites = [
+                (str(stat.traceback), stat.size_diff, stat.count_diff) for stat in stats
+            ]
+            self._baseline = None
+        if self._started_here:
+            tracemalloc.stop()
+            self._started_here = False
+
+    def attach(self, game: Any) -> None:
+        """
+        Mide las asignaciones de cada llamada a `play_round`.
+
+        Args:
+            game: Juego con método `play_round` (RockPaperScissorsGame,
+                MultiplayerGame o BattleRoyale)
+        """
+        if id(game) not in self._installed:
+            self._installed[id(game)] = install_wrappers(game, {"play_round": self._wrap_round})
+
+    def detach(self, game: Any) -> None:
+        """
+        Retira la medición de una instancia del juego.
+
+        Args:
+            game: Instancia previamente instrumentada
+        """
+        previous = self._installed.pop(id(game), None)
+        if previous is not None:
+            restore_wrappers(game, previous)
+
+    def format_report(self) -> str:
+        """
+        Genera el informe de asignaciones.
+
+        Returns:
+            str: Bytes por ronda y sitios con más memoria reservada
+        """
+        lines = [f"{'ronda':>6}{'neto (B)':>12}{'pico (B)':>12}"]
+        for number, (net, peak) in enumerate(self.rounds, start=1):
+            lines.append(f"{number:>6}{net:>12}{peak:>12}")
+        if self.rounds:
+            mean = sum(net for net, _ in self.rounds) / len(self.rounds)
+            lines.append(f"Media neta por ronda: {mean:.1f} B")
+        if self.top_sites:
+            lines.append("Sitios con más memoria reservada:")
+            for site, size, count in self.top_sites:
+                lines.append(f"  {site}: {size:+} B en {count:+} bloques")
+        return "\n".join(lines)
+
+    def _wrap_round(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                after, peak = tracemalloc.get_traced_memory()
+                self.rounds.append((after - before, peak - before))
+
+        return wrapper
@@ -0,0 +1,208 @@
+"""
+Resultados de simulación en memoria compartida
+
+Con el backend de procesos, devolver los resultados de cada bloque como
+objetos serializados cuesta más que jugar las partidas. `SharedResults`
+reserva un bloque de `multiprocessing.shared_memory` con arreglos de NumPy
+para toda la simulación:
+
+- `pair_counts`: rondas por pareja de elecciones, una fila por bloque
+  (int64, `bloques x 25`)
+- `rounds`: rondas de cada partida (int32)
+- `user_score` y `computer_score`: marcador final de cada partida (int16)
+
+Cada trabajador escribe sus partidas y su fila directamente en el bloque (los
+bloques no se solapan, así que no hace falta ningún cerrojo) y no devuelve
+nada. El proceso principal calcula los agregados sobre los mismos arreglos,
+sin copiarlos. Requiere numpy (dependencia opcional).
+"""
+
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depende del entorno
+    raise ImportError(
+        "Los resultados en memoria compartida requieren numpy. Instálalo con: pip install numpy"
+    ) from exc
+
+from .batch import PAIRS, SimulationJob, SimulationSummary, chunk_players, close_players
+from .simulation import play_match
+
+
+def _layout(job: SimulationJob) -> Tuple[Tuple[str, "np.dtype", Tuple[int, ...], int], ...]:
+    """Campos del bloque compartido: nombre, tipo, forma y desplazamiento."""
+    fields = (
+        ("pair_counts", np.dtype(np.int64), (job.chunk_count, PAIRS)),
+        ("rounds", np.dtype(np.int32), (job.matches,)),
+        ("user_score", np.dtype(np.int16), (job.matches,)),
+        ("computer_score", np.dtype(np.int16), (job.matches,)),
+    )
+    layout = []
+    offset = 0
+    # De mayor a menor alineación: cada campo empieza alineado sin relleno
+    for name, dtype, shape in fields:
+        layout.append((name, dtype, shape, offset))
+        offset += dtype.itemsize * int(np.prod(shape))
+    return tuple(layout)
+
+
+def shared_size(job: SimulationJob) -> int:
+    """
+    Bytes del bloque compartido de una simulación.
+
+    Args:
+        job: Simulación
+
+    Returns:
+        int: Tamaño del bloque
+    """
+    _, dtype, shape, offset = _layout(job)[-1]
+    return offset + dtype.itemsize * int(np.prod(shape))
+
+
+class SharedResults:
+    """
+    Arreglos de resultados de una simulación sobre un bloque de memoria compartida.
+
+    Uso:
+        with SimulationExecutor(jobs=8).run_shared(job) as results:
+            results.summary()
+            results.rounds.max()
+    """
+
+    def __init__(self, job: SimulationJob, memory: shared_memory.SharedMemory, owner: bool):
+        """
+        Crea las vistas sobre un bloque ya reservado.
+
+        Args:
+            job: Simulación cuyos resultados guarda el bloque
+            memory: Bloque de memoria compartida
+            owner: True si este objeto debe liberar el bloque al cerrarse
+        """
+        self.job = job
+        self.memory = memory
+        self.owner = owner
+        self.pair_counts: "np.ndarray"
+        self.rounds: "np.ndarray"
+        self.user_score: "np.ndarray"
+        self.computer_score: "np.ndarray"
+        for name, dtype, shape, offset in _layout(job):
+            setattr(self, name, np.ndarray(shape, dtype=dtype, buffer=memory.buf, offset=offset))
+
+    @classmethod
+    def create(cls, job: SimulationJob) -> "SharedResults":
+        """
+        Reserva un bloque a cero para los resultados de una simulación.
+
+        Args:
+            job: Simulación
+
+        Returns:
+            SharedResults: Resultados vacíos; se liberan con `close`
+        """
+        memory = shared_memory.SharedMemory(create=True, size=shared_size(job))
+        results = cls(job, memory, owner=True)
+        results.clear()
+        return results
+
+    @classmethod
+    def attach(cls, name: str, job: SimulationJob) -> "SharedResults":
+        """
+        Se conecta al bloque creado por otro proceso.
+
+        Args:
+            name: Nombre del bloque compartido
+            job: Simulación cuyos resultados guarda el bloque
+
+        Returns:
+            SharedResults: Vistas sobre el mismo bloque
+        """
+        return cls(job, shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        """Nombre del bloque compartido, para `attach`."""
+        return self.memory.name
+
+    def __enter__(self) -> "SharedResults":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def clear(self) -> None:
+        """Pone todos los resultados a cero."""
+        for name, _, _, _ in _layout(self.job):
+            getattr(self, name).fill(0)
+
+    def fill_chunk(self, index: int) -> None:
+        """
+        Juega un bloque y escribe sus resultados en el bloque compartido.
+
+        Da los mismos resultados que `batch.run_chunk` para ese bloque.
+
+        Args:
+            index: Índice del bloque
+        """
+        job = self.job
+        start, stop = job.chunk_bounds(index)
+        game, user = chunk_players(job, index)
+        pair_counts = [0] * PAIRS
+        user_score, computer_score, rounds = self.user_score, self.computer_score, self.rounds
+        try:
+            for match in range(start, stop):
+                result = play_match(game, user, job.max_rounds, pair_counts)
+                user_score[match] = result.user_score
+                computer_score[match] = result.computer_score
+                rounds[match] = result.rounds
+        finally:
+            close_players(game, user)
+        self.pair_counts[index] = pair_counts
+
+    def summary(self, completed: Optional["np.ndarray"] = None) -> SimulationSummary:
+        """
+        Agregados calculados sobre los arreglos compartidos.
+
+        Args:
+            completed: Máscara de los bloques a incluir (por defecto, todos)
+
+        Returns:
+            SimulationSummary: Agregados de las partidas incluidas
+        """
+        user, computer, rounds, pairs = self.user_score, self.computer_score, self.rounds, self.pair_counts
+        if completed is not None:
+            matches = np.repeat(completed, self.job.chunk_size)[:self.job.matches]
+            user, computer, rounds, pairs = user[matches], computer[matches], rounds[matches], pairs[completed]
+        return SimulationSummary(
+            int(len(rounds)),
+            int(np.count_nonzero(user > computer)),
+            int(np.count_nonzero(computer > user)),
+            int(rounds.sum(dtype=np.int64)),
+            tuple(int(count) for count in pairs.sum(axis=0)),
+        )
+
+    def close(self) -> None:
+        """Suelta las vistas y cierra el bloque; el dueño además lo libera."""
+        for name, _, _, _ in _layout(self.job):
+            setattr(self, name, None)
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+
+# Resultados del proceso trabajador, fijados por _init_worker
+_worker_results: Optional[SharedResults] = None
+
+
+def _init_worker(name: str, job: SimulationJob) -> None:
+    """Conecta el trabajador al bloque compartido de resultados."""
+    global _worker_results
+    _worker_results = SharedResults.attach(name, job)
+
+
+def _fill_chunk(index: int) -> None:
+    """Juega un bloque en el trabajador y escribe sus resultados en el bloque compartido."""
+    assert _worker_results is not None
+    _worker_results.fill_chunk(index)
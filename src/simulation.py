@@ -0,0 +1,52 @@
+"""
+Partidas sin interfaz para simulaciones
+
+Juega partidas completas entre dos estrategias con
+`GameEngine.resolve_round`, sin entrada ni salida por consola.
+La estrategia de la computadora es la del juego; la del usuario es cualquier
+`ComputerStrategy`, que recibe las elecciones de la computadora como las de su
+rival.
+
+`play_match` es el bucle directo que usan las simulaciones por lotes; para
+recorrer rondas o partidas de forma perezosa están los generadores
+`GameEngine.iter_rounds` y `GameEngine.iter_matches`.
+"""
+
+from typing import MutableSequence, Optional
+
+from .game import DEFAULT_MAX_ROUNDS, GameEngine, MatchResult
+from .strategies import _CHOICE_INDEX, CHOICES, ComputerStrategy
+
+# Posición de cada pareja de elecciones en `pair_counts`
+_PAIR_INDEX = {choice: index * len(CHOICES) for index, choice in enumerate(CHOICES)}
+
+
+def play_match(
+    game: GameEngine,
+    user_strategy: ComputerStrategy,
+    max_rounds: int = DEFAULT_MAX_ROUNDS,
+    pair_counts: Optional[MutableSequence[int]] = None,
+) -> MatchResult:
+    """
+    Juega una partida completa sin interfaz, desde el marcador inicial.
+
+    Args:
+        game: Juego a usar; se reinicia antes de empezar
+        user_strategy: Estrategia que decide las elecciones del usuario
+        max_rounds: Rondas tras las que la partida se corta sin ganador
+        pair_counts: Si se indica, suma cada ronda en la posición
+            `índice_usuario * 5 + índice_computadora` (orden de GameChoice)
+
+    Returns:
+        MatchResult: Marcador final y rondas jugadas
+    """
+    game.reset_game()
+    user_strategy.reset()
+    while not game._check_game_over() and game.rounds_played < max_rounds:
+        user_choice = user_strategy.choose()
+        computer_choice = game.get_computer_choice()
+        game.resolve_round(user_choice, computer_choice)
+        user_strategy.observe(computer_choice, user_choice)
+        if pair_counts is not None:
+            pair_counts[_PAIR_INDEX[user_choice] + _CHOICE_INDEX[computer_choice]] += 1
+    return MatchResult(game.user_score, game.computer_score, game.rounds_played)
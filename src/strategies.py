@@ -0,0 +1,286 @@
+"""
+Estrategias de la computadora para el juego Piedra, Papel, Tijeras, Lagarto, Spock
+
+Una estrategia decide la elección de la computadora en cada ronda. Las
+estrategias integradas son mixtas: lanzan cada opción con una probabilidad fija.
+"""
+
+import json
+import random
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .game_enums import GameChoice
+
+CHOICES: Tuple[GameChoice, ...] = tuple(GameChoice)
+
+# Segundos que puede tardar una decisión antes de que el motor elija al azar
+DEFAULT_LATENCY_BUDGET = 0.05
+
+_CHOICE_INDEX: Dict[GameChoice, int] = {choice: index for index, choice in enumerate(CHOICES)}
+
+
+class ComputerStrategy:
+    """Clase base de las estrategias de la computadora."""
+
+    name = "base"
+
+    latency_budget = DEFAULT_LATENCY_BUDGET
+    """Presupuesto de latencia por decisión, en segundos (ver plugins.GuardedStrategy)"""
+
+    def choose(self) -> GameChoice:
+        """
+        Decide la elección de la computadora para la ronda actual.
+
+        Returns:
+            GameChoice: Elección de la computadora
+        """
+        raise NotImplementedError
+
+    def observe(self, opponent_choice: GameChoice, own_choice: GameChoice) -> None:
+        """
+        Recibe el resultado de la ronda; las estrategias adaptativas lo usan para aprender.
+
+        Args:
+            opponent_choice: Elección del rival (el usuario)
+            own_choice: Elección que hizo esta estrategia
+        """
+
+    def reset(self) -> None:
+        """Olvida el estado acumulado durante la partida."""
+
+    def close(self) -> None:
+        """Libera los recursos de la estrategia (p. ej. el hilo de un plugin aislado)."""
+
+
+class MixedStrategy(ComputerStrategy):
+    """Estrategia que lanza cada opción con una probabilidad fija."""
+
+    def __init__(
+        self,
+        weights: Sequence[float],
+        name: str = "mixta",
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Inicializa la estrategia.
+
+        Args:
+            weights: Peso de cada opción en el orden de GameChoice
+            name: Nombre de la estrategia
+            rng: Generador aleatorio (por defecto, el módulo random)
+
+        Raises:
+            ValueError: Si no hay 5 pesos no negativos con suma positiva
+        """
+        if len(weights) != len(CHOICES) or any(weight < 0 for weight in weights):
+            raise ValueError(f"Una estrategia debe tener {len(CHOICES)} pesos no negativos.")
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError("Los pesos de una estrategia deben sumar más que 0.")
+        self.name = name
+        self.weights: Tuple[float, ...] = tuple(weight / total for weight in weights)
+        self.rng = rng
+        cumulative = []
+        running = 0.0
+        for weight in self.weights:
+            running += weight
+            cumulative.append(running)
+        self._cum_weights = tuple(cumulative)
+
+    def choose(self) -> GameChoice:
+        """
+        Elige una opción según los pesos de la estrategia.
+
+        Returns:
+            GameChoice: Elección de la computadora
+        """
+        return (self.rng or random).choices(CHOICES, cum_weights=self._cum_weights)[0]
+
+
+class UniformStrategy(MixedStrategy):
+    """Estrategia por defecto: todas las opciones con la misma probabilidad."""
+
+    def __init__(self, name: str = "aleatoria", rng: Optional[random.Random] = None):
+        """
+        Inicializa la estrategia uniforme.
+
+        Args:
+            name: Nombre de la estrategia
+            rng: Generador aleatorio (por defecto, el módulo random)
+        """
+        super().__init__((1.0,) * len(CHOICES), name=name, rng=rng)
+
+    def choose(self) -> GameChoice:
+        """
+        Elige una opción al azar.
+
+        Returns:
+            GameChoice: Elección aleatoria de la computadora
+        """
+        return (self.rng or random).choice(GameChoice.get_all_choices())
+
+
+class FiniteStateStrategy(ComputerStrategy):
+    """
+    Estrategia de máquina de estados finitos.
+
+    Cada estado lanza una opción fija y la elección del rival decide el estado
+    siguiente, de modo que la máquina puede reaccionar a los patrones del rival.
+    """
+
+    def __init__(
+        self,
+        outputs: Sequence[int],
+        transitions: Sequence[Sequence[int]],
+        name: str = "automata",
+    ):
+        """
+        Inicializa la máquina en el estado 0.
+
+        Args:
+            outputs: Índice de la opción (orden de GameChoice) que lanza cada estado
+            transitions: transitions[estado][opción del rival] -> estado siguiente
+            name: Nombre de la estrategia
+
+        Raises:
+            ValueError: Si las tablas no son coherentes con el número de estados
+        """
+        states = len(outputs)
+        if (
+            not states
+            or len(transitions) != states
+            or any(not 0 <= output < len(CHOICES) for output in outputs)
+            or any(len(row) != len(CHOICES) or not all(0 <= t < states for t in row) for row in transitions)
+        ):
+            raise ValueError(
+                f"Una máquina de estados necesita una salida y {len(CHOICES)} transiciones válidas por estado."
+            )
+        self.name = name
+        self.outputs: Tuple[GameChoice, ...] = tuple(CHOICES[output] for output in outputs)
+        self.transitions: Tuple[Tuple[int, ...], ...] = tuple(tuple(row) for row in transitions)
+        self.state = 0
+
+    def choose(self) -> GameChoice:
+        """
+        Lanza la opción del estado actual.
+
+        Returns:
+            GameChoice: Elección de la computadora
+        """
+        return self.outputs[self.state]
+
+    def observe(self, opponent_choice: GameChoice, own_choice: GameChoice) -> None:
+        """
+        Avanza al estado que indica la elección del rival.
+
+        Args:
+            opponent_choice: Elección del rival
+            own_choice: Elección que hizo esta estrategia
+        """
+        self.state = self.transitions[self.state][_CHOICE_INDEX[opponent_choice]]
+
+    def reset(self) -> None:
+        """Vuelve al estado inicial."""
+        self.state = 0
+
+
+# Nombre -> pesos de las estrategias integradas, en el orden de GameChoice
+BUILTIN_STRATEGIES: Dict[str, Tuple[float, ...]] = {
+    "aleatoria": (1.0, 1.0, 1.0, 1.0, 1.0),
+    "piedra": (3.0, 1.0, 1.0, 1.0, 1.0),
+    "spock": (1.0, 1.0, 1.0, 1.0, 3.0),
+    "clasica": (1.0, 1.0, 1.0, 0.0, 0.0),
+}
+
+DEFAULT_STRATEGY = "aleatoria"
+
+
+def builtin_strategy_names() -> List[str]:
+    """
+    Retorna los nombres de las estrategias incluidas en el proyecto.
+
+    No busca plugins de terceros, así que no recorre los entry points instalados.
+
+    Returns:
+        List[str]: Estrategias integradas y plugins incluidos
+    """
+    from .plugins import BUILTIN_PLUGINS
+
+    return list(BUILTIN_STRATEGIES) + [name for name in BUILTIN_PLUGINS if name not in BUILTIN_STRATEGIES]
+
+
+def available_strategies(profiles: Optional[Mapping[str, Sequence[float]]] = None) -> List[str]:
+    """
+    Retorna los nombres de las estrategias disponibles.
+
+    Args:
+        profiles: Perfiles adicionales, p. ej. cargados con `load_profiles`
+
+    Returns:
+        List[str]: Nombres de estrategia
+    """
+    from .plugins import discover_plugins
+
+    names = list(BUILTIN_STRATEGIES) + [name for name in discover_plugins() if name not in BUILTIN_STRATEGIES]
+    return names + [name for name in profiles or () if name not in names]
+
+
+def load_profiles(path: str) -> Dict[str, Tuple[float, ...]]:
+    """
+    Carga perfiles de estrategia desde un archivo JSON {nombre: [pesos]}.
+
+    Los genera, por ejemplo, `python -m src.training`.
+
+    Args:
+        path: Ruta del archivo de perfiles
+
+    Returns:
+        Dict[str, Tuple[float, ...]]: Nombre -> pesos en el orden de GameChoice
+
+    Raises:
+        ValueError: Si el archivo no contiene perfiles válidos
+    """
+    with open(path, encoding="utf-8") as handle:
+        data = json.load(handle)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} debe contener un objeto {{nombre: [pesos]}}.")
+    profiles = {}
+    for name, weights in data.items():
+        # MixedStrategy valida la cantidad y el signo de los pesos
+        MixedStrategy(weights, name=name)
+        profiles[name] = tuple(float(weight) for weight in weights)
+    return profiles
+
+
+def create_strategy(
+    name: str = DEFAULT_STRATEGY,
+    rng: Optional[random.Random] = None,
+    profiles: Optional[Mapping[str, Sequence[float]]] = None,
+) -> ComputerStrategy:
+    """
+    Crea una estrategia por nombre.
+
+    Args:
+        name: Nombre de la estrategia
+        rng: Generador aleatorio (por defecto, el módulo random)
+        profiles: Perfiles adicionales, p. ej. cargados con `load_profiles`
+
+    Returns:
+        ComputerStrategy: Nueva instancia de la estrategia
+
+    Raises:
+        ValueError: Si el nombre no corresponde a ninguna estrategia
+    """
+    if name == DEFAULT_STRATEGY:
+        return UniformStrategy(rng=rng)
+    if name in BUILTIN_STRATEGIES:
+        return MixedStrategy(BUILTIN_STRATEGIES[name], name=name, rng=rng)
+    from .plugins import BUILTIN_PLUGINS, create_plugin_strategy, discover_plugins
+
+    if name in BUILTIN_PLUGINS or name in discover_plugins():
+        return create_plugin_strategy(name, rng=rng)
+    if profiles and name in profiles:
+        return MixedStrategy(profiles[name], name=name, rng=rng)
+    raise ValueError(
+        f"Estrategia desconocida: {name}. Opciones: {', '.join(available_strategies(profiles))}"
+    )
@@ -0,0 +1,170 @@
+"""
+Trazas de partidas en formato Chrome trace-event (compatible con Perfetto)
+
+Este módulo registra spans de `run`, `play_round`, `get_user_choice`,
+`get_computer_choice` y los métodos `_display_*` del juego, para ver en
+chrome://tracing o ui.perfetto.dev cuánto tiempo de una sesión es espera del
+humano, trabajo del motor o E/S de terminal.
+
+Los eventos se acumulan en memoria y se vuelcan al archivo por lotes usando el
+"JSON Array Format" del formato trace-event, que admite añadir eventos al final
+del archivo sin reescribirlo.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, IO, List, Optional
+
+from .instrumentation import install_wrappers, restore_wrappers
+
+# Método del juego -> categoría del span
+TRACED_METHODS = {
+    "run": "engine",
+    "play_round": "engine",
+    "get_user_choice": "human",
+    "get_computer_choice": "engine",
+    "_display_choices": "terminal",
+    "_display_round_result": "terminal",
+    "_display_final_result": "terminal",
+}
+
+
+class ChromeTracer:
+    """
+    Tracer opcional que escribe spans como eventos completos ("ph": "X").
+
+    Uso:
+        with ChromeTracer("partida.json") as tracer:
+            tracer.attach(game)
+            game.run()
+    """
+
+    def __init__(self, path: str, batch_size: int = 512):
+        """
+        Inicializa el tracer; el archivo se abre con el primer volcado.
+
+        Args:
+            path: Ruta del archivo JSON de salida
+            batch_size: Eventos acumulados en memoria antes de volcar
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._events: List[Dict[str, Any]] = []
+        self._handle: Optional[IO[str]] = None
+        self._written = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._installed: Dict[int, Dict[str, Any]] = {}
+
+    def __enter__(self) -> "ChromeTracer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def add_span(self, name: str, category: str, start_ns: int, end_ns: int) -> None:
+        """
+        Añade un span al búfer y vuelca si se alcanzó el tamaño de lote.
+
+        Args:
+            name: Nombre del span
+            category: Categoría (engine, human, terminal)
+            start_ns: Inicio según time.perf_counter_ns
+            end_ns: Fin según time.perf_counter_ns
+        """
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - self._origin_ns) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        with self._lock:
+            self._events.append(event)
+            if len(self._events) >= self.batch_size:
+                self._flush_locked()
+
+    def span(self, name: str, category: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Crea una fábrica de envoltorios que registra un span por llamada.
+
+        Args:
+            name: Nombre del span
+            category: Categoría del span
+
+        Returns:
+            Callable: Función que recibe un método y devuelve su envoltorio
+        """
+        def factory(method: Callable[..., Any]) -> Callable[..., Any]:
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter_ns()
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    self.add_span(name, category, start, time.perf_counter_ns())
+
+            return wrapper
+
+        return factory
+
+    def attach(self, game: Any) -> None:
+        """
+        Instala los spans sobre una instancia del juego.
+
+        Args:
+            game: Instancia de RockPaperScissorsGame
+        """
+        if id(game) in self._installed:
+            return
+        self._installed[id(game)] = install_wrappers(game, {
+            name: self.span(name, category) for name, category in TRACED_METHODS.items()
+        })
+
+    def detach(self, game: Any) -> None:
+        """
+        Retira los spans de una instancia del juego.
+
+        Args:
+            game: Instancia previamente trazada
+        """
+        previous = self._installed.pop(id(game), None)
+        if previous is not None:
+            restore_wrappers(game, previous)
+
+    def flush(self) -> None:
+        """Vuelca al archivo los eventos pendientes."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Vuelca lo pendiente y cierra el arreglo JSON del archivo."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._flush_locked()
+            if self._handle is None:
+                self._handle = open(self.path, "w", encoding="utf-8")
+                self._handle.write("[")
+            self._handle.write("\n]\n")
+            self._handle.close()
+            self._handle = None
+
+    def _flush_locked(self) -> None:
+        """Escribe el lote actual; debe llamarse con el lock tomado."""
+        if not self._events:
+            return
+        if self._handle is None:
+            self._handle = open(self.path, "w", encoding="utf-8")
+            self._handle.write("[")
+        separator = ",\n" if self._written else "\n"
+        self._handle.write(separator + ",\n".join(json.dumps(event) for event in self._events))
+        self._handle.flush()
+        self._written += len(self._events)
+        self._events.clear()
@@ -0,0 +1,305 @@
+"""
+Entrenamiento de bots por minimización de arrepentimiento (regret matching)
+
+Cada carril de entrenamiento es un bot que aprende con regret matching+
+(CFR+ sobre el juego de una ronda) usando la matriz de resultados de
+`GameChoice`. Un carril en autojuego se enfrenta a otra copia que también
+aprende, y su estrategia promedio converge al equilibrio; un carril contra un
+perfil fijo aprende a explotarlo. Todos los carriles se actualizan a la vez con
+operaciones de NumPy sobre arreglos (carriles x opciones), de modo que el coste
+por iteración no depende de cuántos bots se entrenen.
+
+El estado se guarda en puntos de control .npz para reanudar el entrenamiento y
+las estrategias aprendidas se exportan como perfiles JSON que
+`strategies.load_profiles` convierte en estrategias para la computadora.
+
+Entrenamiento:
+    python -m src.training perfiles.json --iterations 1000000 --checkpoint cfr.npz
+
+Requiere numpy (dependencia opcional).
+"""
+
+import json
+import os
+import sys
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depende del entorno
+    raise ImportError(
+        "El entrenamiento de bots requiere numpy. Instálalo con: pip install numpy"
+    ) from exc
+
+from .equilibrium import game_choice_matrix
+from .strategies import BUILTIN_STRATEGIES, DEFAULT_STRATEGY
+
+DEFAULT_ITERATIONS = 100_000
+DEFAULT_CHECKPOINT_EVERY = 100_000
+
+SELF_PLAY = "equilibrio"
+
+# Diminuto pero normal: mucho menor que cualquier arrepentimiento real
+_TINY = 1e-300
+
+
+def default_opponents() -> Dict[str, Optional[Tuple[float, ...]]]:
+    """
+    Carriles por defecto: un bot de equilibrio y uno que explota cada estrategia integrada.
+
+    Returns:
+        Dict[str, Optional[Tuple[float, ...]]]: Nombre del bot -> pesos del rival
+        fijo, o None para autojuego
+    """
+    opponents: Dict[str, Optional[Tuple[float, ...]]] = {SELF_PLAY: None}
+    for name, weights in BUILTIN_STRATEGIES.items():
+        # Contra la estrategia uniforme toda respuesta vale lo mismo
+        if name != DEFAULT_STRATEGY:
+            opponents[f"anti-{name}"] = weights
+    return opponents
+
+
+def _regret_matching(regrets: "np.ndarray") -> "np.ndarray":
+    """
+    Estrategia proporcional al arrepentimiento acumulado (no negativo en CFR+).
+
+    Sumar un valor diminuto (`_TINY`) a cada celda da la estrategia uniforme
+    cuando no hay arrepentimiento y desaparece por redondeo en cuanto lo hay,
+    sin ramas por carril.
+    """
+    strategy = regrets + _TINY
+    strategy /= strategy.sum(axis=1, keepdims=True)
+    return strategy
+
+
+class RegretTrainer:
+    """
+    Entrena varios bots a la vez con regret matching+ vectorizado.
+
+    Uso:
+        trainer = RegretTrainer()
+        trainer.train(1_000_000, checkpoint_path="cfr.npz")
+        trainer.export_profiles("perfiles.json")
+    """
+
+    def __init__(
+        self,
+        opponents: Optional[Mapping[str, Optional[Sequence[float]]]] = None,
+        matrix: Optional[Sequence[Sequence[float]]] = None,
+    ):
+        """
+        Inicializa el entrenador.
+
+        Args:
+            opponents: Nombre del bot -> pesos del rival fijo a explotar, o None
+                para autojuego (por defecto, `default_opponents()`)
+            matrix: Pagos del bot (filas) contra el rival (columnas); por defecto
+                la matriz de resultados de GameChoice
+
+        Raises:
+            ValueError: Si no hay carriles o algún perfil de rival no es válido
+        """
+        if opponents is None:
+            opponents = default_opponents()
+        if not opponents:
+            raise ValueError("Se necesita al menos un bot que entrenar.")
+        self.matrix = np.asarray(game_choice_matrix() if matrix is None else matrix, dtype=np.float64)
+        rows, columns = self.matrix.shape
+
+        self.names: Tuple[str, ...] = tuple(opponents)
+        lanes = len(self.names)
+        self.self_play = np.array([weights is None for weights in opponents.values()])
+        self.fixed = np.zeros((lanes, columns))
+        for lane, weights in enumerate(opponents.values()):
+            if weights is None:
+                continue
+            profile = np.asarray(weights, dtype=np.float64)
+            if profile.shape != (columns,) or (profile < 0).any() or profile.sum() <= 0:
+                raise ValueError(
+                    f"El rival de {self.names[lane]} debe tener {columns} pesos no negativos."
+                )
+            self.fixed[lane] = profile / profile.sum()
+
+        self.regrets = np.zeros((lanes, rows))
+        self.opponent_regrets = np.zeros((lanes, columns))
+        self.strategy_sum = np.zeros((lanes, rows))
+        self.iterations = 0
+
+    def train(
+        self,
+        iterations: int,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    ) -> int:
+        """
+        Ejecuta iteraciones de regret matching+ en todos los carriles.
+
+        Args:
+            iterations: Iteraciones a ejecutar
+            checkpoint_path: Archivo .npz donde guardar el estado periódicamente
+            checkpoint_every: Iteraciones entre puntos de control
+
+        Returns:
+            int: Iteraciones acumuladas, incluidas las de entrenamientos anteriores
+
+        Raises:
+            ValueError: Si `checkpoint_every` no es positivo
+        """
+        if checkpoint_every < 1:
+            raise ValueError("Debe haber al menos una iteración entre puntos de control.")
+        payoff = self.matrix
+        payoff_t = payoff.T
+        self_play = self.self_play[:, np.newaxis]
+        for step in range(1, iterations + 1):
+            self.iterations += 1
+            strategy = _regret_matching(self.regrets)
+            opponent = np.where(self_play, _regret_matching(self.opponent_regrets), self.fixed)
+
+            row_values = opponent @ payoff_t
+            column_values = strategy @ payoff
+            column_values *= -1.0
+            row_values -= (strategy * row_values).sum(axis=1, keepdims=True)
+            column_values -= (opponent * column_values).sum(axis=1, keepdims=True)
+            # Regret matching+: el arrepentimiento acumulado no baja de 0
+            self.regrets += row_values
+            self.opponent_regrets += column_values
+            np.maximum(self.regrets, 0.0, out=self.regrets)
+            np.maximum(self.opponent_regrets, 0.0, out=self.opponent_regrets)
+            # Promedio lineal de CFR+: las iteraciones tardías pesan más
+            self.strategy_sum += self.iterations * strategy
+
+            if checkpoint_path and step % checkpoint_every == 0:
+                self.save_checkpoint(checkpoint_path)
+        if checkpoint_path:
+            self.save_checkpoint(checkpoint_path)
+        return self.iterations
+
+    def average_strategies(self) -> Dict[str, Tuple[float, ...]]:
+        """
+        Estrategia promedio de cada bot, la que converge durante el entrenamiento.
+
+        Returns:
+            Dict[str, Tuple[float, ...]]: Nombre del bot -> probabilidades por opción
+        """
+        averages = _regret_matching(self.strategy_sum)
+        return {name: tuple(float(p) for p in averages[lane]) for lane, name in enumerate(self.names)}
+
+    def exploitability(self) -> Dict[str, float]:
+        """
+        Ganancia por ronda de un rival que responde de forma óptima a cada bot.
+
+        En juegos simétricos como el de GameChoice vale 0 para una estrategia de
+        equilibrio; cuanto mayor, más explotable es el bot.
+
+        Returns:
+            Dict[str, float]: Nombre del bot -> ganancia esperada del mejor rival
+        """
+        best = (-(_regret_matching(self.strategy_sum) @ self.matrix)).max(axis=1)
+        return {name: float(best[lane]) for lane, name in enumerate(self.names)}
+
+    def save_checkpoint(self, path: str) -> None:
+        """
+        Guarda el estado del entrenamiento de forma atómica.
+
+        Args:
+            path: Archivo .npz de destino
+        """
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as handle:
+            np.savez(
+                handle,
+                names=np.array(self.names),
+                matrix=self.matrix,
+                self_play=self.self_play,
+                fixed=self.fixed,
+                regrets=self.regrets,
+                opponent_regrets=self.opponent_regrets,
+                strategy_sum=self.strategy_sum,
+                iterations=np.int64(self.iterations),
+            )
+        os.replace(temporary, path)
+
+    @classmethod
+    def load_checkpoint(cls, path: str) -> "RegretTrainer":
+        """
+        Reanuda un entrenamiento desde un punto de control.
+
+        Args:
+            path: Archivo .npz generado con `save_checkpoint`
+
+        Returns:
+            RegretTrainer: Entrenador con el estado guardado
+        """
+        with np.load(path) as data:
+            names = [str(name) for name in data["names"]]
+            opponents = {
+                name: None if self_play else tuple(fixed)
+                for name, self_play, fixed in zip(names, data["self_play"], data["fixed"])
+            }
+            trainer = cls(opponents, matrix=data["matrix"])
+            trainer.regrets[:] = data["regrets"]
+            trainer.opponent_regrets[:] = data["opponent_regrets"]
+            trainer.strategy_sum[:] = data["strategy_sum"]
+            trainer.iterations = int(data["iterations"])
+        return trainer
+
+    def export_profiles(self, path: str) -> None:
+        """
+        Exporta las estrategias promedio como perfiles de la computadora.
+
+        Args:
+            path: Archivo JSON de destino, legible con `strategies.load_profiles`
+        """
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump(self.average_strategies(), handle, indent=2)
+        os.replace(temporary, path)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entrena los bots desde la línea de comandos.
+
+    Args:
+        argv: Argumentos (por defecto, sys.argv[1:])
+
+    Returns:
+        int: Código de salida
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Entrena bots con regret matching+")
+    parser.add_argument("output", help="Archivo JSON de perfiles a escribir")
+    parser.add_argument(
+        "--iterations", type=int, default=DEFAULT_ITERATIONS, help="Iteraciones de entrenamiento"
+    )
+    parser.add_argument(
+        "--checkpoint", default=None, help="Punto de control .npz; si existe, se reanuda desde él"
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=DEFAULT_CHECKPOINT_EVERY,
+        help="Iteraciones entre puntos de control",
+    )
+    args = parser.parse_args(argv)
+    if args.checkpoint_every < 1:
+        parser.error("--checkpoint-every debe ser al menos 1")
+
+    if args.checkpoint and os.path.exists(args.checkpoint):
+        trainer = RegretTrainer.load_checkpoint(args.checkpoint)
+    else:
+        trainer = RegretTrainer()
+    total = trainer.train(args.iterations, args.checkpoint, args.checkpoint_every)
+    trainer.export_profiles(args.output)
+
+    print(f"Perfiles escritos en {args.output} ({total} iteraciones)")
+    exploitability = trainer.exploitability()
+    for name, weights in trainer.average_strategies().items():
+        formatted = ", ".join(f"{p:.3f}" for p in weights)
+        print(f"  {name}: [{formatted}]  explotabilidad {exploitability[name]:.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
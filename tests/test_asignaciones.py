@@ -0,0 +1,95 @@
+"""
+Tests para la ruta de una ronda sin asignaciones de memoria
+
+Valida que las consultas de `GameChoice` y `GameResult` devuelven tablas
+precalculadas y que una ronda sin consola no deja memoria asignada ni
+construye contenedores temporales.
+"""
+
+import os
+import subprocess
+import sys
+
+from src.game import QUIT_WORDS
+from src.game_enums import GameChoice, GameResult
+
+ROUNDS = 5000
+
+# Margen del propio bucle de medición (enteros del contador y marcos)
+LOOP_OVERHEAD = 256
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def play_rounds(game, rounds):
+    """Juega rondas sin consola, reiniciando la partida al terminar."""
+    for _ in range(rounds):
+        if game._check_game_over():
+            game.reset_game()
+        game.resolve_round(game.get_computer_choice(), game.get_computer_choice())
+
+
+# Medición en un proceso aparte: el trazador de coverage (activo con la
+# configuración de pytest) asigna memoria en cada línea que ejecuta
+MEASURE_SCRIPT = f"""
+import tracemalloc
+from src.game import GameEngine
+from tests.test_asignaciones import play_rounds
+
+game = GameEngine()
+play_rounds(game, 100)
+tracemalloc.start()
+play_rounds(game, 10)
+before = tracemalloc.get_traced_memory()[0]
+tracemalloc.reset_peak()
+play_rounds(game, {ROUNDS})
+after, peak = tracemalloc.get_traced_memory()
+print(after - before, peak - before)
+"""
+
+
+def measure_without_coverage():
+    """Asignaciones netas y pico de ROUNDS rondas, medidos sin coverage."""
+    env = {key: value for key, value in os.environ.items() if not key.startswith(("COV_CORE", "COVERAGE"))}
+    env["PYTHONPATH"] = ROOT
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    net, peak = map(int, output.split())
+    return net, peak
+
+
+class TestTablasPrecalculadas:
+    """Tests de las consultas sin construcción de contenedores."""
+
+    def test_misma_instancia_en_cada_llamada(self):
+        """Test: Las consultas de opciones devuelven siempre el mismo objeto."""
+        assert GameChoice.get_all_choices() is GameChoice.get_all_choices()
+        assert GameChoice.get_choices_dict() is GameChoice.get_choices_dict()
+        assert isinstance(GameChoice.get_all_choices(), tuple)
+
+    def test_mapeo_de_solo_lectura(self):
+        """Test: El mapeo numérico compartido no se puede modificar."""
+        choices = GameChoice.get_choices_dict()
+        try:
+            choices[6] = GameChoice.ROCK
+        except TypeError:
+            pass
+        assert 6 not in choices
+
+    def test_textos_sin_cambios(self):
+        """Test: Descripciones y resultados conservan sus textos."""
+        assert GameChoice.SPOCK.get_win_description(GameChoice.ROCK) == "Spock vaporiza Piedra"
+        assert GameChoice.ROCK.get_win_description(GameChoice.PAPER) == "Piedra vence a Papel"
+        assert str(GameResult.COMPUTER_WINS) == "Ganó la computadora"
+        assert {"q", "quit", "salir"} == QUIT_WORDS
+
+
+class TestRondaSinAsignaciones:
+    """Tests de memoria de la ronda sin consola."""
+
+    def test_cero_asignaciones_netas_por_ronda(self):
+        """Test: Miles de rondas sin consola no dejan memoria ni picos por ronda."""
+        net, peak = measure_without_coverage()
+        assert net == 0
+        assert peak < LOOP_OVERHEAD
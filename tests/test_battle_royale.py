@@ -0,0 +1,70 @@
+"""
+Tests para el modo battle royale vectorizado
+
+Valida que el torneo termina con un único campeón en ceil(log2(N)) rondas, que
+los duelos respetan las reglas de GameChoice y que el resultado es reproducible.
+"""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.battle_royale import BEATS_MATRIX, CHOICES, BattleRoyale, run_battle_royale  # noqa: E402
+
+
+class TestBattleRoyale:
+    """Tests del torneo de eliminación."""
+
+    def test_matriz_derivada_de_beats(self):
+        """Test: La matriz vectorizada coincide con GameChoice.beats."""
+        for i, a in enumerate(CHOICES):
+            for j, b in enumerate(CHOICES):
+                assert BEATS_MATRIX[i, j] == a.beats(b)
+
+    @pytest.mark.parametrize("players", [2, 3, 17, 1024, 100_000])
+    def test_un_campeon_en_log2_rondas(self, players):
+        """Test: Cada ronda elimina la mitad; el torneo dura ceil(log2(N)) rondas."""
+        result = run_battle_royale(players, seed=5)
+        assert 0 <= result.champion < players
+        assert result.rounds == math.ceil(math.log2(players))
+        assert result.duels == players - 1
+        assert result.throws >= 2 * result.duels
+
+    def test_reproducible_con_semilla(self):
+        """Test: La misma semilla produce el mismo campeón."""
+        first = run_battle_royale(5000, seed=11)
+        second = run_battle_royale(5000, seed=11)
+        assert (first.champion, first.throws) == (second.champion, second.throws)
+
+    def test_estrategia_dominante_gana(self):
+        """Test: Con sólo Piedra y Papel, el campeón siempre juega Papel."""
+        players = 512
+        assignment = np.array([0] * 511 + [1])
+        royale = BattleRoyale(
+            players,
+            seed=3,
+            strategies=[[1, 0, 0, 0, 0], [0, 1, 0, 0, 0]],
+            player_strategies=assignment,
+        )
+        result = royale.run()
+        assert result.champion == 511
+
+    def test_empates_persistentes_se_deciden(self):
+        """Test: Dos estrategias puras iguales no bloquean el torneo."""
+        royale = BattleRoyale(8, seed=1, strategies=[[0, 0, 0, 0, 1]], max_rethrows=3)
+        result = royale.run()
+        assert result.rounds == 3
+        assert result.throws == 2 * 3 * 7
+
+    def test_parametros_invalidos(self):
+        """Test: Parámetros incoherentes lanzan ValueError."""
+        with pytest.raises(ValueError):
+            BattleRoyale(1)
+        with pytest.raises(ValueError):
+            BattleRoyale(4, strategies=[[1, 0, 0]])
+        with pytest.raises(ValueError):
+            BattleRoyale(4, strategies=[[1, 0, 0, 0, 0]], player_strategies=[0, 0, 0, 1])
+        with pytest.raises(ValueError, match="positiva"):
+            BattleRoyale(4, strategies=[[1, 0, 0, 0, 0], [0, 0, 0, 0, 0]])
@@ -0,0 +1,117 @@
+"""
+Tests para las simulaciones repartidas por TCP
+
+Valida que coordinador y trabajadores (locales, en hilos) dan el mismo
+resultado que la simulación en serie, el robo de trabajo a un trabajador
+colgado, los reintentos de bloques fallidos y los agregados parciales.
+"""
+
+import json
+import socket
+import threading
+from unittest.mock import patch
+
+import pytest
+from src import distributed
+from src.batch import SimulationExecutor, SimulationJob
+from src.distributed import (
+    PROTOCOL_VERSION,
+    Coordinator,
+    run_worker,
+)
+
+JOB = SimulationJob(1200, chunk_size=100, seed=11, computer_strategy="clasica")
+
+
+def start_workers(coordinator, count):
+    """Lanza trabajadores locales en hilos."""
+    threads = [
+        threading.Thread(target=run_worker, args=coordinator.address, daemon=True) for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def raw_worker(coordinator):
+    """Trabajador manual: saluda, recibe la simulación y devuelve el flujo."""
+    connection = socket.create_connection(coordinator.address)
+    stream = connection.makefile("rwb")
+    stream.write(json.dumps({"type": "hello", "version": PROTOCOL_VERSION}).encode() + b"\n")
+    stream.flush()
+    assert json.loads(stream.readline())["type"] == "job"
+    return connection, stream
+
+
+class TestProtocolo:
+    """Tests de la serialización de mensajes."""
+
+    def test_simulacion_ida_y_vuelta(self):
+        """Test: Una simulación con perfiles sobrevive a JSON."""
+        job = JOB._replace(profiles={"solo-papel": (0, 1, 0, 0, 0)})
+        data = json.loads(json.dumps(job.to_dict()))
+        restored = SimulationJob.from_dict(data)
+        assert restored._replace(profiles=None) == JOB
+        assert list(restored.profiles["solo-papel"]) == [0, 1, 0, 0, 0]
+
+
+class TestCoordinator:
+    """Tests del reparto de bloques entre trabajadores."""
+
+    def test_mismo_resultado_que_en_serie(self):
+        """Test: Tres trabajadores producen el agregado de la simulación en serie."""
+        coordinator = Coordinator(JOB, port=0)
+        start_workers(coordinator, 3)
+        assert coordinator.run(timeout=30) == SimulationExecutor(jobs=1).run(JOB)
+
+    def test_agregados_parciales(self):
+        """Test: on_progress recibe un agregado creciente tras cada bloque."""
+        progress = []
+        coordinator = Coordinator(JOB, port=0, on_progress=progress.append)
+        start_workers(coordinator, 2)
+        summary = coordinator.run(timeout=30)
+        assert [step.completed for step in progress] == list(range(1, JOB.chunk_count + 1))
+        assert progress[-1].summary == summary
+        assert coordinator.partial().completed == JOB.chunk_count
+
+    def test_robo_de_trabajo(self):
+        """Test: Un trabajador libre roba el bloque de un trabajador colgado."""
+        coordinator = Coordinator(JOB, port=0)
+        connection, stream = raw_worker(coordinator)
+        stalled = json.loads(stream.readline())
+        assert stalled["type"] == "chunk"
+        start_workers(coordinator, 1)
+        assert coordinator.run(timeout=30) == SimulationExecutor(jobs=1).run(JOB)
+        connection.close()
+
+    def test_reintenta_bloque_de_conexion_perdida(self):
+        """Test: El bloque de un trabajador que se desconecta vuelve a la cola."""
+        coordinator = Coordinator(JOB, port=0)
+        connection, stream = raw_worker(coordinator)
+        assert json.loads(stream.readline())["type"] == "chunk"
+        stream.close()
+        connection.close()
+        start_workers(coordinator, 1)
+        assert coordinator.run(timeout=30).matches == JOB.matches
+
+    def test_abandona_tras_agotar_reintentos(self):
+        """Test: Un bloque que falla siempre aborta la simulación con RuntimeError."""
+        coordinator = Coordinator(JOB, port=0, max_retries=2)
+        original = distributed.run_chunk
+
+        def failing(job, index):
+            if index == 3:
+                raise ValueError("fallo del trabajador")
+            return original(job, index)
+
+        with patch.object(distributed, "run_chunk", failing):
+            start_workers(coordinator, 2)
+            with pytest.raises(RuntimeError, match="bloque 3"):
+                coordinator.run(timeout=30)
+
+    def test_simulacion_invalida(self):
+        """Test: Una simulación inválida falla antes de escuchar."""
+        with pytest.raises(ValueError):
+            Coordinator(SimulationJob(10, computer_strategy="nadie"), port=0)
+        with pytest.raises(ValueError):
+            Coordinator(JOB, port=0, max_retries=-1)
@@ -0,0 +1,127 @@
+"""
+Tests para el entrenamiento de bots con regret matching+
+
+Valida la convergencia al equilibrio en autojuego, la explotación de perfiles
+fijos, la reanudación desde puntos de control y la exportación de perfiles.
+"""
+
+import json
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.game_enums import GameChoice  # noqa: E402
+from src.odds import round_probabilities  # noqa: E402
+from src.strategies import (  # noqa: E402
+    BUILTIN_STRATEGIES,
+    MixedStrategy,
+    available_strategies,
+    create_strategy,
+    load_profiles,
+)
+from src import training  # noqa: E402
+from src.training import RegretTrainer, default_opponents  # noqa: E402
+
+
+class TestRegretTrainer:
+    """Tests del entrenador vectorizado."""
+
+    def test_carriles_por_defecto(self):
+        """Test: Un bot de equilibrio y uno por estrategia integrada no uniforme."""
+        opponents = default_opponents()
+        assert opponents["equilibrio"] is None
+        assert opponents["anti-piedra"] == BUILTIN_STRATEGIES["piedra"]
+        assert "anti-aleatoria" not in opponents
+
+    def test_autojuego_converge_al_equilibrio(self):
+        """Test: En un juego 2x2 la estrategia promedio converge al minimax (2/5, 3/5)."""
+        trainer = RegretTrainer({"bot": None}, matrix=[[2, -1], [-1, 1]])
+        trainer.train(5000)
+        assert trainer.average_strategies()["bot"] == pytest.approx((0.4, 0.6), abs=0.01)
+
+    def test_equilibrio_no_explotable(self):
+        """Test: El bot de autojuego sobre GameChoice no es explotable."""
+        trainer = RegretTrainer()
+        trainer.train(2000)
+        assert trainer.exploitability()["equilibrio"] == pytest.approx(0.0, abs=1e-6)
+
+    @pytest.mark.parametrize("name", ["piedra", "spock", "clasica"])
+    def test_explota_perfil_fijo(self, name):
+        """Test: El bot anti-X obtiene contra X la ganancia de la mejor respuesta pura."""
+        trainer = RegretTrainer()
+        trainer.train(2000)
+        target = BUILTIN_STRATEGIES[name]
+
+        def payoff(strategy):
+            probabilities = round_probabilities(strategy, target)
+            return probabilities.user_wins - probabilities.computer_wins
+
+        pure = [[1 if i == j else 0 for j in range(5)] for i in range(5)]
+        best = max(payoff(strategy) for strategy in pure)
+        assert best > 0
+        assert payoff(trainer.average_strategies()[f"anti-{name}"]) == pytest.approx(best, abs=1e-3)
+
+    def test_rival_invalido(self):
+        """Test: Perfiles de rival mal formados lanzan ValueError."""
+        with pytest.raises(ValueError):
+            RegretTrainer({"bot": (1.0, 1.0)})
+        with pytest.raises(ValueError):
+            RegretTrainer({"bot": (1.0, -1.0, 1.0, 1.0, 1.0)})
+        with pytest.raises(ValueError):
+            RegretTrainer({})
+
+
+class TestCheckpoints:
+    """Tests de puntos de control y exportación."""
+
+    def test_reanudar_equivale_a_no_interrumpir(self, tmp_path):
+        """Test: Entrenar, guardar, cargar y seguir da lo mismo que entrenar de corrido."""
+        path = str(tmp_path / "cfr.npz")
+        trainer = RegretTrainer()
+        trainer.train(300, checkpoint_path=path, checkpoint_every=100)
+
+        resumed = RegretTrainer.load_checkpoint(path)
+        assert resumed.iterations == 300
+        assert resumed.names == trainer.names
+        resumed.train(200)
+
+        uninterrupted = RegretTrainer()
+        uninterrupted.train(500)
+        np.testing.assert_allclose(resumed.strategy_sum, uninterrupted.strategy_sum)
+        np.testing.assert_allclose(resumed.regrets, uninterrupted.regrets)
+
+    def test_perfiles_exportados_como_estrategias(self, tmp_path):
+        """Test: Los perfiles exportados se cargan como estrategias de la computadora."""
+        path = str(tmp_path / "perfiles.json")
+        trainer = RegretTrainer()
+        trainer.train(500)
+        trainer.export_profiles(path)
+
+        profiles = load_profiles(path)
+        assert set(profiles) == set(trainer.names)
+        assert "anti-piedra" in available_strategies(profiles)
+
+        strategy = create_strategy("anti-piedra", rng=random.Random(5), profiles=profiles)
+        assert isinstance(strategy, MixedStrategy)
+        choices = {strategy.choose() for _ in range(200)}
+        assert choices <= {GameChoice.PAPER, GameChoice.SPOCK}
+
+    def test_intervalo_invalido(self, tmp_path):
+        """Test: Un intervalo de puntos de control menor que 1 se rechaza."""
+        path = str(tmp_path / "cfr.npz")
+        with pytest.raises(ValueError):
+            RegretTrainer().train(10, checkpoint_path=path, checkpoint_every=0)
+        with pytest.raises(SystemExit):
+            training.main([str(tmp_path / "perfiles.json"), "--checkpoint", path, "--checkpoint-every", "0"])
+
+    def test_perfiles_invalidos(self, tmp_path):
+        """Test: Un archivo de perfiles mal formado lanza ValueError."""
+        path = tmp_path / "perfiles.json"
+        path.write_text(json.dumps({"bot": [1, 2]}), encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_profiles(str(path))
+        path.write_text(json.dumps([[1, 1, 1, 1, 1]]), encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_profiles(str(path))
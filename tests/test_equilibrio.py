@@ -0,0 +1,118 @@
+"""
+Tests para el solucionador del equilibrio de Nash de variantes de reglas
+
+Valida las estrategias minimax de las reglas estándar, soluciones exactas con
+fracciones, variantes desequilibradas y la caché por hash de la matriz.
+"""
+
+from fractions import Fraction
+
+import pytest
+from src import equilibrium
+from src.equilibrium import (
+    clear_cache,
+    game_choice_matrix,
+    matrix_key,
+    outcome_matrix,
+    solve_zero_sum,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Cada test empieza con la caché vacía."""
+    clear_cache()
+    yield
+    clear_cache()
+
+
+class TestOutcomeMatrix:
+    """Tests de la construcción de la matriz de resultados."""
+
+    def test_reglas_estandar(self):
+        """Test: Cada opción vence a dos, pierde con dos y empata consigo misma."""
+        matrix = game_choice_matrix()
+        assert len(matrix) == 5
+        for i, row in enumerate(matrix):
+            assert row[i] == 0
+            assert row.count(1) == 2
+            assert row.count(-1) == 2
+            assert all(matrix[j][i] == -row[j] for j in range(5))
+
+    def test_relacion_personalizada(self):
+        """Test: La matriz sigue la relación de la variante recibida."""
+        beats = {("piedra", "tijeras"), ("tijeras", "papel"), ("papel", "piedra")}
+        matrix = outcome_matrix(["piedra", "papel"], lambda a, b: (a, b) in beats)
+        assert matrix == ((0, -1), (1, 0))
+
+
+class TestSolveZeroSum:
+    """Tests del cálculo del equilibrio."""
+
+    def test_reglas_estandar_uniforme(self):
+        """Test: Las reglas estándar están equilibradas y su equilibrio es uniforme."""
+        solution = solve_zero_sum(game_choice_matrix())
+        assert solution.value == pytest.approx(0.0, abs=1e-9)
+        assert solution.row_strategy == pytest.approx([0.2] * 5)
+        assert solution.column_strategy == pytest.approx([0.2] * 5)
+
+    def test_solucion_exacta_con_fracciones(self):
+        """Test: Con Fraction el equilibrio de un juego 2x2 es exacto."""
+        matrix = [[Fraction(2), Fraction(-1)], [Fraction(-1), Fraction(1)]]
+        solution = solve_zero_sum(matrix)
+        assert solution.row_strategy == (Fraction(2, 5), Fraction(3, 5))
+        assert solution.column_strategy == (Fraction(2, 5), Fraction(3, 5))
+        assert solution.value == Fraction(1, 5)
+
+    def test_variante_con_pozo(self):
+        """Test: En piedra-papel-tijeras-pozo la piedra queda dominada y no se juega."""
+        choices = ["piedra", "papel", "tijeras", "pozo"]
+        beats = {
+            ("piedra", "tijeras"), ("tijeras", "papel"), ("papel", "piedra"),
+            ("pozo", "piedra"), ("pozo", "tijeras"), ("papel", "pozo"),
+        }
+        matrix = [[Fraction(v) for v in row] for row in outcome_matrix(choices, lambda a, b: (a, b) in beats)]
+        solution = solve_zero_sum(matrix)
+        third = Fraction(1, 3)
+        assert solution.row_strategy == (0, third, third, third)
+        assert solution.value == 0
+
+    def test_estrategia_garantiza_el_valor(self):
+        """Test: La estrategia de las filas asegura el valor contra toda columna."""
+        matrix = [[3.0, -1.0, 0.5], [-2.0, 4.0, 1.0], [0.0, 1.0, -3.0]]
+        solution = solve_zero_sum(matrix)
+        assert sum(solution.row_strategy) == pytest.approx(1.0)
+        assert sum(solution.column_strategy) == pytest.approx(1.0)
+        for j in range(3):
+            payoff = sum(p * row[j] for p, row in zip(solution.row_strategy, matrix))
+            assert payoff >= solution.value - 1e-9
+        for row in matrix:
+            payoff = sum(q * value for q, value in zip(solution.column_strategy, row))
+            assert payoff <= solution.value + 1e-9
+
+    def test_cache_por_hash(self):
+        """Test: Resolver dos veces la misma matriz reutiliza la solución guardada."""
+        matrix = game_choice_matrix()
+        first = solve_zero_sum(matrix)
+        second = solve_zero_sum([list(row) for row in matrix])
+        assert second is first
+        assert matrix_key(matrix) == matrix_key([list(row) for row in matrix])
+
+    def test_cache_acotada(self):
+        """Test: La caché no crece más allá de su tamaño máximo."""
+        for value in range(equilibrium._CACHE_SIZE + 10):
+            solve_zero_sum([[value, 0], [0, 1]])
+        assert equilibrium._cached_solution.cache_info().currsize == equilibrium._CACHE_SIZE
+
+    def test_cache_distingue_fracciones(self):
+        """Test: Una matriz entera y su versión con Fraction no comparten solución."""
+        solve_zero_sum(game_choice_matrix())
+        exact = solve_zero_sum([[Fraction(value) for value in row] for row in game_choice_matrix()])
+        assert all(isinstance(p, Fraction) for p in exact.row_strategy)
+
+    def test_matriz_invalida(self):
+        """Test: Matrices vacías o no rectangulares lanzan ValueError."""
+        with pytest.raises(ValueError):
+            solve_zero_sum([])
+        with pytest.raises(ValueError):
+            solve_zero_sum([[1, 0], [0]])
@@ -0,0 +1,90 @@
+"""
+Tests para las estrategias de la computadora
+
+Valida las estrategias integradas, su creación por nombre y su uso desde
+RockPaperScissorsGame.get_computer_choice.
+"""
+
+import random
+
+import pytest
+from src.game_enums import GameChoice
+from src.game import RockPaperScissorsGame
+from src.strategies import (
+    BUILTIN_STRATEGIES,
+    FiniteStateStrategy,
+    MixedStrategy,
+    UniformStrategy,
+    available_strategies,
+    create_strategy,
+)
+
+
+class TestEstrategias:
+    """Tests de las estrategias integradas."""
+
+    def test_estrategia_por_defecto(self):
+        """Test: El juego usa la estrategia uniforme si no se indica otra."""
+        game = RockPaperScissorsGame()
+        assert isinstance(game.strategy, UniformStrategy)
+        assert game.strategy.name == "aleatoria"
+
+    @pytest.mark.parametrize("name", available_strategies())
+    def test_crear_por_nombre(self, name):
+        """Test: Todas las estrategias integradas se crean y eligen opciones válidas."""
+        strategy = create_strategy(name, rng=random.Random(1))
+        assert strategy.name == name
+        for _ in range(20):
+            assert strategy.choose() in GameChoice
+
+    def test_nombre_desconocido(self):
+        """Test: Un nombre desconocido lanza ValueError."""
+        with pytest.raises(ValueError):
+            create_strategy("telepatia")
+
+    def test_pesos_invalidos(self):
+        """Test: Pesos mal formados lanzan ValueError."""
+        with pytest.raises(ValueError):
+            MixedStrategy([1, 1])
+        with pytest.raises(ValueError):
+            MixedStrategy([0, 0, 0, 0, 0])
+
+    def test_pesos_respetados(self):
+        """Test: La estrategia clásica nunca elige Lagarto ni Spock."""
+        strategy = create_strategy("clasica", rng=random.Random(3))
+        choices = {strategy.choose() for _ in range(500)}
+        assert choices == {GameChoice.ROCK, GameChoice.PAPER, GameChoice.SCISSORS}
+        assert sum(BUILTIN_STRATEGIES["clasica"]) == 3
+
+    def test_juego_usa_su_estrategia(self):
+        """Test: get_computer_choice delega en la estrategia del juego."""
+        game = RockPaperScissorsGame(strategy=MixedStrategy([0, 0, 0, 0, 1], name="solo-spock"))
+        assert {game.get_computer_choice() for _ in range(10)} == {GameChoice.SPOCK}
+
+
+class TestFiniteStateStrategy:
+    """Tests de las estrategias de máquina de estados."""
+
+    def test_reacciona_al_rival(self):
+        """Test: Una máquina de 2 estados lanza Papel tras ver Piedra y vuelve con lo demás."""
+        # Estado 0 lanza Piedra, estado 1 lanza Papel; Piedra del rival lleva al 1
+        strategy = FiniteStateStrategy([0, 1], [[1, 0, 0, 0, 0], [1, 0, 0, 0, 0]])
+        assert strategy.choose() == GameChoice.ROCK
+        strategy.observe(GameChoice.ROCK, GameChoice.ROCK)
+        assert strategy.choose() == GameChoice.PAPER
+        strategy.observe(GameChoice.SPOCK, GameChoice.PAPER)
+        assert strategy.choose() == GameChoice.ROCK
+        strategy.observe(GameChoice.ROCK, GameChoice.ROCK)
+        strategy.reset()
+        assert strategy.choose() == GameChoice.ROCK
+
+    def test_tablas_invalidas(self):
+        """Test: Salidas o transiciones fuera de rango lanzan ValueError."""
+        with pytest.raises(ValueError):
+            FiniteStateStrategy([], [])
+        with pytest.raises(ValueError):
+            FiniteStateStrategy([5], [[0] * 5])
+        with pytest.raises(ValueError):
+            FiniteStateStrategy([0], [[1] * 5])
+        with pytest.raises(ValueError):
+            FiniteStateStrategy([0], [[0] * 4])
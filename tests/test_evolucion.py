@@ -0,0 +1,117 @@
+"""
+Tests para la búsqueda evolutiva de estrategias
+
+Valida los operadores genéticos, la aptitud por partidas sin interfaz y que la
+evaluación en el pool de procesos con memoria compartida da el mismo
+resultado que la evaluación en serie.
+"""
+
+import random
+
+import pytest
+from src.evolution import (
+    REACTIVE_OPPONENTS,
+    EvolutionarySearch,
+    MachineGenome,
+    MixedGenome,
+    crossover,
+    evaluate,
+    mutate,
+    random_genome,
+)
+from src.game_enums import GameChoice
+from src.strategies import FiniteStateStrategy, MixedStrategy
+
+
+class TestGenomas:
+    """Tests de los genomas y operadores genéticos."""
+
+    @pytest.mark.parametrize("kind", ["mixed", "machine"])
+    def test_genomas_validos(self, kind):
+        """Test: Genomas aleatorios, cruzados y mutados siguen siendo estrategias válidas."""
+        rng = random.Random(1)
+        first = random_genome(kind, rng, states=3)
+        second = random_genome(kind, rng, states=3)
+        for _ in range(50):
+            child = mutate(crossover(first, second, rng), rng, rate=0.5)
+            child.strategy(rng).choose()
+            first, second = second, child
+
+    def test_tipos_de_estrategia(self):
+        """Test: Cada genoma produce su tipo de estrategia."""
+        assert isinstance(MixedGenome((1.0,) * 5).strategy(), MixedStrategy)
+        assert isinstance(MachineGenome((0,), ((0,) * 5,)).strategy(), FiniteStateStrategy)
+
+    def test_cruce_de_tipos_distintos(self):
+        """Test: Cruzar una estrategia mixta con una máquina lanza TypeError."""
+        rng = random.Random(1)
+        with pytest.raises(TypeError):
+            crossover(random_genome("mixed", rng), random_genome("machine", rng), rng)
+
+    def test_tipo_desconocido(self):
+        """Test: Un tipo de genoma inexistente lanza ValueError."""
+        with pytest.raises(ValueError):
+            random_genome("red-neuronal", random.Random(1))
+        with pytest.raises(ValueError):
+            EvolutionarySearch(kind="red-neuronal")
+
+
+class TestAptitud:
+    """Tests de la evaluación de aptitud."""
+
+    def test_respuesta_pura_gana_siempre(self):
+        """Test: Papel siempre contra un rival que siempre lanza Piedra gana todas las partidas."""
+        fitness = evaluate(MixedGenome((0, 1, 0, 0, 0)), [(1, 0, 0, 0, 0)], matches=5, max_score=3, seed=1)
+        assert fitness == 1.0
+
+    def test_rivales_reactivos(self):
+        """Test: Los rivales reactivos repiten o vencen la última elección de la computadora."""
+        copycat, beater = (machine.strategy() for machine in REACTIVE_OPPONENTS)
+        for rival in (copycat, beater):
+            rival.observe(GameChoice.LIZARD, rival.choose())
+        assert copycat.choose() == GameChoice.LIZARD
+        assert beater.choose().beats(GameChoice.LIZARD)
+
+    def test_estrategia_fija_pierde_contra_reactivos(self):
+        """Test: Lanzar siempre Papel gana a Piedra pero no a quien vence la última elección."""
+        paper = MixedGenome((0, 1, 0, 0, 0))
+        assert evaluate(paper, [], 5, 3, seed=1, reactive=REACTIVE_OPPONENTS[1:]) == 0.0
+
+    def test_reproducible_con_semilla(self):
+        """Test: La misma semilla da la misma aptitud."""
+        genome = MixedGenome((1.0,) * 5)
+        opponents = [(3, 1, 1, 1, 1)]
+        assert evaluate(genome, opponents, 20, 3, seed=9) == evaluate(genome, opponents, 20, 3, seed=9)
+
+
+class TestEvolutionarySearch:
+    """Tests de la búsqueda completa."""
+
+    def test_encuentra_la_respuesta_a_un_rival_puro(self):
+        """Test: Contra un rival que sólo lanza Piedra la búsqueda llega a ganar siempre."""
+        search = EvolutionarySearch(
+            kind="machine", population_size=12, opponents=[(1, 0, 0, 0, 0)], matches=3, seed=4
+        )
+        result = search.run(generations=10)
+        assert result.fitness == 1.0
+        assert len(result.history) == 10
+        assert max(result.history) == result.fitness
+
+    def test_aptitud_de_la_evaluacion_fija(self):
+        """Test: La aptitud devuelta es la del mejor genoma en la evaluación fija, no la más afortunada."""
+        search = EvolutionarySearch(kind="mixed", population_size=10, matches=3, seed=2)
+        result = search.run(generations=4)
+        assert result.fitness == evaluate(
+            result.best, search.opponents, search.matches, search.max_score,
+            seed=search.validation_seed, reactive=search.reactive_opponents,
+        )
+
+    @pytest.mark.parametrize("kind", ["mixed", "machine"])
+    def test_pool_con_memoria_compartida_igual_a_serie(self, kind):
+        """Test: Evaluar en 2 procesos da exactamente lo mismo que en serie."""
+        def search(jobs):
+            return EvolutionarySearch(
+                kind=kind, population_size=8, matches=4, jobs=jobs, seed=11
+            ).run(generations=3)
+
+        assert search(2) == search(1)
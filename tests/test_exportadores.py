@@ -0,0 +1,189 @@
+"""
+Tests para los exportadores NDJSON y CSV
+
+Valida que las plantillas precodificadas producen el mismo JSON y CSV que las
+bibliotecas estándar, la compresión gzip, los errores de tipo y que el trabajo
+por registro se mantiene fuera del bucle: una escritura por bloque y una sola
+codificación de cada valor de los Enum.
+"""
+
+import csv
+import gzip
+import io
+import itertools
+import json
+from typing import NamedTuple
+from unittest.mock import patch
+
+import pytest
+from src import exporters
+from src.exporters import RecordExporter, export_records, read_records
+from src.game import GameEngine, MatchResult, RoundRecord
+from src.game_enums import GameChoice, GameResult
+from src.strategies import UniformStrategy
+
+
+class Sample(NamedTuple):
+    name: str
+    ratio: float
+    flag: bool
+
+
+def sample_rounds(matches=200):
+    """Rondas de varias partidas al azar."""
+    game = GameEngine()
+    return list(itertools.chain.from_iterable(game.iter_rounds(UniformStrategy()) for _ in range(matches)))
+
+
+class TestNdjson:
+    """Tests de la exportación NDJSON."""
+
+    def test_coincide_con_json_dumps(self):
+        """Test: Cada línea es el mismo objeto que daría json.dumps."""
+        rounds = sample_rounds()
+        output = io.BytesIO()
+        assert export_records(rounds, output) == len(rounds)
+        lines = output.getvalue().decode("utf-8").splitlines()
+        assert len(lines) == len(rounds)
+        for line, record in zip(lines, rounds):
+            expected = {name: getattr(value, "value", value) for name, value in record._asdict().items()}
+            assert json.loads(line) == expected
+
+    def test_campos_sin_plantilla(self):
+        """Test: Textos con comillas, flotantes y booleanos se codifican bien."""
+        output = io.BytesIO()
+        export_records([Sample('dice "hola", adiós', 0.25, True)], output)
+        assert json.loads(output.getvalue()) == {"name": 'dice "hola", adiós', "ratio": 0.25, "flag": True}
+
+    def test_escritura_por_bloques(self):
+        """Test: Los registros se escriben en bloques de buffer_records."""
+        output = io.BytesIO()
+        exporter = RecordExporter(output, buffer_records=10)
+        exporter.write_many(MatchResult(3, index % 3, 5) for index in range(25))
+        assert output.getvalue().count(b"\n") == 20
+        exporter.close()
+        assert output.getvalue().count(b"\n") == 25
+        assert exporter.records == 25
+
+
+    @pytest.mark.parametrize("later", [2.5, None, True])
+    def test_tipos_distintos_al_primero(self, later):
+        """Test: Un campo con otro tipo que en el primer registro no se trunca ni falla."""
+        output = io.BytesIO()
+        export_records([MatchResult(1, 0, 1), MatchResult(later, 0, 2)], output)
+        lines = output.getvalue().decode("utf-8").splitlines()
+        assert [json.loads(line)["user_score"] for line in lines] == [1, later]
+
+    def test_enum_con_otro_tipo(self):
+        """Test: Un None donde el primer registro tenía un Enum se codifica como null."""
+        first = RoundRecord(1, GameChoice.ROCK, GameChoice.PAPER, GameResult.COMPUTER_WINS, 0, 1)
+        output = io.BytesIO()
+        export_records([first, first._replace(result=None)], output)
+        assert [json.loads(line)["result"] for line in output.getvalue().splitlines()] == [
+            GameResult.COMPUTER_WINS.value, None]
+
+
+class TestCsv:
+    """Tests de la exportación CSV."""
+
+    def test_coincide_con_csv_reader(self, tmp_path):
+        """Test: El CSV lleva cabecera y se lee con el módulo csv."""
+        path = tmp_path / "rondas.csv"
+        rounds = sample_rounds(50)
+        export_records(rounds, str(path))
+        with open(path, newline="", encoding="utf-8") as handle:
+            rows = list(csv.reader(handle))
+        assert rows[0] == list(RoundRecord._fields)
+        assert rows[1] == [str(rounds[0].round), rounds[0].user_choice.value, rounds[0].computer_choice.value,
+                           rounds[0].result.value, str(rounds[0].user_score), str(rounds[0].computer_score)]
+        assert len(rows) == len(rounds) + 1
+
+    def test_comillas_si_hace_falta(self):
+        """Test: Los textos con comas o comillas van entre comillas."""
+        output = io.BytesIO()
+        export_records([Sample('a,"b"', 1.5, False)], output, format="csv")
+        rows = list(csv.reader(io.StringIO(output.getvalue().decode("utf-8"))))
+        assert rows == [["name", "ratio", "flag"], ['a,"b"', "1.5", "False"]]
+
+
+    def test_tipos_distintos_al_primero(self):
+        """Test: En CSV un flotante tras un entero conserva sus decimales."""
+        output = io.BytesIO()
+        export_records([MatchResult(1, 0, 1), MatchResult(1.5, None, 2)], output, format="csv")
+        rows = list(csv.reader(io.StringIO(output.getvalue().decode("utf-8"))))
+        assert rows[2] == ["1.5", "None", "2"]
+
+
+class TestGzip:
+    """Tests de la compresión."""
+
+    def test_ruta_gz_se_comprime(self, tmp_path):
+        """Test: Una ruta .gz se comprime y se vuelve a leer igual."""
+        path = str(tmp_path / "partidas.ndjson.gz")
+        matches = [MatchResult(3, 1, 6), MatchResult(2, 3, 7)]
+        export_records(matches, path)
+        with gzip.open(path, "rb") as handle:
+            assert handle.read().count(b"\n") == 2
+        assert list(read_records(path)) == [match._asdict() for match in matches]
+
+    def test_formato_por_extension(self, tmp_path):
+        """Test: Una ruta .csv.gz produce CSV comprimido."""
+        path = str(tmp_path / "partidas.csv.gz")
+        export_records([MatchResult(3, 0, 3)], path)
+        assert list(read_records(path)) == [{"user_score": "3", "computer_score": "0", "rounds": "3"}]
+
+    def test_flujo_no_se_cierra(self):
+        """Test: Un flujo ajeno recibe el gzip completo y sigue abierto."""
+        output = io.BytesIO()
+        export_records([MatchResult(1, 0, 1)], output, compress=True)
+        assert not output.closed
+        assert gzip.decompress(output.getvalue()) == b'{"user_score":1,"computer_score":0,"rounds":1}\n'
+
+
+class TestErrores:
+    """Tests de las entradas inválidas."""
+
+    def test_tipo_mezclado(self):
+        """Test: Mezclar tipos de registro lanza TypeError."""
+        exporter = RecordExporter(io.BytesIO())
+        exporter.write(MatchResult(1, 0, 1))
+        with pytest.raises(TypeError):
+            exporter.write(RoundRecord(1, GameChoice.ROCK, GameChoice.ROCK, GameResult.TIE, 0, 0))
+
+    def test_no_namedtuple(self):
+        """Test: Sólo se exportan NamedTuple."""
+        with pytest.raises(TypeError):
+            export_records([(1, 2)], io.BytesIO())
+
+    def test_escribir_tras_cerrar(self):
+        """Test: Escribir en un exportador cerrado lanza ValueError."""
+        exporter = RecordExporter(io.BytesIO())
+        exporter.close()
+        exporter.write(MatchResult(1, 0, 1))
+        with pytest.raises(ValueError, match="cerrado"):
+            exporter.flush()
+
+    def test_formato_desconocido(self):
+        """Test: Un formato inexistente lanza ValueError."""
+        with pytest.raises(ValueError):
+            RecordExporter(io.BytesIO(), format="xml")
+
+
+class TestRendimiento:
+    """Tests deterministas del trabajo por registro."""
+
+    def test_una_escritura_por_bloque(self):
+        """Test: Cada bloque de buffer_records registros se escribe con una sola llamada."""
+        rounds = sample_rounds(100)
+        output = io.BytesIO()
+        with patch.object(output, "write", wraps=output.write) as write:
+            with RecordExporter(output, buffer_records=64) as exporter:
+                exporter.write_many(rounds)
+        assert write.call_count == -(-len(rounds) // 64)
+
+    def test_enum_se_codifica_una_vez(self):
+        """Test: Los valores de los Enum se codifican al crear la plantilla, no por registro."""
+        rounds = sample_rounds(100)
+        with patch("src.exporters._json_text", wraps=exporters._json_text) as encode:
+            export_records(rounds, io.BytesIO())
+        assert encode.call_count == 2 * len(GameChoice) + len(GameResult)
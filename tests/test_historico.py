@@ -0,0 +1,136 @@
+"""
+Tests para el archivo de históricos comprimido por bloques
+
+Valida que las rondas se recuperan tal como se escribieron con zlib y lzma, que
+las consultas por sesión y por tiempo sólo descomprimen los bloques que indica
+el índice y que los archivos incompletos o ajenos se rechazan.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from src import history_archive
+from src.game import GameEngine, RoundRecord
+from src.game_enums import GameChoice, GameResult
+from src.history_archive import ArchivedRound, HistoryArchive, HistoryArchiveWriter
+from src.strategies import UniformStrategy
+
+
+def write_sessions(path, codec="zlib", records_per_block=64):
+    """Escribe 30 partidas de tres sesiones, una partida por segundo."""
+    game = GameEngine()
+    written = []
+    with HistoryArchiveWriter(path, codec=codec, records_per_block=records_per_block) as writer:
+        for match in range(30):
+            session = ("ana", "luis", "sara")[match // 10]
+            rounds = list(game.iter_rounds(UniformStrategy()))
+            writer.write_rounds(session, rounds, timestamp=1000.0 + match)
+            written.extend(ArchivedRound(session, 1000.0 + match, *record) for record in rounds)
+    return written
+
+
+class TestRoundTrip:
+    """Tests de escritura y lectura completas."""
+
+    @pytest.mark.parametrize("codec", ["zlib", "lzma"])
+    def test_lee_lo_escrito(self, tmp_path, codec):
+        """Test: Todas las rondas se leen iguales y en orden con cada códec."""
+        path = str(tmp_path / "historico.rpsh")
+        written = write_sessions(path, codec)
+        with HistoryArchive(path) as archive:
+            assert archive.codec == codec
+            assert archive.sessions == ("ana", "luis", "sara")
+            assert len(archive) == len(written)
+            assert list(archive) == written
+
+    def test_bloques_de_tamano_fijo(self, tmp_path):
+        """Test: Cada bloque guarda records_per_block rondas salvo el último."""
+        path = str(tmp_path / "historico.rpsh")
+        written = write_sessions(path, records_per_block=16)
+        with HistoryArchive(path) as archive:
+            sizes = [block.records for block in archive.blocks]
+        assert all(size == 16 for size in sizes[:-1])
+        assert sum(sizes) == len(written)
+
+    def test_ronda_suelta(self, tmp_path):
+        """Test: write guarda rondas sueltas con su instante."""
+        path = str(tmp_path / "historico.rpsh")
+        entry = ArchivedRound("ana", 5.5, 1, GameChoice.SPOCK, GameChoice.ROCK, GameResult.USER_WINS, 1, 0)
+        with HistoryArchiveWriter(path) as writer:
+            writer.write(entry)
+        with HistoryArchive(path) as archive:
+            assert list(archive) == [entry]
+
+
+class TestConsultas:
+    """Tests de las consultas con índice."""
+
+    def test_sesion_solo_sus_bloques(self, tmp_path):
+        """Test: Consultar una sesión sólo descomprime los bloques que la contienen."""
+        path = str(tmp_path / "historico.rpsh")
+        written = write_sessions(path, records_per_block=16)
+        with HistoryArchive(path) as archive:
+            relevant = archive.blocks_for("luis")
+            assert 0 < len(relevant) < len(archive.blocks)
+            with patch.object(archive, "_read_block", wraps=archive._read_block) as read_block:
+                rounds = list(archive.read(session="luis"))
+            assert read_block.call_count == len(relevant)
+        assert rounds == [entry for entry in written if entry.session == "luis"]
+
+    def test_rango_de_tiempo(self, tmp_path):
+        """Test: El rango [start, end) filtra por instante y por bloque."""
+        path = str(tmp_path / "historico.rpsh")
+        written = write_sessions(path, records_per_block=16)
+        with HistoryArchive(path) as archive:
+            assert len(archive.blocks_for(start=1012, end=1014)) < len(archive.blocks)
+            rounds = list(archive.read(start=1012, end=1014))
+            assert rounds == [entry for entry in written if 1012 <= entry.timestamp < 1014]
+            assert list(archive.read(session="ana", start=1012)) == []
+
+    def test_sesion_desconocida(self, tmp_path):
+        """Test: Una sesión que no está en el archivo no lee ningún bloque."""
+        path = str(tmp_path / "historico.rpsh")
+        write_sessions(path)
+        with HistoryArchive(path) as archive:
+            assert archive.blocks_for("nadie") == []
+            assert list(archive.read(session="nadie")) == []
+
+
+class TestErrores:
+    """Tests de los archivos inválidos."""
+
+    def test_archivo_sin_cerrar(self, tmp_path):
+        """Test: Un archivo sin índice da un error claro."""
+        path = tmp_path / "historico.rpsh"
+        writer = HistoryArchiveWriter(str(path), records_per_block=1)
+        writer.write_rounds("ana", [RoundRecord(1, GameChoice.ROCK, GameChoice.PAPER, GameResult.COMPUTER_WINS, 0, 1)])
+        writer._handle.flush()
+        with pytest.raises(ValueError, match="incompleto"):
+            HistoryArchive(str(path))
+        writer.close()
+
+    def test_archivo_ajeno(self, tmp_path):
+        """Test: Un archivo que no es un histórico se rechaza."""
+        path = tmp_path / "otro.bin"
+        path.write_bytes(b"no es un historico")
+        with pytest.raises(ValueError):
+            HistoryArchive(str(path))
+
+    def test_codec_desconocido(self, tmp_path):
+        """Test: Un códec inexistente lanza ValueError."""
+        with pytest.raises(ValueError):
+            HistoryArchiveWriter(str(tmp_path / "historico.rpsh"), codec="bz2")
+
+
+class TestCli:
+    """Tests de la consulta desde la línea de comandos."""
+
+    def test_exporta_una_sesion(self, tmp_path, capsysbinary):
+        """Test: La CLI exporta en NDJSON sólo las rondas de la sesión pedida."""
+        path = str(tmp_path / "historico.rpsh")
+        written = write_sessions(path)
+        assert history_archive.main([path, "--session", "sara"]) == 0
+        lines = capsysbinary.readouterr().out.decode("utf-8").splitlines()
+        assert len(lines) == sum(entry.session == "sara" for entry in written)
+        assert json.loads(lines[0])["session"] == "sara"
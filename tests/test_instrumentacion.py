@@ -0,0 +1,154 @@
+"""
+Tests para la instrumentación por fases de play_round
+
+Valida que los tiempos se imputan a cada fase, que los contadores de llamadas
+son correctos y que el juego recupera sus métodos originales al desinstalarla.
+"""
+
+import random
+from unittest.mock import patch
+
+from src.game_enums import GameChoice
+from src.game import RockPaperScissorsGame
+from src.strategies import UniformStrategy
+from src.instrumentation import COUNTERS, PHASES, RoundInstrumentation
+
+
+class FakeClock:
+    """Reloj determinista que avanza 10 ns en cada lectura."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        self.now += 10
+        return self.now
+
+
+class TestRoundInstrumentation:
+    """Tests de la instrumentación de rondas."""
+
+    def setup_method(self):
+        """Configuración que se ejecuta antes de cada test."""
+        self.game = RockPaperScissorsGame()
+        self.instrumentation = RoundInstrumentation(clock=FakeClock())
+
+    def teardown_method(self):
+        """Retira la instrumentación del juego de cada test."""
+        self.instrumentation.detach(self.game)
+
+    def _play(self, user_choice, computer_choice):
+        number = list(GameChoice).index(user_choice) + 1
+        with patch('builtins.input', return_value=str(number)):
+            with patch('random.choice', return_value=computer_choice):
+                with patch('builtins.print'):
+                    return self.game.play_round()
+
+    def test_sin_instrumentacion_no_hay_envoltorios(self):
+        """Test: Sin instalar, el juego no tiene atributos de instancia extra."""
+        assert 'play_round' not in vars(self.game)
+        assert 'compare_choices' not in vars(self.game)
+
+    def test_fases_y_contadores_de_una_ronda(self):
+        """Test: Una ronda registra todas sus fases y cuenta las llamadas."""
+        self.instrumentation.attach(self.game)
+        self._play(GameChoice.ROCK, GameChoice.SCISSORS)
+
+        summary = self.instrumentation.summary()
+        assert summary["rounds"] == 1
+        assert summary["round_ns"] > 0
+        for phase in PHASES:
+            assert summary["phases"][phase]["total_ns"] > 0, phase
+        assert summary["counts"] == {"beats": 1, "compare_choices": 1, "rng": 1}
+
+    def test_empate_no_consulta_beats(self):
+        """Test: En un empate compare_choices no llama a beats."""
+        self.instrumentation.attach(self.game)
+        self._play(GameChoice.LIZARD, GameChoice.LIZARD)
+
+        assert self.instrumentation.counts["compare_choices"] == 1
+        assert self.instrumentation.counts["beats"] == 0
+        assert self.game.user_score == 0
+
+    def test_cuenta_extracciones_reales(self):
+        """Test: rng cuenta cada extracción del generador, no cada decisión."""
+        class TwoDraws(UniformStrategy):
+            def choose(self):
+                self.rng.random()
+                return super().choose()
+
+        game = RockPaperScissorsGame(strategy=TwoDraws(rng=random.Random(1)))
+        self.instrumentation.attach(game)
+        with patch('builtins.input', return_value='1'):
+            with patch('builtins.print'):
+                game.play_round()
+        self.instrumentation.detach(game)
+        assert self.instrumentation.counts["rng"] == 2
+
+    def test_beats_fuera_de_la_ronda_no_cuenta(self):
+        """Test: Sólo cuentan las consultas a beats de la ronda instrumentada."""
+        self.instrumentation.attach(self.game)
+        GameChoice.ROCK.beats(GameChoice.SCISSORS)
+        assert self.instrumentation.counts["beats"] == 0
+
+    def test_no_sustituye_beats(self):
+        """Test: Instrumentar un juego no cambia GameChoice.beats para los demás."""
+        original_beats = GameChoice.beats
+        self.instrumentation.attach(self.game)
+        assert GameChoice.beats is original_beats
+
+    def test_detach_restaura_generador(self):
+        """Test: Al desinstalar vuelve el generador original."""
+        rng = random.Random(3)
+        game = RockPaperScissorsGame(strategy=UniformStrategy(rng=rng))
+        self.instrumentation.attach(game)
+        self.instrumentation.detach(game)
+        assert game.strategy.rng is rng
+
+    def test_menu_cuenta_como_renderizado(self):
+        """Test: El menú que pinta get_user_choice no se imputa a la espera de la entrada."""
+        clock = FakeClock()
+        instrumentation = RoundInstrumentation(clock=clock)
+        original = self.game._display_choices
+
+        def slow_menu():
+            clock.now += 1000
+            original()
+
+        self.game._display_choices = slow_menu
+        instrumentation.attach(self.game)
+        self._play(GameChoice.ROCK, GameChoice.SCISSORS)
+        instrumentation.detach(self.game)
+        assert instrumentation.phase_ns["input"] < 1000
+        assert instrumentation.phase_ns["render"] > 1000
+
+    def test_detach_restaura_metodos(self):
+        """Test: Al desinstalar, el juego vuelve a sus métodos de clase."""
+        self.instrumentation.attach(self.game)
+        self.instrumentation.detach(self.game)
+
+        assert 'play_round' not in vars(self.game)
+        self._play(GameChoice.ROCK, GameChoice.SCISSORS)
+        assert self.instrumentation.rounds == 0
+        assert self.game.user_score == 1
+
+    def test_attach_es_idempotente(self):
+        """Test: Instalar dos veces no duplica las mediciones."""
+        self.instrumentation.attach(self.game)
+        self.instrumentation.attach(self.game)
+        self._play(GameChoice.PAPER, GameChoice.ROCK)
+        assert self.instrumentation.counts["compare_choices"] == 1
+
+    def test_reset_y_reporte(self):
+        """Test: El reporte menciona cada fase y reset pone todo a cero."""
+        self.instrumentation.attach(self.game)
+        self._play(GameChoice.SPOCK, GameChoice.ROCK)
+
+        report = self.instrumentation.format_report()
+        for name in PHASES + COUNTERS:
+            assert name in report
+
+        self.instrumentation.reset()
+        self._play(GameChoice.SPOCK, GameChoice.ROCK)
+        assert self.instrumentation.rounds == 1
+        assert self.instrumentation.counts["rng"] == 1
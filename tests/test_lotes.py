@@ -0,0 +1,209 @@
+"""
+Tests para las simulaciones por lotes
+
+Valida los agregados de `run_chunk`, que el resultado no depende del backend
+ni del número de trabajadores, la elección automática entre hilos y procesos y
+el modo --simulate del CLI.
+"""
+
+import json
+import sys
+from multiprocessing import shared_memory
+from unittest.mock import patch
+
+import pytest
+from src import batch
+from src.batch import (
+    SimulationExecutor,
+    SimulationJob,
+    SimulationSummary,
+    free_threading_enabled,
+    resolve_backend,
+    run_chunk,
+)
+from src.main import main
+from src.simulation import play_match
+from src.game import GameEngine
+from src.strategies import MixedStrategy
+
+PAPER_INDEX = 1
+ROCK_INDEX = 0
+
+
+class TestRunChunk:
+    """Tests de los bloques de partidas."""
+
+    def test_agregados_coherentes(self):
+        """Test: Las rondas por pareja suman las rondas y las victorias, las partidas."""
+        job = SimulationJob(250, chunk_size=100, seed=4)
+        summary = run_chunk(job, 2)
+        assert summary.matches == 50
+        assert sum(summary.pair_counts) == summary.rounds
+        assert summary.user_wins + summary.computer_wins + summary.unfinished == 50
+        assert summary.unfinished == 0
+
+    def test_estrategias_puras(self):
+        """Test: Papel contra piedra gana siempre en max_score rondas."""
+        profiles = {"solo-papel": [0, 1, 0, 0, 0], "solo-piedra": [1, 0, 0, 0, 0]}
+        job = SimulationJob(20, user_strategy="solo-papel", computer_strategy="solo-piedra", max_score=2,
+                            profiles=profiles)
+        summary = run_chunk(job, 0)
+        assert summary.user_wins == 20
+        assert summary.rounds == 40
+        assert summary.pair_counts[PAPER_INDEX * 5 + ROCK_INDEX] == 40
+
+    def test_bloque_reproducible(self):
+        """Test: Un bloque da el mismo resultado cada vez."""
+        job = SimulationJob(500, chunk_size=100, seed=9, computer_strategy="clasica")
+        assert run_chunk(job, 3) == run_chunk(job, 3)
+        assert run_chunk(job, 3) != run_chunk(job, 4)
+
+    def test_play_match_cuenta_parejas(self):
+        """Test: play_match suma cada ronda en la pareja de elecciones."""
+        counts = [0] * 25
+        game = GameEngine(1, MixedStrategy([1, 0, 0, 0, 0]))
+        play_match(game, MixedStrategy([0, 1, 0, 0, 0]), pair_counts=counts)
+        assert counts[PAPER_INDEX * 5 + ROCK_INDEX] == 1
+        assert sum(counts) == 1
+
+
+class TestSimulationExecutor:
+    """Tests del reparto entre hilos y procesos."""
+
+    JOB = SimulationJob(2000, chunk_size=250, seed=7, computer_strategy="clasica")
+
+    def test_mismo_resultado_en_todos_los_backends(self):
+        """Test: Hilos, procesos y un solo trabajador dan el mismo agregado."""
+        serial = SimulationExecutor(jobs=1).run(self.JOB)
+        threads = SimulationExecutor(jobs=4, backend="threads").run(self.JOB)
+        processes = SimulationExecutor(jobs=2, backend="processes").run(self.JOB)
+        assert serial == threads == processes
+        assert serial.matches == 2000
+
+    def test_procesos_no_devuelven_objetos(self):
+        """Test: El trabajador de procesos escribe los agregados en su ranura y no devuelve nada."""
+        memory = shared_memory.SharedMemory(create=True, size=2 * batch._SLOT_FIELDS * 8)
+        try:
+            batch._init_slot_worker(memory.name, self.JOB)
+            assert batch._run_chunk_into_slot(3, 1) is None
+            slots = batch._slot_view(memory)
+            assert batch._read_slot(slots, 1) == run_chunk(self.JOB, 3)
+            slots.release()
+        finally:
+            batch._worker_slots.release()
+            batch._worker_memory.close()
+            batch._worker_job = batch._worker_memory = batch._worker_slots = None
+            memory.close()
+            memory.unlink()
+
+    def test_ventana_acotada(self):
+        """Test: run_shared no envía más bloques que la ventana de tareas en vuelo."""
+        pytest.importorskip("numpy")
+        job = SimulationJob(400, chunk_size=10, seed=1)
+        executor = SimulationExecutor(jobs=2, backend="threads")
+        in_flight = []
+        original = executor._bounded
+
+        def bounded(submit, chunks):
+            pending = set()
+
+            def tracked(index):
+                pending.add(index)
+                in_flight.append(len(pending))
+                return submit(index)
+
+            for index, future in original(tracked, chunks):
+                pending.discard(index)
+                yield index, future
+
+        with patch.object(executor, "_bounded", bounded):
+            with executor.run_shared(job) as results:
+                assert results.summary() == SimulationExecutor(jobs=1).run(job)
+        assert max(in_flight) <= 2 * batch._WINDOW_PER_WORKER
+
+    def test_agregado_vacio(self):
+        """Test: El agregado vacío es neutro para merge."""
+        summary = run_chunk(self.JOB, 0)
+        assert SimulationSummary.empty().merge(summary) == summary
+
+    def test_estrategia_desconocida(self):
+        """Test: Una estrategia inexistente falla antes de repartir bloques."""
+        with pytest.raises(ValueError):
+            SimulationExecutor(jobs=2).run(SimulationJob(10, user_strategy="nadie"))
+        with pytest.raises(ValueError):
+            SimulationExecutor(jobs=2).run(SimulationJob(0))
+
+    def test_backend_invalido(self):
+        """Test: Un backend o número de trabajadores inválido lanza ValueError."""
+        with pytest.raises(ValueError):
+            SimulationExecutor(backend="gpu")
+        with pytest.raises(ValueError):
+            SimulationExecutor(jobs=0)
+
+
+class TestFreeThreading:
+    """Tests de la elección automática del backend."""
+
+    def test_sin_gil_usa_hilos(self):
+        """Test: Con el GIL desactivado, auto elige hilos."""
+        with patch.object(sys, "_is_gil_enabled", lambda: False, create=True):
+            assert free_threading_enabled()
+            assert resolve_backend("auto") == "threads"
+
+    def test_con_gil_usa_procesos(self):
+        """Test: Con el GIL activo, auto elige procesos."""
+        with patch.object(sys, "_is_gil_enabled", lambda: True, create=True):
+            assert not free_threading_enabled()
+            assert resolve_backend("auto") == "processes"
+
+    def test_interprete_sin_deteccion(self):
+        """Test: En versiones sin sys._is_gil_enabled se asume que hay GIL."""
+        with patch.object(sys, "_is_gil_enabled", None, create=True):
+            assert not free_threading_enabled()
+        assert resolve_backend("threads") == "threads"
+
+
+class TestSimulateCli:
+    """Tests del modo --simulate del CLI."""
+
+    def run_cli(self, *arguments):
+        with patch.object(sys, "argv", ["main", *arguments]):
+            with patch("builtins.print"):
+                return main()
+
+    def test_json_coincide_con_el_ejecutor(self, tmp_path):
+        """Test: El informe JSON recoge los agregados de SimulationExecutor."""
+        output = tmp_path / "stats.json"
+        code = self.run_cli("--simulate", "1500", "--score", "2", "--strategy", "clasica",
+                            "--jobs", "1", "--seed", "5", "--output", str(output))
+        assert code == 0
+        report = json.loads(output.read_text(encoding="utf-8"))
+        job = SimulationJob(1500, computer_strategy="clasica", max_score=2, seed=5)
+        summary = SimulationExecutor(jobs=1).run(job)
+        assert report["matches"] == 1500
+        assert report["user_wins"] == summary.user_wins
+        assert report["computer_wins"] == summary.computer_wins
+        assert report["rounds"] == summary.rounds
+        assert sum(report["pairs"].values()) == summary.rounds
+        assert report["pairs"]["Piedra/Papel"] == summary.pair_counts[1]
+
+    def test_ndjson_anade_lineas(self, tmp_path):
+        """Test: Con ndjson cada simulación añade una línea al archivo."""
+        output = tmp_path / "stats.ndjson"
+        for seed in ("1", "2"):
+            assert self.run_cli("--simulate", "200", "--jobs", "1", "--seed", seed,
+                                "--format", "ndjson", "--output", str(output)) == 0
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["seed"] for line in lines] == [1, 2]
+
+    def test_salida_estandar(self, capsys):
+        """Test: Sin --output el informe va a la salida estándar."""
+        with patch.object(sys, "argv", ["main", "--simulate", "100", "--jobs", "1", "--seed", "0"]):
+            assert main() == 0
+        assert json.loads(capsys.readouterr().out)["matches"] == 100
+
+    def test_argumentos_invalidos(self):
+        """Test: Partidas, trabajadores o estrategia inválidos terminan con error."""
+        assert self.run_cli("--simulate", "0") == 1
+        assert self.run_cli("--simulate", "10", "--jobs", "0") == 1
+        assert self.run_cli("--simulate", "10", "--user-strategy", "desconocida") == 1
@@ -0,0 +1,92 @@
+"""
+Tests para el exportador de métricas Prometheus/OpenMetrics
+
+Valida la acumulación por hilo, el formato de exposición, el endpoint HTTP
+local y la escritura para el textfile collector.
+"""
+
+import threading
+import urllib.request
+from unittest.mock import patch
+
+from src.game_enums import GameChoice, GameResult
+from src.game import RockPaperScissorsGame
+from src.metrics import GameMetrics, serve_metrics, write_textfile
+
+
+class TestGameMetrics:
+    """Tests del registro de métricas."""
+
+    def setup_method(self):
+        """Configuración que se ejecuta antes de cada test."""
+        self.metrics = GameMetrics()
+
+    def test_acumulacion_entre_hilos(self):
+        """Test: Los fragmentos de cada hilo se suman en la exportación."""
+        def worker():
+            for _ in range(1000):
+                self.metrics.observe_round(GameResult.TIE)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = self.metrics.snapshot()
+        assert snapshot["rounds"] == 4000
+        assert snapshot["results"][GameResult.TIE] == 4000
+
+    def test_histograma_de_latencia(self):
+        """Test: Los buckets del histograma son acumulativos."""
+        self.metrics.observe_latency(0.0005)
+        self.metrics.observe_latency(0.02)
+        self.metrics.observe_latency(120.0)
+
+        text = self.metrics.render()
+        assert 'rpsls_round_latency_seconds_bucket{le="0.001"} 1' in text
+        assert 'rpsls_round_latency_seconds_bucket{le="0.05"} 2' in text
+        assert 'rpsls_round_latency_seconds_bucket{le="+Inf"} 3' in text
+        assert "rpsls_round_latency_seconds_count 3" in text
+        assert text.endswith("# EOF\n")
+
+    def test_partida_instrumentada(self):
+        """Test: Una partida completa actualiza rondas, resultados y partidas."""
+        game = RockPaperScissorsGame(max_score=1)
+        self.metrics.attach(game)
+
+        with patch('builtins.input', return_value='1'):
+            with patch('random.choice', return_value=GameChoice.SCISSORS):
+                with patch('builtins.print'):
+                    game.run()
+
+        snapshot = self.metrics.snapshot()
+        assert snapshot["rounds"] == 1
+        assert snapshot["matches"] == 1
+        assert snapshot["results"][GameResult.USER_WINS] == 1
+        assert snapshot["sessions"] == 0
+        assert sum(snapshot["buckets"]) == 1
+
+        self.metrics.detach(game)
+        assert 'run' not in vars(game)
+
+    def test_endpoint_http(self):
+        """Test: El endpoint local sirve /metrics."""
+        self.metrics.session_started()
+        server = serve_metrics(self.metrics, port=0)
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+                body = response.read().decode("utf-8")
+            assert "rpsls_active_sessions 1" in body
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_textfile(self, tmp_path):
+        """Test: La escritura a archivo deja el texto completo."""
+        self.metrics.match_finished()
+        path = tmp_path / "rpsls.prom"
+        write_textfile(self.metrics, str(path))
+        assert "rpsls_matches_finished_total 1" in path.read_text(encoding="utf-8")
+        assert list(tmp_path.iterdir()) == [path]
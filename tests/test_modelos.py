@@ -0,0 +1,127 @@
+"""
+Tests para el almacén persistente de modelos de jugador
+
+Valida la serialización del predictor, las escrituras por lotes en SQLite, la
+carga perezosa y el arranque en caliente de una sesión nueva del mismo jugador.
+"""
+
+import sqlite3
+import sys
+from unittest.mock import patch
+
+import pytest
+from src.game_enums import GameChoice
+from src.main import main
+from src.model_store import ModelStore, PersistentStrategy
+from src.prediction import CountMinSketch, SketchPredictorStrategy
+from src.strategies import MixedStrategy
+
+
+def stored_players(path):
+    """Jugadores ya escritos en el archivo, vistos desde otra conexión."""
+    with sqlite3.connect(path) as connection:
+        return {row[0] for row in connection.execute("SELECT player_id FROM models")}
+
+
+class TestSerializacion:
+    """Tests de la serialización de modelos."""
+
+    def test_sketch_ida_y_vuelta(self):
+        """Test: Un sketch serializado conserva dimensiones y cuentas."""
+        sketch = CountMinSketch(width=64, depth=3, seed=9)
+        for key in (1, 1, 2, 1000):
+            sketch.add(key)
+        copy = CountMinSketch.from_bytes(sketch.to_bytes())
+        assert (copy.width, copy.depth, copy.seed) == (64, 3, 9)
+        assert [copy.estimate(key) for key in (1, 2, 1000, 5)] == [2, 1, 1, 0]
+
+    def test_datos_invalidos(self):
+        """Test: Datos truncados o de otro orden lanzan ValueError."""
+        with pytest.raises(ValueError):
+            CountMinSketch.from_bytes(b"CMS1")
+        with pytest.raises(ValueError):
+            CountMinSketch.from_bytes(CountMinSketch().to_bytes()[:-2])
+        with pytest.raises(ValueError):
+            SketchPredictorStrategy(order=3).loads(SketchPredictorStrategy(order=2).dumps())
+
+
+class TestModelStore:
+    """Tests del almacén SQLite."""
+
+    def test_escrituras_por_lotes(self, tmp_path):
+        """Test: Los modelos se escriben al completar el lote y se leen antes desde memoria."""
+        path = str(tmp_path / "modelos.sqlite3")
+        store = ModelStore(path, batch_size=3)
+        store.save("ana", "prediccion", b"uno")
+        store.save("beto", "prediccion", b"dos")
+        assert stored_players(path) == set()
+        assert store.load("ana", "prediccion") == b"uno"
+
+        store.save("caro", "prediccion", b"tres")
+        assert stored_players(path) == {"ana", "beto", "caro"}
+        store.close()
+
+    def test_persiste_entre_aperturas(self, tmp_path):
+        """Test: Cerrar escribe lo pendiente y otra apertura lo recupera."""
+        path = str(tmp_path / "modelos.sqlite3")
+        with ModelStore(path) as store:
+            store.save("ana", "prediccion", b"modelo" * 100)
+            store.save("ana", "prediccion", b"reemplazo")
+        with ModelStore(path) as store:
+            assert store.load("ana", "prediccion") == b"reemplazo"
+            assert store.load("ana", "otra") is None
+            assert store.load("nadie", "prediccion") is None
+
+    def test_lote_invalido(self):
+        """Test: Un tamaño de lote no positivo lanza ValueError."""
+        with pytest.raises(ValueError):
+            ModelStore(":memory:", batch_size=0)
+
+
+class TestPersistentStrategy:
+    """Tests de la estrategia con modelo persistente."""
+
+    def test_carga_perezosa(self):
+        """Test: El modelo no se lee al crear la estrategia sino en la primera decisión."""
+        store = ModelStore(":memory:")
+        with patch.object(store, "load", return_value=None) as mock_load:
+            strategy = PersistentStrategy(SketchPredictorStrategy(), store, "ana")
+            mock_load.assert_not_called()
+            strategy.choose()
+            strategy.choose()
+        mock_load.assert_called_once_with("ana", "prediccion")
+
+    def test_arranque_en_caliente(self, tmp_path):
+        """Test: Una sesión nueva del mismo jugador predice desde la primera ronda."""
+        path = str(tmp_path / "modelos.sqlite3")
+        with ModelStore(path) as store:
+            first = PersistentStrategy(SketchPredictorStrategy(order=1), store, "ana")
+            for _ in range(10):
+                first.choose()
+                first.observe(GameChoice.ROCK, GameChoice.PAPER)
+            first.reset()
+
+        with ModelStore(path) as store:
+            second = PersistentStrategy(SketchPredictorStrategy(order=1), store, "ana")
+            second.choose()
+            assert second.strategy.predict() == GameChoice.ROCK
+
+            stranger = PersistentStrategy(SketchPredictorStrategy(order=1), store, "beto")
+            stranger.choose()
+            assert stranger.strategy.predict() is None
+
+    def test_estrategia_no_persistible(self):
+        """Test: Envolver una estrategia sin modelo lanza TypeError."""
+        with pytest.raises(TypeError):
+            PersistentStrategy(MixedStrategy([1] * 5), ModelStore(":memory:"), "ana")
+
+    def test_cli_guarda_el_modelo(self, tmp_path):
+        """Test: --strategy prediccion --player guarda el modelo al terminar la partida."""
+        path = str(tmp_path / "modelos.sqlite3")
+        argv = ["main", "--score", "1", "--strategy", "prediccion", "--player", "ana",
+                "--model-store", path]
+        with patch.object(sys, "argv", argv):
+            with patch("builtins.input", return_value="1"):
+                with patch("builtins.print"):
+                    assert main() == 0
+        assert stored_players(path) == {"ana"}
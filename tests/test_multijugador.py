@@ -0,0 +1,123 @@
+"""
+Tests para el modo multijugador
+
+Valida que la resolución por histograma y máscaras de bits coincide con la
+comparación por pares y que la partida multijugador lleva bien el marcador.
+"""
+
+import random
+
+import pytest
+from src.game_enums import GameChoice, GameResult
+from src.game import RockPaperScissorsGame
+from src.multiplayer import (
+    CHOICES,
+    VICTIM_MASKS,
+    MultiplayerGame,
+    choice_histogram,
+    random_choices,
+    resolve_round,
+)
+
+
+class TestResolucionMultijugador:
+    """Tests de la resolución de rondas con N jugadores."""
+
+    def test_mascaras_derivadas_de_beats(self):
+        """Test: Cada opción tiene exactamente dos víctimas."""
+        for index, choice in enumerate(CHOICES):
+            victims = {CHOICES[j] for j in range(5) if VICTIM_MASKS[index] >> j & 1}
+            assert victims == {other for other in CHOICES if choice.beats(other)}
+
+    def test_todos_iguales_es_empate(self):
+        """Test: Si todos lanzan lo mismo, nadie gana."""
+        result = resolve_round([GameChoice.SPOCK] * 10)
+        assert result.is_tie
+        assert result.histogram == (0, 0, 0, 0, 10)
+
+    def test_ciclo_es_empate(self):
+        """Test: Piedra, Papel y Tijeras a la vez forman un ciclo sin ganador."""
+        result = resolve_round([GameChoice.ROCK, GameChoice.PAPER, GameChoice.SCISSORS])
+        assert result.is_tie
+
+    def test_opcion_dominante_gana(self):
+        """Test: Piedra gana si sólo hay Tijeras y Lagarto enfrente."""
+        result = resolve_round(
+            [GameChoice.ROCK, GameChoice.SCISSORS, GameChoice.LIZARD, GameChoice.ROCK]
+        )
+        assert result.winners == frozenset({GameChoice.ROCK})
+
+    def test_gana_el_mayor_balance_neto(self):
+        """Test: Con las 5 opciones presentes gana la de mayor balance por pares."""
+        # Piedra y Spock vencen a 3 jugadores y pierden ante 2: balance +1
+        result = resolve_round(
+            [GameChoice.ROCK, GameChoice.PAPER, GameChoice.SCISSORS, GameChoice.SCISSORS,
+             GameChoice.LIZARD, GameChoice.SPOCK]
+        )
+        assert result.net == (1, -1, 0, -1, 1)
+        assert result.winners == frozenset({GameChoice.ROCK, GameChoice.SPOCK})
+
+    def test_totales_equivalen_a_comparacion_por_pares(self):
+        """Test: Victorias y derrotas por opción coinciden con compare_choices."""
+        game = RockPaperScissorsGame()
+        rng = random.Random(7)
+        choices = random_choices(60, rng)
+        result = resolve_round(choices)
+
+        for index, choice in enumerate(CHOICES):
+            if not result.histogram[index]:
+                continue
+            pairwise = [game.compare_choices(choice, other) for other in choices]
+            assert result.wins[index] == pairwise.count(GameResult.USER_WINS)
+            assert result.losses[index] == pairwise.count(GameResult.COMPUTER_WINS)
+
+    def test_cien_mil_jugadores(self):
+        """Test: Una ronda de 100k jugadores se resuelve sin comparar pares."""
+        choices = random_choices(100_000, random.Random(1))
+        result = resolve_round(choices)
+        assert sum(result.histogram) == 100_000
+        assert result.histogram == choice_histogram(choices)
+
+
+class TestMultiplayerGame:
+    """Tests de la partida multijugador."""
+
+    def test_minimo_dos_jugadores(self):
+        """Test: Menos de dos jugadores es inválido."""
+        with pytest.raises(ValueError):
+            MultiplayerGame(1)
+
+    def test_opciones_por_jugador(self):
+        """Test: Debe recibirse una opción por jugador."""
+        game = MultiplayerGame(3)
+        with pytest.raises(ValueError):
+            game.play_round([GameChoice.ROCK, GameChoice.PAPER])
+
+    def test_marcador_y_fin_de_partida(self):
+        """Test: Los ganadores suman un punto y la partida termina al llegar a max_score."""
+        game = MultiplayerGame(3, max_score=2)
+        round_choices = [GameChoice.PAPER, GameChoice.ROCK, GameChoice.PAPER]
+
+        game.play_round(round_choices)
+        assert game.scores == [1, 0, 1]
+        assert not game.is_over()
+
+        game.play_round(round_choices)
+        assert game.is_over()
+        assert game.leaders() == [0, 2]
+        assert game.rounds_played == 2
+
+        game.reset_game()
+        assert game.scores == [0, 0, 0]
+        assert game.rounds_played == 0
+
+    @pytest.mark.parametrize("num_players", [20, 100, 100_000])
+    def test_partida_grande_termina(self, num_players):
+        """Test: Con muchos jugadores al azar casi ninguna ronda es empate y la partida termina."""
+        rng = random.Random(3)
+        game = MultiplayerGame(num_players, max_score=3)
+        ties = 0
+        while not game.is_over():
+            assert game.rounds_played < 50
+            ties += game.play_round(random_choices(num_players, rng)).is_tie
+        assert ties < game.rounds_played / 2
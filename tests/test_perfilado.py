@@ -0,0 +1,138 @@
+"""
+Tests para los modos de perfilado --profile y --profile-memory
+
+Valida la salida pstats de cProfile, las pilas colapsadas del muestreador y el
+informe de memoria por ronda.
+"""
+
+import pstats
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+from src.game_enums import GameChoice
+from src.game import RockPaperScissorsGame
+from src.main import main
+from src.profiling import MemoryProfiler, StackSampler, profile_call
+
+
+def busy_loop(seconds=0.05):
+    """Consume CPU durante el tiempo indicado."""
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += 1
+    return total
+
+
+class TestProfileCall:
+    """Tests del perfilado de una llamada."""
+
+    def test_cprofile_genera_pstats(self, tmp_path):
+        """Test: El modo cprofile guarda estadísticas legibles por pstats."""
+        output = tmp_path / "perfil.pstats"
+        result = profile_call(lambda: busy_loop(0.01), str(output), mode="cprofile")
+
+        assert result > 0
+        stats = pstats.Stats(str(output))
+        functions = {name for _, _, name in stats.stats}
+        assert "busy_loop" in functions
+
+    def test_muestreo_genera_pilas_colapsadas(self, tmp_path):
+        """Test: El modo sample escribe líneas 'pila conteo'."""
+        output = tmp_path / "perfil.folded"
+        profile_call(busy_loop, str(output), mode="sample", interval=0.001)
+
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert lines
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert any("busy_loop" in line for line in lines)
+
+    def test_modo_invalido(self, tmp_path):
+        """Test: Un modo desconocido lanza ValueError."""
+        with pytest.raises(ValueError):
+            profile_call(lambda: None, str(tmp_path / "x"), mode="perf")
+
+    def test_sampler_ignora_hilo_inexistente(self):
+        """Test: Muestrear un hilo que no existe no registra pilas."""
+        sampler = StackSampler(thread_id=-1)
+        sampler.sample()
+        assert not sampler.stacks
+
+
+class TestMemoryProfiler:
+    """Tests del perfilador de memoria."""
+
+    def test_asignaciones_por_ronda(self):
+        """Test: Se registra una medición por cada ronda jugada."""
+        game = RockPaperScissorsGame(max_score=2)
+        profiler = MemoryProfiler()
+        profiler.start()
+        profiler.attach(game)
+        with patch('builtins.input', side_effect=['1', '', '1']):
+            with patch('random.choice', return_value=GameChoice.SCISSORS):
+                with patch('builtins.print'):
+                    game.run()
+        profiler.detach(game)
+        profiler.stop()
+
+        assert len(profiler.rounds) == 2
+        for net, peak in profiler.rounds:
+            assert peak >= net
+        report = profiler.format_report()
+        assert "Media neta por ronda" in report
+        assert 'play_round' not in vars(game)
+
+
+class TestCLIProfiling:
+    """Tests de integración de los flags del CLI."""
+
+    def test_demo_perfilada(self, tmp_path):
+        """Test: --demo --profile guarda el perfil y termina con éxito."""
+        output = tmp_path / "demo.pstats"
+        argv = ["main", "--demo", "--profile", str(output)]
+        with patch.object(sys, 'argv', argv):
+            with patch('builtins.print'):
+                assert main() == 0
+        assert pstats.Stats(str(output)).total_calls > 0
+
+    def test_juego_con_profile_memory(self):
+        """Test: --profile-memory imprime el informe tras la partida."""
+        argv = ["main", "--score", "1", "--profile-memory"]
+        with patch.object(sys, 'argv', argv):
+            with patch('builtins.input', return_value='1'):
+                with patch('random.choice', return_value=GameChoice.SCISSORS):
+                    with patch('builtins.print') as mock_print:
+                        assert main() == 0
+        printed = " ".join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+        assert "Media neta por ronda" in printed
+
+    def printed_by_main(self, argv):
+        with patch.object(sys, 'argv', argv):
+            with patch('builtins.print') as mock_print:
+                code = main()
+        return code, " ".join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+
+    def test_battle_royale_con_profile_memory(self):
+        """Test: --profile-memory también mide cada ronda del battle royale."""
+        pytest.importorskip("numpy")
+        code, printed = self.printed_by_main(["main", "--battle-royale", "64", "--seed", "1", "--profile-memory"])
+        assert code == 0
+        assert "Media neta por ronda" in printed
+
+    def test_profile_memory_rechazado_sin_rondas(self):
+        """Test: --profile-memory con --demo o --simulate termina con error."""
+        for argv in (["main", "--demo", "--profile-memory"], ["main", "--simulate", "10", "--profile-memory"]):
+            code, printed = self.printed_by_main(argv)
+            assert code == 1
+            assert "--profile-memory" in printed
+
+    def test_perfil_fallido_no_se_anuncia(self, tmp_path):
+        """Test: Si el modo perfilado falla, no se anuncia el perfil guardado."""
+        output = tmp_path / "demo.pstats"
+        with patch("src.main.run_demo_mode", side_effect=RuntimeError("fallo")):
+            code, printed = self.printed_by_main(["main", "--demo", "--profile", str(output)])
+        assert code == 1
+        assert "Perfil guardado" not in printed
@@ -0,0 +1,268 @@
+"""
+Tests para las estrategias como plugins
+
+Valida el descubrimiento por entry points sin importar los módulos, la carga
+al elegir la estrategia y el presupuesto de latencia de `GuardedStrategy`.
+"""
+
+import sys
+import threading
+import time
+from importlib.metadata import EntryPoint
+from unittest.mock import patch
+
+import pytest
+from src import plugins
+from src.game import RockPaperScissorsGame
+from src.game_enums import GameChoice
+from src.main import main
+from src.model_store import ModelStore, PersistentStrategy
+from src.plugins import (
+    ENTRY_POINT_GROUP,
+    GuardedStrategy,
+    MeasuredStrategy,
+    PersistableGuardedStrategy,
+    create_plugin_strategy,
+    discover_plugins,
+)
+from src.prediction import SketchPredictorStrategy
+from src.strategies import ComputerStrategy, available_strategies, create_strategy
+
+
+class AlwaysSpock(ComputerStrategy):
+    """Estrategia de terceros rápida."""
+
+    name = "siempre-spock"
+
+    def __init__(self, rng=None):
+        self.observed = []
+
+    def choose(self):
+        return GameChoice.SPOCK
+
+    def observe(self, opponent_choice, own_choice):
+        self.observed.append(opponent_choice)
+
+
+class Stalled(ComputerStrategy):
+    """Estrategia de terceros que se cuelga hasta que se la libera."""
+
+    name = "colgada"
+    latency_budget = 0.02
+
+    def __init__(self, rng=None):
+        self.release = threading.Event()
+
+    def choose(self):
+        self.release.wait(5)
+        return GameChoice.ROCK
+
+
+class Broken(ComputerStrategy):
+    """Estrategia de terceros que falla o devuelve basura."""
+
+    name = "rota"
+
+    def __init__(self, rng=None):
+        self.calls = 0
+
+    def choose(self):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("fallo del plugin")
+        return "no es una opción"
+
+
+class Counting(ComputerStrategy):
+    """Estrategia de terceros con modelo: cuenta las rondas observadas."""
+
+    name = "contadora"
+
+    def __init__(self, rng=None):
+        self.seen = 0
+
+    def choose(self):
+        return GameChoice.ROCK
+
+    def observe(self, opponent_choice, own_choice):
+        self.seen += 1
+
+    def dumps(self):
+        return str(self.seen).encode("ascii")
+
+    def loads(self, data):
+        self.seen = int(data)
+
+
+def fake_entry_points(**entries):
+    """Sustituye los entry points instalados por los indicados."""
+    points = [EntryPoint(name, value, ENTRY_POINT_GROUP) for name, value in entries.items()]
+    return patch.object(plugins, "entry_points", lambda group: points if group == ENTRY_POINT_GROUP else [])
+
+
+class TestDescubrimiento:
+    """Tests del descubrimiento y la carga de plugins."""
+
+    def test_prediccion_incluida_sin_aislar(self):
+        """Test: La estrategia predictiva es un plugin incluido: se mide pero no se aísla."""
+        assert "prediccion" in discover_plugins()
+        strategy = create_strategy("prediccion")
+        assert isinstance(strategy, MeasuredStrategy)
+        assert isinstance(strategy.strategy, SketchPredictorStrategy)
+        assert hasattr(strategy, "dumps") and hasattr(strategy, "loads")
+        strategy.choose()
+        assert strategy.stats.decisions == 1
+        assert strategy.stats.fallbacks == 0
+
+    def test_descubre_sin_importar(self):
+        """Test: Un plugin aparece como opción aunque su módulo no se pueda importar."""
+        with fake_entry_points(fantasma="modulo_inexistente:Estrategia"):
+            assert "fantasma" in available_strategies()
+            with pytest.raises(ModuleNotFoundError):
+                create_strategy("fantasma")
+
+    def test_plugin_de_terceros_aislado(self):
+        """Test: Un plugin de terceros se carga al elegirlo y queda aislado."""
+        with fake_entry_points(siempre_spock="tests.test_plugins:AlwaysSpock"):
+            strategy = create_strategy("siempre_spock")
+        assert isinstance(strategy, GuardedStrategy)
+        assert isinstance(strategy.strategy, AlwaysSpock)
+        assert strategy.choose() == GameChoice.SPOCK
+
+    def test_plugin_con_modelo_se_puede_guardar(self):
+        """Test: Un plugin aislado con dumps/loads guarda y recupera su modelo con --player."""
+        with fake_entry_points(contadora="tests.test_plugins:Counting"):
+            strategy = create_strategy("contadora")
+            assert isinstance(strategy, PersistableGuardedStrategy)
+            with ModelStore(":memory:") as store:
+                persistent = PersistentStrategy(strategy, store, "ana")
+                persistent.choose()
+                for _ in range(3):
+                    persistent.observe(GameChoice.PAPER, GameChoice.ROCK)
+                persistent.save()
+
+                fresh = create_strategy("contadora")
+                PersistentStrategy(fresh, store, "ana").choose()
+                assert fresh.strategy.seen == 3
+
+    def test_plugin_sin_modelo_no_es_persistible(self):
+        """Test: Un plugin sin dumps/loads no finge guardar modelos."""
+        with fake_entry_points(siempre_spock="tests.test_plugins:AlwaysSpock"):
+            strategy = create_strategy("siempre_spock")
+        assert not hasattr(strategy, "dumps")
+        with pytest.raises(TypeError):
+            PersistableGuardedStrategy(AlwaysSpock())
+
+    def test_cli_no_busca_plugins_sin_necesidad(self):
+        """Test: La ayuda y las estrategias conocidas no recorren los entry points."""
+        with patch.object(plugins, "entry_points", side_effect=AssertionError("descubrimiento")):
+            with patch.object(sys, "argv", ["main", "--help"]):
+                with patch("builtins.print"), pytest.raises(SystemExit):
+                    main()
+            with patch.object(sys, "argv", ["main", "--rules", "--strategy", "prediccion"]):
+                with patch("builtins.print"):
+                    assert main() == 0
+
+    def test_cli_acepta_plugin_de_terceros(self):
+        """Test: Un nombre desconocido se busca entre los plugins instalados."""
+        with fake_entry_points(siempre_spock="tests.test_plugins:AlwaysSpock"):
+            with patch.object(sys, "argv", ["main", "--rules", "--strategy", "siempre_spock"]):
+                with patch("builtins.print"):
+                    assert main() == 0
+            with patch.object(sys, "argv", ["main", "--rules", "--strategy", "nadie"]):
+                with patch("builtins.print"):
+                    assert main() == 1
+
+    def test_plugin_inexistente(self):
+        """Test: Un nombre sin plugin lanza ValueError."""
+        with fake_entry_points():
+            with pytest.raises(ValueError):
+                create_plugin_strategy("nadie")
+
+
+class TestGuardedStrategy:
+    """Tests del presupuesto de latencia."""
+
+    def test_decision_a_tiempo(self):
+        """Test: Una estrategia rápida decide y observa en orden en su hilo."""
+        inner = AlwaysSpock()
+        strategy = GuardedStrategy(inner)
+        assert strategy.choose() == GameChoice.SPOCK
+        strategy.observe(GameChoice.ROCK, GameChoice.SPOCK)
+        strategy.observe(GameChoice.PAPER, GameChoice.SPOCK)
+        assert strategy.choose() == GameChoice.SPOCK
+        assert inner.observed == [GameChoice.ROCK, GameChoice.PAPER]
+        assert strategy.stats.fallbacks == 0
+        assert strategy.stats.decisions == 2
+
+    def test_presupuesto_excedido(self):
+        """Test: Una estrategia colgada no frena la ronda más que su presupuesto."""
+        inner = Stalled()
+        strategy = GuardedStrategy(inner)
+        start = time.perf_counter()
+        first = strategy.choose()
+        second = strategy.choose()
+        elapsed = time.perf_counter() - start
+        inner.release.set()
+
+        assert first in GameChoice and second in GameChoice
+        assert elapsed < 1.0
+        assert strategy.stats.timeouts == 2
+        assert strategy.stats.max_latency >= inner.latency_budget
+
+    def test_errores_y_respuestas_invalidas(self):
+        """Test: Excepciones o valores que no son GameChoice se sustituyen al azar."""
+        strategy = GuardedStrategy(Broken())
+        assert strategy.choose() in GameChoice
+        assert strategy.choose() in GameChoice
+        assert strategy.stats.errors == 2
+
+    def test_presupuesto_invalido(self):
+        """Test: Un presupuesto no positivo lanza ValueError."""
+        with pytest.raises(ValueError):
+            GuardedStrategy(AlwaysSpock(), latency_budget=0)
+
+    def test_medida_cuenta_decisiones_lentas(self):
+        """Test: Una estrategia medida respeta su decisión aunque supere el presupuesto."""
+        inner = Stalled()
+        inner.latency_budget = 0.001
+        threading.Timer(0.01, inner.release.set).start()
+        strategy = MeasuredStrategy(inner)
+        assert strategy.choose() == GameChoice.ROCK
+        assert strategy.stats.over_budget == 1
+        assert strategy.stats.fallbacks == 0
+        assert strategy.stats.max_latency >= 0.01
+
+    def test_close_termina_el_hilo(self):
+        """Test: close() termina el hilo de la estrategia y después se elige al azar."""
+        with GuardedStrategy(AlwaysSpock()) as strategy:
+            assert strategy.choose() == GameChoice.SPOCK
+        strategy._worker.join(1.0)
+        assert not strategy._worker.is_alive()
+        assert strategy.choose() in GameChoice
+        strategy.observe(GameChoice.ROCK, GameChoice.SPOCK)
+        assert strategy.stats.errors == 0
+
+    def test_simulacion_no_deja_hilos(self):
+        """Test: Una simulación con un plugin aislado libera el hilo de cada bloque."""
+        from src.batch import SimulationExecutor, SimulationJob
+
+        before = threading.active_count()
+        with fake_entry_points(siempre_spock="tests.test_plugins:AlwaysSpock"):
+            job = SimulationJob(40, chunk_size=10, computer_strategy="siempre_spock", seed=1)
+            SimulationExecutor(jobs=1).run(job)
+        for thread in threading.enumerate():
+            if thread.name.startswith("estrategia-"):
+                thread.join(1.0)
+        assert threading.active_count() == before
+
+    def test_juego_con_plugin_colgado(self):
+        """Test: get_computer_choice responde aunque la estrategia del juego se cuelgue."""
+        inner = Stalled()
+        game = RockPaperScissorsGame(strategy=GuardedStrategy(inner))
+        try:
+            for _ in range(3):
+                game.resolve_round(GameChoice.ROCK, game.get_computer_choice())
+        finally:
+            inner.release.set()
+        assert game.rounds_played == 3
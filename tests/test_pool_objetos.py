@@ -0,0 +1,115 @@
+"""
+Tests para las partidas con __slots__ y el pool de objetos
+
+Valida que `GameEngine` no tiene diccionario de atributos, que colorama se
+inicializa una sola vez y que `GameObjectPool` recicla partidas terminadas en
+lugar de construir instancias nuevas.
+"""
+
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+from src import game as game_module
+from src.game import GameEngine, RockPaperScissorsGame
+from src.game_enums import GameChoice, GameState
+from src.object_pool import GameObjectPool
+from src.simulation import play_match
+from src.strategies import MixedStrategy, UniformStrategy
+
+
+class TestGameEngine:
+    """Tests de la partida sin consola."""
+
+    def test_sin_diccionario(self):
+        """Test: GameEngine usa __slots__ y rechaza atributos desconocidos."""
+        game = GameEngine()
+        assert not hasattr(game, "__dict__")
+        with pytest.raises(AttributeError):
+            game.puntos_extra = 1
+
+    def test_juego_de_consola_admite_atributos(self):
+        """Test: RockPaperScissorsGame hereda el motor y conserva sus atributos propios."""
+        game = RockPaperScissorsGame(max_score=2)
+        assert isinstance(game, GameEngine)
+        game.etiqueta = "sesion"
+        assert game.resolve_round(GameChoice.ROCK, GameChoice.SCISSORS).name == "USER_WINS"
+
+    def test_colorama_una_sola_vez(self):
+        """Test: Crear muchos juegos de consola inicializa colorama sólo una vez."""
+        with patch.object(game_module, "_console_ready", False):
+            with patch.object(game_module, "init") as mock_init:
+                for _ in range(50):
+                    RockPaperScissorsGame()
+        mock_init.assert_called_once_with(autoreset=True)
+
+
+class TestGameObjectPool:
+    """Tests del reciclado de partidas."""
+
+    def test_reutiliza_partidas(self):
+        """Test: Una partida devuelta se entrega de nuevo reiniciada."""
+        pool = GameObjectPool()
+        first = pool.acquire(max_score=1)
+        first.resolve_round(GameChoice.PAPER, GameChoice.ROCK)
+        pool.release(first)
+
+        strategy = MixedStrategy([1, 0, 0, 0, 0])
+        second = pool.acquire(max_score=4, strategy=strategy)
+        assert second is first
+        assert (second.user_score, second.computer_score, second.rounds_played) == (0, 0, 0)
+        assert second.state == GameState.MENU
+        assert second.max_score == 4
+        assert second.strategy is strategy
+        assert pool.stats == (1, 1, 0)
+
+    def test_lease_devuelve_la_partida(self):
+        """Test: lease devuelve la partida al pool aunque el bloque falle."""
+        pool = GameObjectPool()
+        with pytest.raises(RuntimeError):
+            with pool.lease() as game:
+                raise RuntimeError("sesión cortada")
+        assert pool.stats.idle == 1
+        with pool.lease(strategy=UniformStrategy()) as again:
+            assert again is game
+
+    def test_suelta_la_estrategia(self):
+        """Test: Una partida libre no retiene la estrategia de su última sesión."""
+        pool = GameObjectPool()
+        strategy = MixedStrategy([0, 1, 0, 0, 0])
+        with pool.lease(strategy=strategy) as game:
+            pass
+        assert game.strategy is not strategy
+
+    def test_tamano_maximo(self):
+        """Test: Las partidas que no caben en el pool se descartan."""
+        pool = GameObjectPool(max_size=1)
+        games = [pool.acquire() for _ in range(3)]
+        for game in games:
+            pool.release(game)
+        assert pool.stats == (3, 0, 1)
+        with pytest.raises(ValueError):
+            GameObjectPool(max_size=-1)
+
+    def test_partidas_simuladas_sin_construir(self):
+        """Test: Mil sesiones seguidas usan una sola partida construida."""
+        pool = GameObjectPool()
+        user = UniformStrategy()
+        for _ in range(1000):
+            with pool.lease(max_score=2) as game:
+                play_match(game, user)
+        assert pool.stats.created == 1
+        assert pool.stats.reused == 999
+
+    def test_bytes_por_partida_viva(self):
+        """Test: Cada partida viva ocupa menos de 128 bytes."""
+        pool = GameObjectPool(max_size=0)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            games = [pool.acquire() for _ in range(10_000)]
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        per_game = (after - before) / len(games)
+        assert per_game < 128
@@ -0,0 +1,100 @@
+"""
+Tests para el pool de partidas en arreglos paralelos
+
+Valida que un paso vectorizado de `GamePool` aplica las mismas reglas que
+`RockPaperScissorsGame.resolve_round`, que las partidas terminadas quedan
+congeladas y que el estado ocupa unos pocos bytes por partida.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.game import RockPaperScissorsGame  # noqa: E402
+from src.game_enums import GameChoice, GameState  # noqa: E402
+from src.game_pool import GamePool  # noqa: E402
+
+CHOICES = GameChoice.get_all_choices()
+
+
+class TestGamePool:
+    """Tests del avance vectorizado de partidas."""
+
+    def test_mismas_reglas_que_el_juego(self):
+        """Test: Cada partida del pool sigue el mismo marcador que un juego real."""
+        rng = np.random.default_rng(3)
+        size, rounds = 50, 12
+        user = rng.integers(0, 5, size=(rounds, size), dtype=np.int8)
+        computer = rng.integers(0, 5, size=(rounds, size), dtype=np.int8)
+        pool = GamePool(size, max_score=4)
+        for step in range(rounds):
+            pool.step(user[step], computer[step])
+
+        for index in range(size):
+            game = RockPaperScissorsGame(max_score=4)
+            for step in range(rounds):
+                if game._check_game_over():
+                    break
+                game.resolve_round(CHOICES[user[step, index]], CHOICES[computer[step, index]])
+            expected = (game.user_score, game.computer_score, game.rounds_played)
+            assert tuple(pool.match(index)) == expected
+            expected_state = GameState.GAME_OVER if game._check_game_over() else GameState.PLAYING
+            assert pool.game_state(index) == expected_state
+
+    def test_partidas_terminadas_congeladas(self):
+        """Test: Una partida terminada no cambia en los pasos siguientes."""
+        pool = GamePool(2, max_score=[1, 3])
+        rock = np.array([0, 0], dtype=np.int8)
+        scissors = np.array([2, 2], dtype=np.int8)
+        assert pool.step(rock, scissors) == 1
+        assert pool.step(rock, scissors) == 1
+        assert tuple(pool.match(0)) == (1, 0, 1)
+        assert tuple(pool.match(1)) == (2, 0, 2)
+        assert pool.active.tolist() == [False, True]
+
+    def test_run_hasta_el_final(self):
+        """Test: run termina todas las partidas y cada una tiene un ganador."""
+        pool = GamePool(10_000, max_score=3, seed=1)
+        assert pool.run() == 0
+        assert pool.user_wins() + pool.computer_wins() == pool.size
+        assert abs(pool.user_wins() / pool.size - 0.5) < 0.03
+        assert (pool.rounds_played >= 3).all()
+
+    def test_run_con_tope_de_rondas(self):
+        """Test: Dos estrategias puras que siempre empatan se detienen en el tope."""
+        rock = [1, 0, 0, 0, 0]
+        pool = GamePool(5, user_weights=rock, computer_weights=rock)
+        assert pool.run(max_rounds=20) == 5
+        assert (pool.rounds_played == 20).all()
+
+    def test_estrategia_sesgada(self):
+        """Test: Papel siempre contra piedra siempre gana todas las partidas."""
+        pool = GamePool(100, user_weights=[0, 1, 0, 0, 0], computer_weights=[1, 0, 0, 0, 0], seed=2)
+        pool.run()
+        assert pool.user_wins() == 100
+        assert (pool.rounds_played == 3).all()
+
+    def test_reset_parcial(self):
+        """Test: reset con máscara reinicia sólo las partidas indicadas."""
+        pool = GamePool(4, max_score=1, seed=5)
+        pool.run()
+        mask = np.array([True, False, True, False])
+        pool.reset(mask)
+        assert pool.active.tolist() == [True, False, True, False]
+        assert pool.rounds_played[mask].tolist() == [0, 0]
+
+    def test_bytes_por_partida(self):
+        """Test: El estado de una partida ocupa menos de 16 bytes."""
+        pool = GamePool(1000)
+        assert pool.nbytes / pool.size < 16
+
+    def test_argumentos_invalidos(self):
+        """Test: Tamaños, puntuaciones o estrategias inválidas lanzan ValueError."""
+        with pytest.raises(ValueError):
+            GamePool(0)
+        with pytest.raises(ValueError):
+            GamePool(3, max_score=0)
+        with pytest.raises(ValueError):
+            GamePool(3, user_weights=[1, 1])
+        with pytest.raises(ValueError):
+            GamePool(3, computer_weights=[0, 0, 0, 0, 0])
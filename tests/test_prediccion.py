@@ -0,0 +1,115 @@
+"""
+Tests para la estrategia predictiva por n-gramas
+
+Valida el count-min sketch (memoria fija, sin subestimar) y que la estrategia
+aprende los patrones del usuario a través de RockPaperScissorsGame.
+"""
+
+import random
+
+import pytest
+from src.game import GameEngine, RockPaperScissorsGame
+from src.game_enums import GameChoice, GameResult
+from src.prediction import CountMinSketch, SketchPredictorStrategy
+from src.strategies import FiniteStateStrategy, available_strategies, create_strategy
+
+
+class TestCountMinSketch:
+    """Tests del count-min sketch."""
+
+    def test_nunca_subestima(self):
+        """Test: La estimación es siempre mayor o igual que la cuenta real."""
+        rng = random.Random(3)
+        sketch = CountMinSketch(width=32, depth=3, seed=1)
+        counts = {}
+        for _ in range(2000):
+            key = rng.randrange(500)
+            counts[key] = counts.get(key, 0) + 1
+            sketch.add(key)
+        assert all(sketch.estimate(key) >= count for key, count in counts.items())
+
+    def test_exacto_con_pocas_claves(self):
+        """Test: Con pocas claves y un sketch amplio las cuentas son exactas."""
+        sketch = CountMinSketch(seed=2)
+        for key, count in ((7, 3), (123456789, 5)):
+            for _ in range(count):
+                sketch.add(key)
+        assert sketch.estimate(7) == 3
+        assert sketch.estimate(123456789) == 5
+        assert sketch.estimate(8) == 0
+
+    def test_memoria_fija(self):
+        """Test: El sketch por defecto ocupa 2 KB sin importar lo que se cuente."""
+        sketch = CountMinSketch()
+        assert sketch.nbytes == 2048
+        for key in range(10_000):
+            sketch.add(key)
+        assert sketch.nbytes == 2048
+        sketch.clear()
+        assert sketch.estimate(5) == 0
+
+    def test_dimensiones_invalidas(self):
+        """Test: Ancho o profundidad no positivos lanzan ValueError."""
+        with pytest.raises(ValueError):
+            CountMinSketch(width=0)
+        with pytest.raises(ValueError):
+            CountMinSketch(depth=0)
+
+
+class TestSketchPredictorStrategy:
+    """Tests de la estrategia predictiva."""
+
+    def test_disponible_por_nombre(self):
+        """Test: La estrategia se crea por nombre desde el CLI."""
+        assert "prediccion" in available_strategies()
+        assert isinstance(create_strategy("prediccion").strategy, SketchPredictorStrategy)
+
+    def test_sin_historia_no_predice(self):
+        """Test: Sin contexto completo no hay predicción y elige al azar."""
+        strategy = SketchPredictorStrategy(order=3, rng=random.Random(1))
+        assert strategy.predict() is None
+        assert strategy.choose() in GameChoice
+
+    def test_aprende_un_ciclo_largo(self):
+        """Test: Contra un usuario que repite un ciclo, la computadora gana casi todas las rondas."""
+        cycle = [GameChoice.ROCK, GameChoice.ROCK, GameChoice.PAPER, GameChoice.SPOCK,
+                 GameChoice.LIZARD, GameChoice.ROCK, GameChoice.SCISSORS]
+        strategy = SketchPredictorStrategy(order=4, rng=random.Random(5))
+        game = RockPaperScissorsGame(max_score=10_000, strategy=strategy)
+        results = []
+        for round_number in range(700):
+            user_choice = cycle[round_number % len(cycle)]
+            results.append(game.resolve_round(user_choice, game.get_computer_choice()))
+        late = results[-100:]
+        assert late.count(GameResult.COMPUTER_WINS) == 100
+
+    def test_reset_conserva_lo_aprendido(self):
+        """Test: Al reiniciar la partida se conservan las cuentas y el contexto."""
+        strategy = SketchPredictorStrategy(order=2)
+        for choice in [GameChoice.ROCK, GameChoice.PAPER] * 5:
+            strategy.observe(choice, GameChoice.SPOCK)
+        assert strategy.predict() == GameChoice.ROCK
+        strategy.reset()
+        assert strategy.predict() == GameChoice.ROCK
+
+    def test_retrocede_a_contextos_cortos(self):
+        """Test: Sin cuentas para el contexto largo predice con el más corto que las tiene."""
+        strategy = SketchPredictorStrategy(order=6)
+        strategy.observe(GameChoice.SPOCK, GameChoice.ROCK)
+        assert strategy.predict() == GameChoice.SPOCK
+        for _ in range(3):
+            strategy.observe(GameChoice.LIZARD, GameChoice.ROCK)
+            strategy.observe(GameChoice.PAPER, GameChoice.ROCK)
+        # Contexto de orden 6 con una sola cuenta; tras Papel siempre vino Lagarto
+        assert strategy.predict() == GameChoice.LIZARD
+
+    def test_gana_partidas_cortas_a_un_ciclo(self):
+        """Test: Contra un ciclo Piedra-Papel-Tijeras gana casi todas las partidas a 3 puntos."""
+        # Máquina de tres estados: Piedra -> Papel -> Tijeras -> Piedra...
+        cycle = FiniteStateStrategy([0, 1, 2], [[1] * 5, [2] * 5, [0] * 5])
+        game = GameEngine(max_score=3, strategy=SketchPredictorStrategy(rng=random.Random(2)))
+        won = 0
+        for _ in range(50):
+            rounds = list(game.iter_rounds(cycle))
+            won += rounds[-1].computer_score == 3
+        assert won >= 45
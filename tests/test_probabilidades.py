@@ -0,0 +1,106 @@
+"""
+Tests para el cálculo exacto de la probabilidad de ganar la partida
+
+Valida las probabilidades de ronda derivadas de GameChoice.beats, la DP sobre
+los estados del marcador y su coincidencia con una simulación del juego.
+"""
+
+import random
+from fractions import Fraction
+
+import pytest
+from src.game import RockPaperScissorsGame
+from src.odds import (
+    CHOICES,
+    match_win_probability,
+    normalize_strategy,
+    round_probabilities,
+)
+
+
+class TestRoundProbabilities:
+    """Tests de las probabilidades de una ronda."""
+
+    def test_uniforme(self):
+        """Test: Con ambos uniformes, 2/5 victoria, 2/5 derrota y 1/5 empate."""
+        uniform = [Fraction(1)] * 5
+        assert round_probabilities(uniform, uniform) == (
+            Fraction(2, 5), Fraction(2, 5), Fraction(1, 5)
+        )
+
+    def test_estrategias_puras(self):
+        """Test: Papel contra Piedra gana siempre."""
+        paper = [0, 1, 0, 0, 0]
+        rock = [1, 0, 0, 0, 0]
+        assert round_probabilities(paper, rock) == (1, 0, 0)
+
+    def test_estrategia_invalida(self):
+        """Test: Estrategias mal formadas lanzan ValueError."""
+        with pytest.raises(ValueError):
+            normalize_strategy([1, 1, 1])
+        with pytest.raises(ValueError):
+            normalize_strategy([1, -1, 1, 1, 1])
+        with pytest.raises(ValueError):
+            normalize_strategy([0, 0, 0, 0, 0])
+
+
+class TestMatchWinProbability:
+    """Tests de la probabilidad de ganar la partida."""
+
+    def test_simetria_uniforme(self):
+        """Test: Con estrategias uniformes y marcador parejo, 50% cada lado."""
+        for max_score in range(1, 11):
+            odds = match_win_probability(max_score)
+            assert odds.user == pytest.approx(0.5)
+            assert odds.user + odds.computer == pytest.approx(1.0)
+
+    def test_formula_cerrada_a_dos_puntos(self):
+        """Test: A 2 puntos P = r²(3 - 2r), con r la probabilidad de ganar una ronda decidida."""
+        # Papel y Spock vencen a Piedra: el usuario gana más rondas decididas
+        user = [Fraction(1), Fraction(2), Fraction(1), Fraction(1), Fraction(2)]
+        computer = [Fraction(3), Fraction(1), Fraction(1), Fraction(1), Fraction(1)]
+        probabilities = round_probabilities(user, computer)
+        r = probabilities.user_wins / (probabilities.user_wins + probabilities.computer_wins)
+
+        odds = match_win_probability(2, user_strategy=user, computer_strategy=computer)
+        assert odds.user == r * r * (3 - 2 * r)
+        assert odds.user + odds.computer == 1
+
+    def test_estados_terminales(self):
+        """Test: Con el marcador ya decidido la probabilidad es 0 o 1."""
+        assert match_win_probability(3, 3, 1) == (1, 0)
+        assert match_win_probability(3, 0, 3) == (0, 1)
+
+    def test_partida_sin_fin(self):
+        """Test: Si todas las rondas empatan nadie puede ganar."""
+        rock = [1, 0, 0, 0, 0]
+        assert match_win_probability(3, user_strategy=rock, computer_strategy=rock) == (0, 0)
+
+    def test_marcador_invalido(self):
+        """Test: Marcadores fuera de rango lanzan ValueError."""
+        with pytest.raises(ValueError):
+            match_win_probability(0)
+        with pytest.raises(ValueError):
+            match_win_probability(3, 4, 0)
+        with pytest.raises(ValueError):
+            match_win_probability(3, 3, 3)
+
+    def test_coincide_con_simulacion(self):
+        """Test: La DP coincide con partidas simuladas usando compare_choices."""
+        rng = random.Random(2024)
+        user = [1, 2, 1, 1, 2]
+        computer = [4, 1, 1, 1, 1]
+        game = RockPaperScissorsGame(max_score=3)
+        matches = 4000
+        user_wins = 0
+        for _ in range(matches):
+            game.user_score, game.computer_score = 1, 0
+            while not game._check_game_over():
+                result = game.compare_choices(
+                    rng.choices(CHOICES, user)[0], rng.choices(CHOICES, computer)[0]
+                )
+                game._update_score(result)
+            user_wins += game.user_score >= game.max_score
+
+        expected = match_win_probability(3, 1, 0, user, computer).user
+        assert user_wins / matches == pytest.approx(expected, abs=0.03)
@@ -0,0 +1,199 @@
+"""
+Tests para los puntos de control de las simulaciones largas
+
+Valida que una simulación por lotes o un battle royale interrumpidos se
+reanudan desde su punto de control con el mismo resultado que una ejecución
+sin interrupciones, y que no se reanuda el punto de control de otra simulación.
+"""
+
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+from src import batch
+from src.batch import SimulationCheckpoint, SimulationExecutor, SimulationJob
+from src.main import main
+
+
+def interrupting_run_chunk(after):
+    """Versión de `run_chunk` que simula un Ctrl-C tras `after` bloques."""
+    calls = {"count": 0}
+    original = batch.run_chunk
+
+    def run(job, index):
+        if calls["count"] >= after:
+            raise KeyboardInterrupt
+        calls["count"] += 1
+        return original(job, index)
+
+    return run
+
+
+class TestSimulationCheckpoint:
+    """Tests de los puntos de control de las simulaciones por lotes."""
+
+    def test_reanudar_da_el_mismo_resultado(self, tmp_path):
+        """Test: Una simulación interrumpida y reanudada coincide con la completa."""
+        job = SimulationJob(1000, chunk_size=50, seed=11)
+        path = str(tmp_path / "simulacion.json")
+        executor = SimulationExecutor(jobs=1)
+
+        with patch.object(batch, "run_chunk", interrupting_run_chunk(7)):
+            with pytest.raises(KeyboardInterrupt):
+                executor.run(job, checkpoint_path=path, checkpoint_every=3)
+
+        checkpoint = SimulationCheckpoint.load(path, job)
+        assert checkpoint.completed == 7
+        assert checkpoint.summary.matches == 350
+        assert checkpoint.elapsed > 0
+
+        assert executor.run(job, checkpoint_path=path) == executor.run(job)
+        assert not os.path.exists(path)
+
+    def test_reanudar_con_varios_trabajadores(self, tmp_path):
+        """Test: El punto de control no depende del número de trabajadores."""
+        job = SimulationJob(600, chunk_size=50, seed=2)
+        path = str(tmp_path / "simulacion.json")
+        checkpoint = SimulationCheckpoint(job)
+        for index in range(0, job.chunk_count, 2):
+            checkpoint.record(index, batch.run_chunk(job, index))
+        checkpoint.save(path)
+
+        resumed = SimulationExecutor(jobs=3, backend="threads").run(job, checkpoint_path=path)
+        assert resumed == SimulationExecutor(jobs=1).run(job)
+        assert not os.path.exists(path)
+
+    def test_registrar_dos_veces_no_duplica(self):
+        """Test: Un bloque repetido sólo se suma una vez."""
+        job = SimulationJob(100, chunk_size=50)
+        checkpoint = SimulationCheckpoint(job)
+        summary = batch.run_chunk(job, 0)
+        checkpoint.record(0, summary)
+        checkpoint.record(0, summary)
+        assert checkpoint.summary.matches == 50
+        assert list(checkpoint.pending()) == [1]
+
+    def test_rechaza_otra_simulacion(self, tmp_path):
+        """Test: No se reanuda el punto de control de una simulación distinta."""
+        path = str(tmp_path / "simulacion.json")
+        SimulationCheckpoint(SimulationJob(100, seed=1)).save(path)
+        with pytest.raises(ValueError, match="otra simulación"):
+            SimulationExecutor(jobs=1).run(SimulationJob(100, seed=2), checkpoint_path=path)
+
+    def test_rechaza_version_desconocida(self, tmp_path):
+        """Test: Una versión de formato desconocida da un error claro."""
+        path = tmp_path / "simulacion.json"
+        SimulationCheckpoint(SimulationJob(100)).save(str(path))
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["version"] = 99
+        path.write_text(json.dumps(data), encoding="utf-8")
+        with pytest.raises(ValueError, match="Versión"):
+            SimulationCheckpoint.load(str(path))
+
+
+class TestBattleRoyaleCheckpoint:
+    """Tests de los puntos de control del battle royale."""
+
+    def test_reanudar_da_el_mismo_campeon(self, tmp_path):
+        """Test: Un torneo interrumpido y reanudado termina igual que uno completo."""
+        pytest.importorskip("numpy")
+        from src.battle_royale import BattleRoyale
+
+        path = str(tmp_path / "torneo.npz")
+        expected = BattleRoyale(5000, seed=8).run()
+
+        interrupted = BattleRoyale(5000, seed=8)
+        original = interrupted.play_round
+        calls = {"count": 0}
+
+        def play_round(alive):
+            if calls["count"] == 4:
+                raise KeyboardInterrupt
+            calls["count"] += 1
+            return original(alive)
+
+        with patch.object(interrupted, "play_round", play_round):
+            with pytest.raises(KeyboardInterrupt):
+                interrupted.run(checkpoint_path=path)
+
+        resumed = BattleRoyale(5000, seed=8).run(checkpoint_path=path)
+        assert resumed.champion == expected.champion
+        assert resumed.rounds == expected.rounds
+        assert resumed.throws == expected.throws
+        assert not os.path.exists(path)
+
+    def test_sin_semilla_usa_la_guardada(self, tmp_path):
+        """Test: Sin semilla se reanuda el torneo guardado."""
+        np = pytest.importorskip("numpy")
+        from src.battle_royale import BattleRoyale
+
+        path = str(tmp_path / "torneo.npz")
+        BattleRoyale(64, seed=3).save_checkpoint(path, np.arange(64), 0, 0, 0.0)
+        resumed = BattleRoyale(64).run(checkpoint_path=path)
+        expected = BattleRoyale(64, seed=3).run()
+        assert (resumed.champion, resumed.rounds, resumed.throws) == (
+            expected.champion, expected.rounds, expected.throws)
+
+    @pytest.mark.parametrize("other", [
+        {"num_players": 128, "seed": 1},
+        {"num_players": 64, "seed": 2},
+        {"num_players": 64, "seed": 1, "strategies": [[1, 1, 1, 0, 0]]},
+    ])
+    def test_rechaza_otro_torneo(self, tmp_path, other):
+        """Test: No se reanuda un torneo de otro tamaño, semilla o estrategias."""
+        np = pytest.importorskip("numpy")
+        from src.battle_royale import BattleRoyale
+
+        path = str(tmp_path / "torneo.npz")
+        BattleRoyale(64, seed=1).save_checkpoint(path, np.arange(64), 0, 0, 0.0)
+        with pytest.raises(ValueError, match="es de un torneo"):
+            BattleRoyale(**other).run(checkpoint_path=path)
+
+
+class TestCheckpointCli:
+    """Tests de --checkpoint en el CLI."""
+
+    def run_cli(self, capsys, *arguments):
+        with patch.object(sys, "argv", ["main", *arguments]):
+            code = main()
+        return code, capsys.readouterr().out
+
+    def test_aviso_solo_si_se_guarda(self, tmp_path, capsys):
+        """Test: Al interrumpir sólo se anuncia el guardado en los modos que lo hacen."""
+        path = str(tmp_path / "simulacion.json")
+        with patch("src.main.run_game", side_effect=KeyboardInterrupt):
+            code, output = self.run_cli(capsys, "--checkpoint", path)
+        assert code == 0
+        assert "Progreso guardado" not in output
+
+        with patch.object(SimulationExecutor, "run", side_effect=KeyboardInterrupt):
+            code, output = self.run_cli(capsys, "--simulate", "100", "--seed", "1", "--checkpoint", path)
+        assert code == 0
+        assert "Progreso guardado" in output
+
+    def test_reanudar_sin_semilla(self, tmp_path, capsys):
+        """Test: Sin --seed se reanuda con la semilla del punto de control."""
+        path = str(tmp_path / "simulacion.json")
+        with patch.object(batch, "run_chunk", interrupting_run_chunk(1)):
+            code, _ = self.run_cli(capsys, "--simulate", "2000", "--jobs", "1", "--checkpoint", path)
+        assert code == 0
+        seed = SimulationCheckpoint.load(path).job.seed
+
+        code, output = self.run_cli(capsys, "--simulate", "2000", "--jobs", "1", "--checkpoint", path)
+        assert code == 0
+        report = json.loads(output)
+        assert report["seed"] == seed
+        assert report["user_wins"] == SimulationExecutor(jobs=1).run(SimulationJob(2000, seed=seed)).user_wins
+
+    def test_rendimiento_con_el_tiempo_acumulado(self, tmp_path, capsys):
+        """Test: El informe de una simulación reanudada cuenta el tiempo ya jugado."""
+        path = str(tmp_path / "simulacion.json")
+        SimulationCheckpoint(SimulationJob(200, seed=4), elapsed=1000.0).save(path)
+        code, output = self.run_cli(capsys, "--simulate", "200", "--jobs", "1", "--checkpoint", path)
+        assert code == 0
+        report = json.loads(output)
+        assert report["elapsed"] >= 1000.0
+        assert report["matches_per_second"] < 1
+        assert not os.path.exists(path)
@@ -0,0 +1,60 @@
+"""
+Tests para los resultados de simulación en memoria compartida
+
+Valida que los trabajadores escriben cada partida en el bloque compartido,
+que los agregados coinciden con los de `run_chunk` y que el bloque se libera.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from multiprocessing import shared_memory  # noqa: E402
+
+from src.batch import SimulationExecutor, SimulationJob, run_chunk  # noqa: E402
+from src.shared_results import SharedResults, shared_size  # noqa: E402
+
+JOB = SimulationJob(1500, chunk_size=200, seed=3, computer_strategy="clasica")
+
+
+class TestSharedResults:
+    """Tests del bloque compartido de resultados."""
+
+    def test_tamano_del_bloque(self):
+        """Test: El bloque guarda 8 bytes por partida más las parejas de cada bloque."""
+        assert shared_size(JOB) == JOB.matches * 8 + JOB.chunk_count * 25 * 8
+
+    def test_bloque_igual_que_run_chunk(self):
+        """Test: Escribir un bloque en memoria compartida da los agregados de run_chunk."""
+        with SharedResults.create(JOB) as results:
+            results.fill_chunk(2)
+            completed = np.zeros(JOB.chunk_count, dtype=bool)
+            completed[2] = True
+            assert results.summary(completed) == run_chunk(JOB, 2)
+
+    @pytest.mark.parametrize("backend", ["threads", "processes"])
+    def test_trabajadores_escriben_en_el_bloque(self, backend):
+        """Test: Hilos y procesos llenan el bloque con el mismo resultado que la simulación en serie."""
+        expected = SimulationExecutor(jobs=1).run(JOB)
+        with SimulationExecutor(jobs=3, backend=backend).run_shared(JOB) as results:
+            assert results.summary() == expected
+            assert (results.rounds > 0).all()
+            winners = np.maximum(results.user_score, results.computer_score)
+            assert (winners == JOB.max_score).all()
+
+    def test_agregados_sin_copias(self):
+        """Test: Los arreglos son vistas del bloque compartido, no copias."""
+        with SharedResults.create(JOB) as results:
+            assert not results.rounds.flags.owndata
+            other = SharedResults.attach(results.name, JOB)
+            other.rounds[0] = 17
+            other.close()
+            assert results.rounds[0] == 17
+
+    def test_libera_el_bloque(self):
+        """Test: Al cerrar, el dueño libera el bloque compartido."""
+        results = SharedResults.create(JOB)
+        name = results.name
+        results.close()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
@@ -0,0 +1,117 @@
+"""
+Tests para las partidas sin interfaz
+
+Valida `RockPaperScissorsGame.resolve_round`, las partidas completas de
+`simulation.play_match` entre dos estrategias y los generadores perezosos
+`iter_rounds` e `iter_matches`.
+"""
+
+import itertools
+import random
+from unittest.mock import MagicMock, patch
+
+import pytest
+from src.batch import SimulationExecutor, SimulationJob, iter_job_matches
+from src.game import GameEngine, RockPaperScissorsGame, RoundRecord
+from src.game_enums import GameChoice, GameResult
+from src.simulation import play_match
+from src.strategies import MixedStrategy, UniformStrategy
+
+
+class TestResolveRound:
+    """Tests de la resolución de rondas sin consola."""
+
+    def test_actualiza_marcador_sin_imprimir(self):
+        """Test: resolve_round suma el punto, cuenta la ronda y no imprime nada."""
+        game = RockPaperScissorsGame()
+        with patch("builtins.print") as mock_print:
+            result = game.resolve_round(GameChoice.ROCK, GameChoice.SCISSORS)
+        assert result == GameResult.USER_WINS
+        assert (game.user_score, game.computer_score, game.rounds_played) == (1, 0, 1)
+        mock_print.assert_not_called()
+
+    def test_avisa_a_la_estrategia(self):
+        """Test: La estrategia de la computadora observa las elecciones de la ronda."""
+        strategy = MagicMock()
+        game = RockPaperScissorsGame(strategy=strategy)
+        game.resolve_round(GameChoice.LIZARD, GameChoice.SPOCK)
+        strategy.observe.assert_called_once_with(GameChoice.LIZARD, GameChoice.SPOCK)
+
+
+class TestPlayMatch:
+    """Tests de las partidas completas sin interfaz."""
+
+    def test_partida_termina_con_ganador(self):
+        """Test: La partida acaba cuando un lado llega a la puntuación máxima."""
+        rng = random.Random(7)
+        game = RockPaperScissorsGame(max_score=3, strategy=MixedStrategy([1] * 5, rng=rng))
+        result = play_match(game, MixedStrategy([1] * 5, rng=rng))
+        assert max(result.user_score, result.computer_score) == 3
+        assert result.user_won != result.computer_won
+        assert result.rounds >= 3
+
+    def test_reinicia_el_juego(self):
+        """Test: Cada partida empieza desde 0-0 aunque el juego venga usado."""
+        game = RockPaperScissorsGame(max_score=1, strategy=MixedStrategy([0, 0, 0, 0, 1]))
+        game.user_score, game.computer_score = 5, 5
+        result = play_match(game, MixedStrategy([1, 0, 0, 0, 0]))
+        assert result == (0, 1, 1)
+        assert result.computer_won
+
+    def test_empates_eternos_se_cortan(self):
+        """Test: Dos estrategias que siempre empatan se cortan en max_rounds."""
+        game = RockPaperScissorsGame(strategy=MixedStrategy([1, 0, 0, 0, 0]))
+        result = play_match(game, MixedStrategy([1, 0, 0, 0, 0]), max_rounds=50)
+        assert result == (0, 0, 50)
+        assert not result.user_won and not result.computer_won
+
+
+class TestGenerators:
+    """Tests de los generadores perezosos de rondas y partidas."""
+
+    def test_rondas_inmutables_con_marcador(self):
+        """Test: iter_rounds entrega cada ronda con el marcador acumulado."""
+        rng = random.Random(3)
+        game = GameEngine(max_score=2, strategy=MixedStrategy([1] * 5, rng=rng))
+        rounds = list(game.iter_rounds(MixedStrategy([1] * 5, rng=rng)))
+        assert [record.round for record in rounds] == list(range(1, len(rounds) + 1))
+        last = rounds[-1]
+        assert max(last.user_score, last.computer_score) == 2
+        assert sum(record.result == GameResult.USER_WINS for record in rounds) == last.user_score
+        with pytest.raises(AttributeError):
+            last.user_score = 0
+
+    def test_rondas_bajo_demanda(self):
+        """Test: El generador sólo juega las rondas que se piden."""
+        game = GameEngine(strategy=MixedStrategy([1, 0, 0, 0, 0]))
+        first = list(itertools.islice(game.iter_rounds(MixedStrategy([1, 0, 0, 0, 0])), 3))
+        assert len(first) == 3
+        assert game.rounds_played == 3
+        assert first[0] == RoundRecord(1, GameChoice.ROCK, GameChoice.ROCK, GameResult.TIE, 0, 0)
+
+    def test_partidas_iguales_a_play_match(self):
+        """Test: iter_matches da las mismas partidas que play_match en bucle."""
+        def players(seed):
+            rng = random.Random(seed)
+            return GameEngine(strategy=MixedStrategy([1] * 5, rng=rng)), MixedStrategy([2, 1, 1, 1, 1], rng=rng)
+
+        game, user = players(9)
+        expected = [play_match(game, user) for _ in range(200)]
+        game, user = players(9)
+        assert list(game.iter_matches(user, 200)) == expected
+
+    def test_partidas_sin_fin(self):
+        """Test: Sin número de partidas, el generador sigue hasta que se corta."""
+        game = GameEngine(max_score=1)
+        matches = game.iter_matches(UniformStrategy())
+        assert len(list(itertools.islice(matches, 50))) == 50
+
+    def test_simulacion_en_flujo(self):
+        """Test: iter_job_matches da los mismos agregados que el ejecutor."""
+        job = SimulationJob(250, chunk_size=60, seed=4)
+        summary = SimulationExecutor(jobs=1).run(job)
+        user_wins = rounds = 0
+        for match in iter_job_matches(job):
+            user_wins += match.user_won
+            rounds += match.rounds
+        assert (user_wins, rounds) == (summary.user_wins, summary.rounds)
@@ -0,0 +1,126 @@
+"""
+Tests para la tabla precalculada de probabilidades y su visualización en vivo
+
+Valida el formato del archivo, que las consultas mapeadas en memoria coinciden
+con el cálculo exacto y que play_round muestra la probabilidad de ganar.
+"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+from src.game_enums import GameChoice
+from src.game import RockPaperScissorsGame
+from src.main import main
+from src.odds import match_win_probability
+from src.odds_table import OddsTable, best_response, build_odds_table
+from src.strategies import BUILTIN_STRATEGIES, create_strategy
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory):
+    """Tabla generada una vez para todo el módulo."""
+    path = tmp_path_factory.mktemp("odds") / "odds.bin"
+    build_odds_table(str(path))
+    return path
+
+
+class TestOddsTable:
+    """Tests del archivo de probabilidades."""
+
+    def test_mejor_respuesta(self):
+        """Test: Contra una computadora que abusa de Piedra conviene Papel o Spock."""
+        response = best_response(BUILTIN_STRATEGIES["piedra"])
+        assert response.index(1.0) in (1, 4)
+
+    def test_consultas_coinciden_con_dp(self, table_path):
+        """Test: Cada estado de la tabla coincide con match_win_probability."""
+        with OddsTable(str(table_path)) as table:
+            assert set(table.strategies) == set(BUILTIN_STRATEGIES)
+            for name, weights in BUILTIN_STRATEGIES.items():
+                user = best_response(weights)
+                for max_score in (1, 3, 10):
+                    for user_score in range(max_score):
+                        for computer_score in range(max_score):
+                            expected = match_win_probability(
+                                max_score, user_score, computer_score, user, weights
+                            ).user
+                            actual = table.lookup(name, max_score, user_score, computer_score)
+                            assert actual == pytest.approx(expected)
+
+    def test_estados_fuera_de_tabla(self, table_path):
+        """Test: Los marcadores fuera de la tabla devuelven None."""
+        with OddsTable(str(table_path)) as table:
+            assert table.lookup("aleatoria", 11, 0, 0) is None
+            assert table.lookup("aleatoria", 3, 3, 0) is None
+            assert table.covers("aleatoria", 10)
+            assert not table.covers("aleatoria", 11)
+
+    def test_estrategia_desconocida(self, table_path):
+        """Test: Una estrategia que no está en la tabla lanza KeyError."""
+        with OddsTable(str(table_path)) as table:
+            assert not table.covers("desconocida", 3)
+            with pytest.raises(KeyError, match="desconocida"):
+                table.lookup("desconocida", 3, 0, 0)
+
+    def test_archivo_invalido(self, tmp_path):
+        """Test: Un archivo con otro formato lanza ValueError."""
+        path = tmp_path / "otro.bin"
+        path.write_bytes(b"no es una tabla" * 4)
+        with pytest.raises(ValueError):
+            OddsTable(str(path))
+
+    def test_archivo_truncado(self, tmp_path, table_path):
+        """Test: Un archivo truncado lanza ValueError."""
+        path = tmp_path / "truncado.bin"
+        path.write_bytes(table_path.read_bytes()[:-8])
+        with pytest.raises(ValueError):
+            OddsTable(str(path))
+
+
+class TestLiveOdds:
+    """Tests de la probabilidad en vivo durante play_round."""
+
+    def test_play_round_muestra_probabilidad(self, table_path):
+        """Test: Con tabla, cada ronda muestra la probabilidad de ganar."""
+        with OddsTable(str(table_path)) as table:
+            game = RockPaperScissorsGame(
+                max_score=3, strategy=create_strategy("piedra"), odds_table=table
+            )
+            expected = table.lookup("piedra", 3, 0, 0)
+            with patch('builtins.input', return_value='2'):
+                with patch.object(game.strategy, 'choose', return_value=GameChoice.ROCK):
+                    with patch('builtins.print') as mock_print:
+                        game.play_round()
+
+        printed = [str(call.args[0]) for call in mock_print.call_args_list if call.args]
+        odds_lines = [line for line in printed if f"{expected:.1%}" in line]
+        assert odds_lines and "mejor respuesta" in odds_lines[0]
+
+    def test_sin_tabla_no_muestra_probabilidad(self):
+        """Test: Sin tabla no se imprime ninguna probabilidad."""
+        game = RockPaperScissorsGame()
+        with patch('builtins.input', return_value='1'):
+            with patch('builtins.print') as mock_print:
+                game.play_round()
+        printed = [str(call.args[0]) for call in mock_print.call_args_list if call.args]
+        assert not any("Probabilidad" in line for line in printed)
+
+    def test_estrategia_fuera_de_tabla_se_rechaza(self, table_path):
+        """Test: Una estrategia sin probabilidades no se acepta en silencio."""
+        with OddsTable(str(table_path)) as table:
+            with pytest.raises(ValueError, match="no incluye"):
+                RockPaperScissorsGame(strategy=create_strategy("mia", profiles={"mia": (1, 1, 1, 1, 1)}),
+                                      odds_table=table)
+
+    def test_cli_avisa_sin_probabilidades(self, tmp_path):
+        """Test: La CLI avisa y juega sin tabla si no cubre la estrategia y la puntuación."""
+        path = tmp_path / "odds.bin"
+        build_odds_table(str(path), max_score=2)
+        argv = ["main", "--strategy", "piedra", "--score", "3", "--odds-table", str(path)]
+        with patch.object(sys, 'argv', argv), patch('src.main.run_game', return_value=0) as run_game:
+            with patch('builtins.print') as mock_print:
+                assert main() == 0
+        printed = " ".join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+        assert "no se mostrará la probabilidad" in printed
+        assert run_game.call_args.args[0].odds_table is None
@@ -0,0 +1,66 @@
+"""
+Tests para la exportación de trazas Chrome trace-event / Perfetto
+
+Valida que los spans se registran para los métodos trazados, que el volcado
+por lotes produce un JSON válido y que el juego recupera sus métodos.
+"""
+
+import json
+from unittest.mock import patch
+
+from src.game_enums import GameChoice
+from src.game import RockPaperScissorsGame
+from src.tracing import TRACED_METHODS, ChromeTracer
+
+
+class TestChromeTracer:
+    """Tests del tracer de partidas."""
+
+    def test_partida_trazada(self, tmp_path):
+        """Test: Una partida completa genera spans de todas las categorías."""
+        path = tmp_path / "partida.json"
+        game = RockPaperScissorsGame(max_score=1)
+
+        with ChromeTracer(str(path), batch_size=2) as tracer:
+            tracer.attach(game)
+            with patch('builtins.input', return_value='1'):
+                with patch('random.choice', return_value=GameChoice.SCISSORS):
+                    with patch('builtins.print'):
+                        game.run()
+            tracer.detach(game)
+
+        events = json.loads(path.read_text(encoding="utf-8"))
+        names = {event["name"] for event in events}
+        assert names == set(TRACED_METHODS)
+        assert {event["cat"] for event in events} == {"engine", "human", "terminal"}
+        for event in events:
+            assert event["ph"] == "X"
+            assert event["dur"] >= 0
+
+        run = next(event for event in events if event["name"] == "run")
+        for event in events:
+            assert run["ts"] <= event["ts"]
+        assert 'run' not in vars(game)
+
+    def test_volcado_por_lotes(self, tmp_path):
+        """Test: Los eventos se escriben al alcanzar el tamaño de lote."""
+        path = tmp_path / "lotes.json"
+        tracer = ChromeTracer(str(path), batch_size=3)
+
+        for index in range(2):
+            tracer.add_span("span", "engine", index, index + 1)
+        assert not path.exists()
+
+        tracer.add_span("span", "engine", 2, 3)
+        assert path.exists()
+
+        tracer.add_span("span", "engine", 3, 4)
+        tracer.close()
+        tracer.close()
+        assert len(json.loads(path.read_text(encoding="utf-8"))) == 4
+
+    def test_traza_vacia_es_json_valido(self, tmp_path):
+        """Test: Cerrar sin eventos deja un arreglo vacío."""
+        path = tmp_path / "vacia.json"
+        ChromeTracer(str(path)).close()
+        assert json.loads(path.read_text(encoding="utf-8")) == []